@@ -4,7 +4,7 @@ CLI bridge for Node.js ↔ DocStore.
 
 Usage:
     python3 bridge.py search <db_path> <query> [--slug X] [--doc-type X] [--limit N]
-    python3 bridge.py update <db_path> [--slug X]
+    python3 bridge.py update <db_path> [--slug X] [--force] [--workers N]
     python3 bridge.py stats <db_path>
 
 Output: JSON to stdout.
@@ -20,11 +20,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 from docindex import (
     connect,
     search_rows,
-    iter_candidate_files,
-    extract_document,
-    upsert_document,
-    delete_stale_documents,
+    run_update,
     now_iso,
+    DEFAULT_WORKERS,
 )
 
 
@@ -62,28 +60,22 @@ def main():
 
         elif command == "update":
             slug_filter = None
-            if len(sys.argv) > 3 and sys.argv[3] == "--slug" and len(sys.argv) > 4:
-                slug_filter = sys.argv[4]
-            inserted = updated = unchanged = skipped = 0
-            live_paths = set()
-            for file in iter_candidate_files(slug_filter=slug_filter):
-                live_paths.add(str(file.path))
-                try:
-                    extracted = extract_document(file)
-                except Exception:
-                    skipped += 1
-                    continue
-                if not extracted.text.strip():
-                    skipped += 1
-                    continue
-                status, _ = upsert_document(conn, file, extracted.text, extracted.title_hint)
-                if status == "inserted":
-                    inserted += 1
-                elif status == "updated":
-                    updated += 1
+            force = False
+            workers = DEFAULT_WORKERS
+            i = 3
+            while i < len(sys.argv):
+                if sys.argv[i] == "--slug" and i + 1 < len(sys.argv):
+                    slug_filter = sys.argv[i + 1]
+                    i += 2
+                elif sys.argv[i] == "--workers" and i + 1 < len(sys.argv):
+                    workers = int(sys.argv[i + 1])
+                    i += 2
+                elif sys.argv[i] == "--force":
+                    force = True
+                    i += 1
                 else:
-                    unchanged += 1
-            deleted = delete_stale_documents(conn, live_paths, slug_filter=slug_filter)
+                    i += 1
+            stats = run_update(conn, slug_filter=slug_filter, force=force, workers=workers)
             conn.execute(
                 "INSERT INTO index_meta(key, value) VALUES('last_updated_at', ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
                 (now_iso(),),
@@ -93,8 +85,9 @@ def main():
             chunks = conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
             print(json.dumps({
                 "documents": docs, "chunks": chunks,
-                "inserted": inserted, "updated": updated,
-                "unchanged": unchanged, "deleted": deleted, "skipped": skipped,
+                "inserted": stats.inserted, "updated": stats.updated,
+                "unchanged": stats.unchanged, "deleted": stats.deleted,
+                "skipped": stats.skipped_empty + stats.skipped_extract,
             }))
 
         elif command == "stats":
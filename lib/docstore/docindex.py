@@ -5,12 +5,17 @@ import argparse
 import hashlib
 import json
 import logging
+import multiprocessing
 import re
 import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 try:
     import docx  # type: ignore
@@ -22,6 +27,13 @@ try:
 except Exception:  # pragma: no cover
     pdfplumber = None
 
+try:
+    from watchdog.events import FileSystemEventHandler  # type: ignore
+    from watchdog.observers import Observer  # type: ignore
+except Exception:  # pragma: no cover
+    FileSystemEventHandler = object  # type: ignore
+    Observer = None
+
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
 logging.getLogger("pdfplumber").setLevel(logging.ERROR)
 
@@ -43,6 +55,24 @@ DOC_ROOT = Path(_doc_root) if _doc_root else None
 
 _doc_index_db = _os.environ.get("DOC_INDEX_DB", "")
 DEFAULT_DB_PATH = Path(_doc_index_db) if _doc_index_db else None
+# Extraction pool size for `update` (pdfplumber / python-docx are CPU-bound).
+_doc_index_workers = _os.environ.get("DOC_INDEX_WORKERS", "")
+DEFAULT_WORKERS = int(_doc_index_workers) if _doc_index_workers else min(8, _os.cpu_count() or 1)
+# Extracted-but-unwritten documents allowed in flight per worker (back-pressure).
+PENDING_PER_WORKER = 4
+# Documents written per transaction by the single writer.
+WRITE_BATCH_DOCS = 64
+# Extraction cache: PDF/DOCX text keyed by raw-bytes sha256 + extractor
+# version, zlib-compressed in extract_cache, LRU-evicted past this size.
+_extract_cache_mb = _os.environ.get("DOC_EXTRACT_CACHE_MB", "")
+EXTRACT_CACHE_MAX_BYTES = int(float(_extract_cache_mb or "256") * 1024 * 1024)
+EXTRACT_CACHE_SUFFIXES = {".pdf", ".docx"}
+# Bump when extract_*_text() / normalize_text() output changes.
+EXTRACTOR_VERSION = 1
+# `watch`: quiet period before a burst of events is applied, and the
+# rescan interval when watchdog is unavailable.
+WATCH_DEBOUNCE_SECONDS = 2.0
+WATCH_POLL_SECONDS = 30.0
 MAX_CHUNK_CHARS = 1200
 MIN_CHUNK_CHARS = 300
 OVERLAP_CHARS = 180
@@ -146,6 +176,7 @@ CREATE TABLE IF NOT EXISTS chunks (
     title TEXT NOT NULL,
     section TEXT NOT NULL,
     content TEXT NOT NULL,
+    content_sha TEXT NOT NULL DEFAULT '',
     UNIQUE(doc_id, chunk_index)
 );
 
@@ -159,6 +190,16 @@ CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
     tokenize = 'trigram'
 );
 
+CREATE TABLE IF NOT EXISTS extract_cache (
+    raw_sha256 TEXT NOT NULL,
+    extractor_version TEXT NOT NULL,
+    text_z BLOB NOT NULL,
+    title_hint TEXT,
+    stored_bytes INTEGER NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY(raw_sha256, extractor_version)
+) WITHOUT ROWID;
+
 CREATE TABLE IF NOT EXISTS index_meta (
     key TEXT PRIMARY KEY,
     value TEXT NOT NULL
@@ -167,6 +208,7 @@ CREATE TABLE IF NOT EXISTS index_meta (
 CREATE INDEX IF NOT EXISTS idx_documents_slug_doc_type ON documents(slug, doc_type);
 CREATE INDEX IF NOT EXISTS idx_chunks_doc_id ON chunks(doc_id);
 CREATE INDEX IF NOT EXISTS idx_chunks_slug_doc_type ON chunks(slug, doc_type);
+CREATE INDEX IF NOT EXISTS idx_extract_cache_lru ON extract_cache(last_used_at);
 """
 
 
@@ -184,6 +226,30 @@ class ExtractedDocument:
     title_hint: str
 
 
+@dataclass(frozen=True)
+class ExtractionResult:
+    file: CandidateFile
+    document: ExtractedDocument | None  # None when extraction raised
+    chunks: list[tuple[str, str]]
+    mtime_ns: int
+    size_bytes: int
+    cache_key: tuple[str, str] | None = None  # (raw_sha256, extractor_version)
+    cache_hit: bool = False
+
+
+@dataclass
+class UpdateStats:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped_stat: int = 0
+    skipped_empty: int = 0
+    skipped_extract: int = 0
+    deleted: int = 0
+    chunk_writes: int = 0
+    cache_hits: int = 0
+
+
 def now_iso() -> str:
     return datetime.now().astimezone().isoformat(timespec="seconds")
 
@@ -192,6 +258,10 @@ def sha256_text(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+def chunk_sha(section: str, content: str) -> str:
+    return sha256_text(f"{section}\0{content}")
+
+
 def normalize_text(text: str) -> str:
     text = text.replace("\u0000", "")
     text = text.replace("\r\n", "\n").replace("\r", "\n")
@@ -300,23 +370,48 @@ def should_index_wide(path: Path) -> bool:
     return suffix in ALLOWED_SUFFIXES
 
 
+def candidate_for_path(
+    path: Path,
+    dir_to_slug: dict[str, str],
+    slug_filter: str | None = None,
+) -> CandidateFile | None:
+    """The CandidateFile for one existing file, or None if it is not indexed.
+
+    Same rules as iter_candidate_files(), for callers (watch) that learn
+    about individual paths instead of walking the tree.
+    """
+    if not path.is_file():
+        return None
+    if DOC_ROOT and DOC_ROOT.exists():
+        if not path.is_relative_to(DOC_ROOT) or not should_index_wide(path):
+            return None
+        ids = derive_ids_wide(path.relative_to(DOC_ROOT).parts, dir_to_slug)
+        if not ids:
+            return None
+        slug, project_dir, doc_type = ids
+    else:
+        if not PROJECTS_ROOT or not path.is_relative_to(PROJECTS_ROOT):
+            return None
+        rel = path.relative_to(PROJECTS_ROOT).parts
+        if len(rel) < 3 or rel[0].startswith(".") or rel[1] not in INCLUDE_DIR_EXTS:
+            return None
+        project_dir, doc_type = rel[0], rel[1]
+        if not should_index(path, doc_type):
+            return None
+        slug = dir_to_slug.get(project_dir, project_dir)
+    if slug_filter and slug != slug_filter:
+        return None
+    return CandidateFile(path=path, slug=slug, project_dir=project_dir, doc_type=doc_type)
+
+
 def iter_candidate_files(slug_filter: str | None = None) -> Iterable[CandidateFile]:
     dir_to_slug = load_registry_dir_slug_map()
 
     if DOC_ROOT and DOC_ROOT.exists():
         for path in sorted(DOC_ROOT.rglob("*")):
-            if not path.is_file():
-                continue
-            if not should_index_wide(path):
-                continue
-            rel = path.relative_to(DOC_ROOT).parts
-            ids = derive_ids_wide(rel, dir_to_slug)
-            if not ids:
-                continue
-            slug, project_dir, doc_type = ids
-            if slug_filter and slug != slug_filter:
-                continue
-            yield CandidateFile(path=path, slug=slug, project_dir=project_dir, doc_type=doc_type)
+            file = candidate_for_path(path, dir_to_slug, slug_filter)
+            if file:
+                yield file
         return
 
     # Legacy mode: PROJECTS_ROOT/*/docType/**
@@ -472,6 +567,14 @@ def connect(db_path: Path) -> sqlite3.Connection:
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     conn.executescript(SCHEMA_SQL)
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(chunks)")}
+    if "content_sha" not in columns:
+        # Pre-diffing index: add and backfill chunk hashes so the next edit
+        # of an existing document already rewrites only what changed.
+        conn.execute("ALTER TABLE chunks ADD COLUMN content_sha TEXT NOT NULL DEFAULT ''")
+        conn.create_function("chunk_sha", 2, chunk_sha, deterministic=True)
+        conn.execute("UPDATE chunks SET content_sha = chunk_sha(section, content)")
+        conn.commit()
     return conn
 
 
@@ -482,21 +585,55 @@ def delete_doc_chunks(conn: sqlite3.Connection, doc_id: int) -> None:
     conn.execute("DELETE FROM chunks WHERE doc_id = ?", (doc_id,))
 
 
-def upsert_document(conn: sqlite3.Connection, file: CandidateFile, text: str, title_hint: str) -> tuple[str, int]:
-    stat = file.path.stat()
+def load_file_stats(conn: sqlite3.Connection) -> dict[str, tuple[int, int]]:
+    """Stored (mtime_ns, size_bytes) per indexed path, for the update fast path."""
+    return {
+        row["path"]: (row["mtime_ns"], row["size_bytes"])
+        for row in conn.execute("SELECT path, mtime_ns, size_bytes FROM documents")
+    }
+
+
+def is_unchanged_on_disk(file: CandidateFile, known_stats: dict[str, tuple[int, int]]) -> bool:
+    """True when the file's mtime and size still match its indexed row, so
+    extraction (pdfplumber / python-docx) can be skipped entirely."""
+    known = known_stats.get(str(file.path))
+    if known is None:
+        return False
+    try:
+        stat = file.path.stat()
+    except OSError:
+        return False
+    return known == (stat.st_mtime_ns, stat.st_size)
+
+
+def upsert_document(
+    conn: sqlite3.Connection,
+    file: CandidateFile,
+    text: str,
+    title_hint: str,
+    chunks: list[tuple[str, str]] | None = None,
+    file_stat: tuple[int, int] | None = None,
+) -> tuple[str, int]:
+    """Write one document and its chunks. `chunks` / `file_stat` (mtime_ns,
+    size_bytes) may come precomputed from the extraction pool; the stat must
+    be taken before the file was read so a concurrent edit is never masked."""
+    if file_stat is None:
+        stat = file.path.stat()
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+    mtime_ns, size_bytes = file_stat
     content_sha = sha256_text(text)
     title = extract_title(text, title_hint)
     indexed_at = now_iso()
 
     existing = conn.execute(
-        "SELECT id, content_sha256 FROM documents WHERE path = ?",
+        "SELECT id, content_sha256, slug, doc_type, title FROM documents WHERE path = ?",
         (str(file.path),),
     ).fetchone()
 
     if existing and existing["content_sha256"] == content_sha:
         conn.execute(
             "UPDATE documents SET mtime_ns = ?, size_bytes = ?, indexed_at = ?, title = ? WHERE id = ?",
-            (stat.st_mtime_ns, stat.st_size, indexed_at, title, existing["id"]),
+            (mtime_ns, size_bytes, indexed_at, title, existing["id"]),
         )
         return "unchanged", 0
 
@@ -522,24 +659,42 @@ def upsert_document(conn: sqlite3.Connection, file: CandidateFile, text: str, ti
             file.doc_type,
             title,
             file.path.suffix.lower(),
-            stat.st_mtime_ns,
-            stat.st_size,
+            mtime_ns,
+            size_bytes,
             content_sha,
             indexed_at,
         ),
     )
     doc_id = conn.execute("SELECT id FROM documents WHERE path = ?", (str(file.path),)).fetchone()[0]
-    delete_doc_chunks(conn, doc_id)
 
-    chunks = chunk_text(text)
+    if chunks is None:
+        chunks = chunk_text(text)
+    # title/slug/doc_type are copied into every chunk and FTS row, so a
+    # change to any of them means a full rewrite; otherwise diff chunks.
+    if existing and (existing["title"], existing["slug"], existing["doc_type"]) == (title, file.slug, file.doc_type):
+        written = diff_doc_chunks(conn, doc_id, file, title, chunks)
+    else:
+        delete_doc_chunks(conn, doc_id)
+        written = insert_chunks(conn, doc_id, file, title, [(i, *chunk) for i, chunk in enumerate(chunks)])
+    return ("updated" if existing else "inserted"), written
+
+
+def insert_chunks(
+    conn: sqlite3.Connection,
+    doc_id: int,
+    file: CandidateFile,
+    title: str,
+    indexed_chunks: list[tuple[int, str, str]],
+) -> int:
+    """Insert (chunk_index, section, content) rows into chunks and chunks_fts."""
     fts_rows = []
-    for chunk_index, (section, content) in enumerate(chunks):
+    for chunk_index, section, content in indexed_chunks:
         cursor = conn.execute(
             """
-            INSERT INTO chunks(doc_id, chunk_index, path, slug, doc_type, title, section, content)
-            VALUES(?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO chunks(doc_id, chunk_index, path, slug, doc_type, title, section, content, content_sha)
+            VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (doc_id, chunk_index, str(file.path), file.slug, file.doc_type, title, section, content),
+            (doc_id, chunk_index, str(file.path), file.slug, file.doc_type, title, section, content, chunk_sha(section, content)),
         )
         row_id = cursor.lastrowid
         fts_rows.append((row_id, str(file.path), file.slug, file.doc_type, title, section, content))
@@ -549,7 +704,67 @@ def upsert_document(conn: sqlite3.Connection, file: CandidateFile, text: str, ti
             "INSERT INTO chunks_fts(rowid, path, slug, doc_type, title, section, content) VALUES(?, ?, ?, ?, ?, ?, ?)",
             fts_rows,
         )
-    return ("updated" if existing else "inserted"), len(fts_rows)
+    return len(fts_rows)
+
+
+def diff_doc_chunks(
+    conn: sqlite3.Connection,
+    doc_id: int,
+    file: CandidateFile,
+    title: str,
+    chunks: list[tuple[str, str]],
+) -> int:
+    """Apply a new chunk list to an existing document, touching only the
+    chunks whose (section, content) hash changed.
+
+    Unchanged chunks keep their row and FTS entry and are only renumbered;
+    removed ones are deleted and new ones inserted. Returns FTS rows written.
+    """
+    old_by_sha: dict[str, list[tuple[int, int]]] = {}
+    for row in conn.execute(
+        "SELECT id, chunk_index, content_sha FROM chunks WHERE doc_id = ? ORDER BY chunk_index",
+        (doc_id,),
+    ):
+        old_by_sha.setdefault(row["content_sha"], []).append((row["id"], row["chunk_index"]))
+
+    moves: list[tuple[int, int]] = []
+    added: list[tuple[int, str, str]] = []
+    for chunk_index, (section, content) in enumerate(chunks):
+        matches = old_by_sha.get(chunk_sha(section, content))
+        if matches:
+            row_id, old_index = matches.pop(0)
+            if old_index != chunk_index:
+                moves.append((chunk_index, row_id))
+        else:
+            added.append((chunk_index, section, content))
+
+    removed = [(row_id,) for rows in old_by_sha.values() for row_id, _ in rows]
+    if removed:
+        conn.executemany("DELETE FROM chunks_fts WHERE rowid = ?", removed)
+        conn.executemany("DELETE FROM chunks WHERE id = ?", removed)
+    if moves:
+        # Two phases (park at negative indexes first) so no intermediate
+        # state collides on UNIQUE(doc_id, chunk_index).
+        conn.executemany("UPDATE chunks SET chunk_index = -1 - ? WHERE id = ?", moves)
+        conn.executemany("UPDATE chunks SET chunk_index = ? WHERE id = ?", moves)
+    return insert_chunks(conn, doc_id, file, title, added)
+
+
+def delete_documents_under(conn: sqlite3.Connection, path: Path, slug_filter: str | None = None) -> int:
+    """Drop the document at `path`, or every document below it if it was a
+    directory (deleted or renamed away). Only `slug_filter`'s, if given."""
+    prefix = str(path)
+    sql = "SELECT id FROM documents WHERE (path = ? OR (path >= ? AND path < ?))"
+    # '0' sorts right after '/', so the range is the index-friendly "prefix/%".
+    params: list[object] = [prefix, prefix + "/", prefix + "0"]
+    if slug_filter:
+        sql += " AND slug = ?"
+        params.append(slug_filter)
+    rows = conn.execute(sql, params).fetchall()
+    for row in rows:
+        delete_doc_chunks(conn, row["id"])
+        conn.execute("DELETE FROM documents WHERE id = ?", (row["id"],))
+    return len(rows)
 
 
 def delete_stale_documents(conn: sqlite3.Connection, live_paths: set[str], slug_filter: str | None = None) -> int:
@@ -567,6 +782,302 @@ def delete_stale_documents(conn: sqlite3.Connection, live_paths: set[str], slug_
     return deleted
 
 
+def extractor_version(suffix: str) -> str:
+    library = {".pdf": pdfplumber, ".docx": docx}.get(suffix)
+    return f"{EXTRACTOR_VERSION}:{suffix}:{getattr(library, '__version__', '')}"
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extract_cache_db(conn: sqlite3.Connection) -> str | None:
+    """DB file workers should read the extraction cache from (None = cache off)."""
+    if EXTRACT_CACHE_MAX_BYTES <= 0:
+        return None
+    path = conn.execute("PRAGMA database_list").fetchone()["file"]
+    return path or None
+
+
+# Read-only cache connections keyed by (pid, db): a SQLite connection must
+# never be used on the far side of a fork(), so a forked pool worker that
+# inherits this dict opens its own.
+_cache_readers: dict[tuple[int, str], sqlite3.Connection] = {}
+
+
+def lookup_extract_cache(cache_db: str, key: tuple[str, str], path: Path) -> ExtractedDocument | None:
+    """Read-only cache probe, safe from pool workers (one connection per process)."""
+    reader_key = (_os.getpid(), cache_db)
+    conn = _cache_readers.get(reader_key)
+    if conn is None:
+        conn = sqlite3.connect(Path(cache_db).as_uri() + "?mode=ro", uri=True)
+        _cache_readers[reader_key] = conn
+    row = conn.execute(
+        "SELECT text_z, title_hint FROM extract_cache WHERE raw_sha256 = ? AND extractor_version = ?",
+        key,
+    ).fetchone()
+    if row is None:
+        return None
+    # A NULL title_hint means "the file name", which may have changed since.
+    return ExtractedDocument(text=zlib.decompress(row[0]).decode("utf-8"), title_hint=row[1] or path.stem)
+
+
+def close_cache_reader(cache_db: str | None) -> None:
+    """Close this process's reader for `cache_db`, if one was opened."""
+    if cache_db:
+        conn = _cache_readers.pop((_os.getpid(), cache_db), None)
+        if conn is not None:
+            conn.close()
+
+
+def store_extract_cache(conn: sqlite3.Connection, result: ExtractionResult) -> None:
+    """Writer side: insert a miss, or bump last_used_at on a hit."""
+    if result.cache_key is None or result.document is None:
+        return
+    if result.cache_hit:
+        conn.execute(
+            "UPDATE extract_cache SET last_used_at = ? WHERE raw_sha256 = ? AND extractor_version = ?",
+            (time.time(), *result.cache_key),
+        )
+        return
+    text_z = zlib.compress(result.document.text.encode("utf-8"), 6)
+    title_hint = result.document.title_hint
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO extract_cache(raw_sha256, extractor_version, text_z, title_hint, stored_bytes, last_used_at)
+        VALUES(?, ?, ?, ?, ?, ?)
+        """,
+        (
+            *result.cache_key,
+            text_z,
+            None if title_hint == result.file.path.stem else title_hint,
+            len(text_z),
+            time.time(),
+        ),
+    )
+
+
+def evict_extract_cache(conn: sqlite3.Connection, max_bytes: int = EXTRACT_CACHE_MAX_BYTES) -> int:
+    """Drop least-recently-used entries until the cache is under 90% of max_bytes."""
+    total = conn.execute("SELECT COALESCE(SUM(stored_bytes), 0) FROM extract_cache").fetchone()[0]
+    if total <= max_bytes:
+        return 0
+    target = int(max_bytes * 0.9)
+    victims = []
+    for row in conn.execute("SELECT raw_sha256, extractor_version, stored_bytes FROM extract_cache ORDER BY last_used_at"):
+        if total <= target:
+            break
+        victims.append((row["raw_sha256"], row["extractor_version"]))
+        total -= row["stored_bytes"]
+    conn.executemany("DELETE FROM extract_cache WHERE raw_sha256 = ? AND extractor_version = ?", victims)
+    return len(victims)
+
+
+def extract_and_chunk(file: CandidateFile, cache_db: str | None = None) -> ExtractionResult:
+    """Pool task: stat, extract and chunk one file (everything but the DB write).
+
+    PDF/DOCX text is looked up in the extraction cache by raw-bytes hash
+    first, so renamed, moved or force-reindexed files are not re-parsed.
+    """
+    cache_key = None
+    try:
+        stat = file.path.stat()
+        suffix = file.path.suffix.lower()
+        document = None
+        if cache_db and suffix in EXTRACT_CACHE_SUFFIXES:
+            cache_key = (sha256_file(file.path), extractor_version(suffix))
+            document = lookup_extract_cache(cache_db, cache_key, file.path)
+        cache_hit = document is not None
+        if document is None:
+            document = extract_document(file)
+    except Exception:
+        return ExtractionResult(file, None, [], 0, 0)
+    chunks = chunk_text(document.text) if document.text.strip() else []
+    return ExtractionResult(file, document, chunks, stat.st_mtime_ns, stat.st_size, cache_key, cache_hit)
+
+
+def iter_extracted(
+    files: Iterable[CandidateFile],
+    workers: int = 1,
+    cache_db: str | None = None,
+) -> Iterator[ExtractionResult]:
+    """Extract `files` on a process pool, yielding results as they complete.
+
+    At most workers * PENDING_PER_WORKER results are in flight or waiting
+    for the consumer, so a slow writer throttles extraction instead of
+    letting parsed documents pile up in memory. workers <= 1 runs inline.
+    """
+    if workers <= 1:
+        # Inline: the reader lives in this (parent) process, so don't leave
+        # it open for a pool that may be forked from here later.
+        try:
+            for file in files:
+                yield extract_and_chunk(file, cache_db)
+        finally:
+            close_cache_reader(cache_db)
+        return
+    max_pending = workers * PENDING_PER_WORKER
+    # spawn, not fork: under `watch` the watchdog observer threads are running,
+    # and forking a threaded process is unsafe.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        pending: set = set()
+        try:
+            for file in files:
+                pending.add(pool.submit(extract_and_chunk, file, cache_db))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in as_completed(pending):
+                yield future.result()
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+def run_update(
+    conn: sqlite3.Connection,
+    slug_filter: str | None = None,
+    force: bool = False,
+    workers: int = 1,
+    batch_size: int = WRITE_BATCH_DOCS,
+) -> UpdateStats:
+    """Incrementally index candidate files; the caller commits the tail.
+
+    Files whose mtime/size match their row are skipped unless `force`.
+    Everything else is extracted on `workers` processes while this thread,
+    the only writer, applies upserts and commits every `batch_size` docs.
+    """
+    stats = UpdateStats()
+    live_paths: set[str] = set()
+    known_stats = {} if force else load_file_stats(conn)
+
+    def changed_files() -> Iterator[CandidateFile]:
+        for file in iter_candidate_files(slug_filter=slug_filter):
+            live_paths.add(str(file.path))
+            if is_unchanged_on_disk(file, known_stats):
+                stats.unchanged += 1
+                stats.skipped_stat += 1
+                continue
+            yield file
+
+    apply_extracted(conn, iter_extracted(changed_files(), workers, extract_cache_db(conn)), stats, batch_size)
+    stats.deleted = delete_stale_documents(conn, live_paths, slug_filter=slug_filter)
+    evict_extract_cache(conn)
+    return stats
+
+
+def apply_extracted(
+    conn: sqlite3.Connection,
+    results: Iterable[ExtractionResult],
+    stats: UpdateStats,
+    batch_size: int = WRITE_BATCH_DOCS,
+) -> None:
+    """Writer loop: upsert each extraction result, committing every `batch_size` docs."""
+    since_commit = 0
+    for result in results:
+        if result.document is None:
+            stats.skipped_extract += 1
+            continue
+        store_extract_cache(conn, result)
+        stats.cache_hits += result.cache_hit
+        if not result.document.text.strip():
+            stats.skipped_empty += 1
+            continue
+        status, chunk_count = upsert_document(
+            conn,
+            result.file,
+            result.document.text,
+            result.document.title_hint,
+            chunks=result.chunks,
+            file_stat=(result.mtime_ns, result.size_bytes),
+        )
+        stats.chunk_writes += chunk_count
+        if status == "inserted":
+            stats.inserted += 1
+        elif status == "updated":
+            stats.updated += 1
+        else:
+            stats.unchanged += 1
+        since_commit += 1
+        if since_commit >= batch_size:
+            conn.commit()
+            since_commit = 0
+
+
+def reindex_paths(
+    conn: sqlite3.Connection,
+    paths: Iterable[Path],
+    slug_filter: str | None = None,
+    workers: int = 1,
+    new_dirs: Iterable[Path] = (),
+) -> UpdateStats:
+    """Bring the index in line with a set of touched paths (watch mode).
+
+    Existing candidate files are re-extracted unless their mtime/size still
+    match; paths that no longer exist, or no longer qualify, lose their
+    documents. Only `new_dirs` (created or renamed in) are walked; other
+    existing directories in `paths` are ignored.
+    """
+    stats = UpdateStats()
+    dir_to_slug = load_registry_dir_slug_map()
+    files: dict[str, CandidateFile] = {}
+    for directory in sorted(set(new_dirs)):
+        if not directory.is_dir():
+            continue
+        for child in sorted(directory.rglob("*")):
+            file = candidate_for_path(child, dir_to_slug, slug_filter)
+            if file:
+                files[str(child)] = file
+    for path in sorted(set(paths)):
+        if path.is_dir():
+            continue
+        # No slug filter here: another slug's file is out of scope, not gone.
+        file = candidate_for_path(path, dir_to_slug)
+        if file is None:
+            stats.deleted += delete_documents_under(conn, path, slug_filter)
+        elif not slug_filter or file.slug == slug_filter:
+            files[str(path)] = file
+
+    known_stats = {}
+    for path in files:
+        row = conn.execute("SELECT mtime_ns, size_bytes FROM documents WHERE path = ?", (path,)).fetchone()
+        if row:
+            known_stats[path] = (row["mtime_ns"], row["size_bytes"])
+    changed = []
+    for file in files.values():
+        if is_unchanged_on_disk(file, known_stats):
+            stats.unchanged += 1
+            stats.skipped_stat += 1
+        else:
+            changed.append(file)
+    apply_extracted(conn, iter_extracted(changed, min(workers, len(changed)), extract_cache_db(conn)), stats)
+    evict_extract_cache(conn)
+    return stats
+
+
+def record_update_meta(conn: sqlite3.Connection, slug_filter: str | None = None) -> None:
+    conn.execute(
+        "INSERT INTO index_meta(key, value) VALUES('last_updated_at', ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+        (now_iso(),),
+    )
+    if slug_filter:
+        conn.execute(
+            "INSERT INTO index_meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+            (f"last_updated_at:{slug_filter}", now_iso()),
+        )
+    conn.execute(
+        "INSERT INTO index_meta(key, value) VALUES('projects_root', ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+        (str(DOC_ROOT or PROJECTS_ROOT),),
+    )
+
+
 def search_rows(conn: sqlite3.Connection, query: str, slug: str | None, doc_type: str | None, limit: int) -> list[dict]:
     # Trigram tokenizer requires >= 3 chars for MATCH; fall back to LIKE for short queries
     if len(query.strip()) < 3:
@@ -658,44 +1169,11 @@ def _search_rows_like(conn: sqlite3.Connection, query: str, slug: str | None, do
 def command_update(args: argparse.Namespace) -> int:
     db_path = Path(args.db_path).expanduser()
     conn = connect(db_path)
-    inserted = updated = unchanged = chunk_total = skipped_empty = skipped_extract = 0
-    live_paths: set[str] = set()
     slug_filter = args.slug
 
     try:
-        for file in iter_candidate_files(slug_filter=slug_filter):
-            live_paths.add(str(file.path))
-            try:
-                extracted = extract_document(file)
-            except Exception:
-                skipped_extract += 1
-                continue
-            if not extracted.text.strip():
-                skipped_empty += 1
-                continue
-            status, chunk_count = upsert_document(conn, file, extracted.text, extracted.title_hint)
-            chunk_total += chunk_count
-            if status == "inserted":
-                inserted += 1
-            elif status == "updated":
-                updated += 1
-            else:
-                unchanged += 1
-
-        deleted = delete_stale_documents(conn, live_paths, slug_filter=slug_filter)
-        conn.execute(
-            "INSERT INTO index_meta(key, value) VALUES('last_updated_at', ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-            (now_iso(),),
-        )
-        if slug_filter:
-            conn.execute(
-                "INSERT INTO index_meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-                (f"last_updated_at:{slug_filter}", now_iso()),
-            )
-        conn.execute(
-            "INSERT INTO index_meta(key, value) VALUES('projects_root', ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-            (str(DOC_ROOT or PROJECTS_ROOT),),
-        )
+        stats = run_update(conn, slug_filter=slug_filter, force=args.force, workers=args.workers)
+        record_update_meta(conn, slug_filter)
         conn.commit()
 
         docs = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
@@ -705,13 +1183,15 @@ def command_update(args: argparse.Namespace) -> int:
             "slug": slug_filter,
             "documents": docs,
             "chunks": chunks,
-            "inserted": inserted,
-            "updated": updated,
-            "unchanged": unchanged,
-            "deleted": deleted,
-            "chunk_writes": chunk_total,
-            "skipped_empty": skipped_empty,
-            "skipped_extract": skipped_extract,
+            "inserted": stats.inserted,
+            "updated": stats.updated,
+            "unchanged": stats.unchanged,
+            "skipped_stat": stats.skipped_stat,
+            "deleted": stats.deleted,
+            "chunk_writes": stats.chunk_writes,
+            "skipped_empty": stats.skipped_empty,
+            "skipped_extract": stats.skipped_extract,
+            "cache_hits": stats.cache_hits,
         }
         if args.json:
             print(json.dumps(payload, ensure_ascii=False, indent=2))
@@ -719,13 +1199,15 @@ def command_update(args: argparse.Namespace) -> int:
             print(f"db={db_path}")
             print(f"documents={docs} chunks={chunks}")
             print(
-                "inserted={inserted} updated={updated} unchanged={unchanged} deleted={deleted} skipped_empty={skipped_empty} skipped_extract={skipped_extract}".format(
-                    inserted=inserted,
-                    updated=updated,
-                    unchanged=unchanged,
-                    deleted=deleted,
-                    skipped_empty=skipped_empty,
-                    skipped_extract=skipped_extract,
+                "inserted={inserted} updated={updated} unchanged={unchanged} (stat={skipped_stat}) deleted={deleted} skipped_empty={skipped_empty} skipped_extract={skipped_extract} cache_hits={cache_hits}".format(
+                    inserted=stats.inserted,
+                    updated=stats.updated,
+                    unchanged=stats.unchanged,
+                    skipped_stat=stats.skipped_stat,
+                    deleted=stats.deleted,
+                    skipped_empty=stats.skipped_empty,
+                    skipped_extract=stats.skipped_extract,
+                    cache_hits=stats.cache_hits,
                 )
             )
         return 0
@@ -733,6 +1215,120 @@ def command_update(args: argparse.Namespace) -> int:
         conn.close()
 
 
+class _TouchedPaths(FileSystemEventHandler):
+    """Collects paths from watchdog events; the watch loop drains them once
+    no new event has arrived for the debounce period."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._paths: set[Path] = set()
+        self._new_dirs: set[Path] = set()
+        self.last_event = 0.0
+        self.pending = threading.Event()
+
+    def on_any_event(self, event) -> None:
+        if event.event_type in {"opened", "closed_no_write"}:
+            return
+        # A directory's "modified" just echoes a child create/delete, which
+        # arrives as its own event; walking the parent would rescan siblings.
+        if event.is_directory and event.event_type == "modified":
+            return
+        src = Path(_os.fsdecode(event.src_path))
+        dest = Path(_os.fsdecode(event.dest_path)) if getattr(event, "dest_path", "") else None
+        with self._lock:
+            self._paths.add(src)
+            if dest:
+                self._paths.add(dest)
+            if event.is_directory and event.event_type in {"created", "moved"}:
+                self._new_dirs.add(dest or src)
+            self.last_event = time.monotonic()
+        self.pending.set()
+
+    def drain(self) -> tuple[set[Path], set[Path]]:
+        """(touched paths, directories created or moved in) since the last drain."""
+        with self._lock:
+            paths, self._paths = self._paths, set()
+            new_dirs, self._new_dirs = self._new_dirs, set()
+            self.pending.clear()
+        return paths, new_dirs
+
+
+def _report_watch(stats: UpdateStats, trigger: str, as_json: bool) -> None:
+    if not (stats.inserted or stats.updated or stats.deleted or stats.skipped_extract):
+        return
+    if as_json:
+        print(json.dumps({"at": now_iso(), "trigger": trigger, **stats.__dict__}, ensure_ascii=False), flush=True)
+    else:
+        print(
+            f"[{now_iso()}] {trigger}: inserted={stats.inserted} updated={stats.updated} "
+            f"deleted={stats.deleted} skipped_extract={stats.skipped_extract}",
+            flush=True,
+        )
+
+
+def command_watch(args: argparse.Namespace) -> int:
+    """Reconcile once, then keep the index current until interrupted.
+
+    With watchdog installed (inotify/FSEvents), touched paths are collected,
+    debounced and re-indexed on their own. Without it, the tree is rescanned
+    every --interval seconds; the stored mtime_ns/size_bytes rows act as the
+    snapshot, so a rescan only extracts what changed.
+    """
+    root = DOC_ROOT if DOC_ROOT and DOC_ROOT.exists() else PROJECTS_ROOT
+    if not root or not root.exists():
+        print("watch: DOC_ROOT / DOC_PROJECTS_ROOT not set or missing", flush=True)
+        return 1
+    db_path = Path(args.db_path).expanduser()
+    db_prefix = str(db_path.resolve())
+    conn = connect(db_path)
+    slug_filter = args.slug
+
+    def commit(stats: UpdateStats, trigger: str) -> None:
+        record_update_meta(conn, slug_filter)
+        conn.commit()
+        _report_watch(stats, trigger, args.json)
+
+    try:
+        commit(run_update(conn, slug_filter=slug_filter, workers=args.workers), "reconcile")
+        if Observer is None or args.poll:
+            while True:
+                time.sleep(args.interval)
+                commit(run_update(conn, slug_filter=slug_filter, workers=args.workers), "poll")
+
+        handler = _TouchedPaths()
+        observer = Observer()
+        observer.schedule(handler, str(root), recursive=True)
+        observer.start()
+        try:
+            while True:
+                handler.pending.wait()
+                quiet = time.monotonic() - handler.last_event
+                if quiet < args.debounce:
+                    time.sleep(args.debounce - quiet)
+                    continue
+                # Our own DB/WAL writes show up too when the DB lives under the root.
+                paths, new_dirs = handler.drain()
+                paths = {path for path in paths if not str(path).startswith(db_prefix)}
+                if not paths and not new_dirs:
+                    continue
+                if REGISTRY_PATH and REGISTRY_PATH in paths:
+                    # Slug mapping may have changed: reconcile the whole tree.
+                    commit(run_update(conn, slug_filter=slug_filter, workers=args.workers), "registry")
+                else:
+                    commit(
+                        reindex_paths(conn, paths, slug_filter=slug_filter, workers=args.workers, new_dirs=new_dirs),
+                        "events",
+                    )
+        finally:
+            observer.stop()
+            observer.join()
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        conn.close()
+
+
 def command_search(args: argparse.Namespace) -> int:
     db_path = Path(args.db_path).expanduser()
     conn = connect(db_path)
@@ -804,8 +1400,19 @@ def build_parser() -> argparse.ArgumentParser:
     p_update = sub.add_parser("update", help="Incrementally update doc index")
     p_update.add_argument("--slug")
     p_update.add_argument("--json", action="store_true")
+    p_update.add_argument("--force", action="store_true", help="Re-extract every file, ignoring the mtime/size fast path")
+    p_update.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Extraction processes (1 = inline)")
     p_update.set_defaults(func=command_update)
 
+    p_watch = sub.add_parser("watch", help="Reconcile, then re-index changed files as they change")
+    p_watch.add_argument("--slug")
+    p_watch.add_argument("--json", action="store_true", help="One JSON line per applied batch")
+    p_watch.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Extraction processes (1 = inline)")
+    p_watch.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE_SECONDS, help="Quiet seconds before applying a burst of events")
+    p_watch.add_argument("--interval", type=float, default=WATCH_POLL_SECONDS, help="Rescan interval in polling mode")
+    p_watch.add_argument("--poll", action="store_true", help="Poll even if watchdog is installed")
+    p_watch.set_defaults(func=command_watch)
+
     p_search = sub.add_parser("search", help="Search indexed chunks")
     p_search.add_argument("query")
     p_search.add_argument("--slug")
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Approximate nearest-neighbour index over HRR fact vectors (pure NumPy).
+
+Random-projection LSH (SimHash) on the real embedding [cos φ, sin φ] of a
+phase vector. Its cosine is exactly hrr.similarity(), so a hyperplane test
+r·[cos φ, sin φ] is Re(exp(iφ) · conj(a + ib)) with r = (a, b) — one complex
+matrix product over the phasors the retriever already uses.
+
+  - `tables` hash tables, each keyed by `bits` sign bits (default 96 × 12).
+  - Queries also probe the buckets reached by flipping each of the `flips`
+    least confident bits per table (multi-probe LSH).
+  - Buckets are one sorted array of (table, code) keys, rebuilt lazily after
+    add/remove, so a lookup is a vectorized searchsorted, not a Python loop.
+  - Hyperplanes come from a fixed seed, so signatures are stable across
+    processes; MemoryStore persists them in the fact_lsh table and keeps the
+    in-memory buckets in step with add/tombstone/purge.
+
+Candidates are always rescored exactly; the index only decides which facts
+get scored. HRR similarities between a probe key and a matching fact are
+modest (~0.3–0.5), hence many short tables rather than a few long ones.
+96 × 12 keeps recall@10 ≈ 0.99 on the bench corpus while scoring ~7% of the
+facts; at 64 × 10 (~17%) gathering the candidate rows cost as much as the
+exact scan it was meant to replace.
+
+Usage:
+    python3 ann.py bench [db_path] [--facts N] [--queries N]
+
+References:
+  Charikar (2002) — Similarity estimation techniques from rounding algorithms
+  Lv et al. (2007) — Multi-probe LSH
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+try:
+    from . import holographic as hrr
+except ImportError:
+    import holographic as hrr  # type: ignore[no-redef]
+
+DEFAULT_SEED = 0x5EED_4A11
+DEFAULT_TABLES = 96
+DEFAULT_BITS = 12
+DEFAULT_FLIPS = 2
+
+
+class SimHashIndex:
+    """Multi-table SimHash buckets: fact_id → one `bits`-bit code per table."""
+
+    def __init__(
+        self,
+        dim: int,
+        tables: int = DEFAULT_TABLES,
+        bits: int = DEFAULT_BITS,
+        seed: int = DEFAULT_SEED,
+    ) -> None:
+        hrr._require_numpy()
+        np = hrr.np
+        if bits > 16:
+            raise ValueError("bits must be <= 16 (codes are stored as uint16)")
+        self.dim = dim
+        self.tables = tables
+        self.bits = bits
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        planes = rng.standard_normal((tables * bits, dim)) + 1j * rng.standard_normal((tables * bits, dim))
+        # Conjugated once so projecting is phasors @ _planes_h.
+        self._planes_h = np.conj(planes).T.astype(np.complex64)
+        self._weights = (1 << np.arange(bits)).astype(np.uint16)
+        self._codes: dict[int, "np.ndarray"] = {}
+        # (sorted table << 16 | code keys, fact_id per key); None when stale.
+        self._buckets: "tuple[np.ndarray, np.ndarray] | None" = None
+
+    @property
+    def config(self) -> dict:
+        return {"dim": self.dim, "tables": self.tables, "bits": self.bits, "seed": self.seed}
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def _project(self, phasors: "np.ndarray") -> "np.ndarray":
+        """(n, dim) phasors → (n, tables, bits) hyperplane projections."""
+        proj = (hrr.np.atleast_2d(phasors) @ self._planes_h).real
+        return proj.reshape(-1, self.tables, self.bits)
+
+    def signatures(self, phasors: "np.ndarray") -> "np.ndarray":
+        """(n, dim) phasors → (n, tables) uint16 bucket codes."""
+        bits = self._project(phasors) > 0
+        return (bits * self._weights).sum(axis=2, dtype=hrr.np.uint16)
+
+    @staticmethod
+    def signature_to_bytes(codes: "np.ndarray") -> bytes:
+        return hrr.np.asarray(codes, dtype="<u2").tobytes()
+
+    @staticmethod
+    def signature_from_bytes(data: bytes) -> "np.ndarray":
+        return hrr.np.frombuffer(data, dtype="<u2")
+
+    def clear(self) -> None:
+        """Drop every bucket, keeping the hyperplanes."""
+        self._codes = {}
+        self._buckets = None
+
+    def add(self, fact_id: int, codes: "np.ndarray") -> None:
+        """Insert or replace a fact's signature."""
+        self._codes[int(fact_id)] = codes
+        self._buckets = None
+
+    def remove(self, fact_id: int) -> None:
+        if self._codes.pop(int(fact_id), None) is not None:
+            self._buckets = None
+
+    def _sorted_buckets(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """(sorted uint32 table << 16 | code keys, int64 fact_id per key)."""
+        buckets = self._buckets
+        if buckets is None:
+            np = hrr.np
+            ids = np.fromiter(self._codes, dtype=np.int64, count=len(self._codes))
+            codes = (
+                np.stack(list(self._codes.values())).astype(np.uint32)
+                if self._codes
+                else np.empty((0, self.tables), dtype=np.uint32)
+            )
+            keys = ((np.arange(self.tables, dtype=np.uint32) << 16) | codes).ravel()
+            order = np.argsort(keys)
+            buckets = self._buckets = (keys[order], np.repeat(ids, self.tables)[order])
+        return buckets
+
+    def candidates(self, queries: "np.ndarray", flips: int = DEFAULT_FLIPS) -> "np.ndarray":
+        """Union of fact_ids sharing a (multi-probed) bucket with any query.
+
+        queries: (dim,) or (k, dim) phase vectors. Returns sorted int64 ids.
+        """
+        np = hrr.np
+        keys, ids = self._sorted_buckets()
+        proj = self._project(hrr.phases_to_phasors(np.atleast_2d(queries)))
+        codes = ((proj > 0) * self._weights).sum(axis=2, dtype=np.uint16)
+        # Least confident bits per table: smallest |projection|.
+        weak = np.argsort(np.abs(proj), axis=2)[:, :, :flips]
+        probes = np.concatenate(
+            [codes[:, :, None], codes[:, :, None] ^ (1 << weak).astype(np.uint16)], axis=2
+        )
+        tables = np.arange(self.tables, dtype=np.uint32)[None, :, None]
+        probe_keys = np.unique((tables << 16) | probes)
+        lo = np.searchsorted(keys, probe_keys, side="left")
+        sizes = np.searchsorted(keys, probe_keys, side="right") - lo
+        total = int(sizes.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64)
+        # Positions lo[i] .. lo[i] + sizes[i] - 1 of every probed bucket.
+        positions = np.repeat(lo - (np.cumsum(sizes) - sizes), sizes) + np.arange(total)
+        return np.unique(ids[positions])
+
+
+# ----------------------------------------------------------------------
+# Benchmark: recall of the index vs an exact scan
+# ----------------------------------------------------------------------
+
+def _synthetic_phasors(n: int, dim: int, seed: int = 7) -> tuple["np.ndarray", list[str]]:
+    """n encode_fact()-shaped vectors over n//5 entities, plus the entity names."""
+    np = hrr.np
+    rng = np.random.default_rng(seed)
+    entities = [f"entity {i}" for i in range(max(n // 5, 1))]
+    role_content = hrr.encode_atom("__hrr_role_content__", dim)
+    role_entity = hrr.encode_atom("__hrr_role_entity__", dim)
+    phases = np.empty((n, dim))
+    for i in range(n):
+        # Random content stands in for encode_text(); entities are real atoms.
+        content = rng.uniform(0, 2 * np.pi, dim)
+        picked = rng.choice(len(entities), size=int(rng.integers(1, 4)), replace=False)
+        phases[i] = hrr.bundle(
+            hrr.bind(content, role_content),
+            *(hrr.bind(hrr.encode_atom(entities[j], dim), role_entity) for j in picked),
+        )
+    return hrr.phases_to_phasors(phases), entities
+
+
+def benchmark(
+    phasors: "np.ndarray",
+    keys: "np.ndarray",
+    k: int = 10,
+    min_similarity: float = 0.2,
+    index: SimHashIndex | None = None,
+) -> dict:
+    """Recall@k of ANN candidates + exact rescoring vs a full exact scan.
+
+    Only exact top-k hits above `min_similarity` count as relevant — below
+    that a "neighbour" is HRR crosstalk and its rank is arbitrary.
+    """
+    np = hrr.np
+    n, dim = phasors.shape
+    if index is None:
+        index = SimHashIndex(dim)
+    started = time.perf_counter()
+    for fact_id, codes in enumerate(index.signatures(phasors)):
+        index.add(fact_id, codes)
+    build_s = time.perf_counter() - started
+
+    recalls, fractions, exact_ms, ann_ms = [], [], [], []
+    for key in keys:
+        started = time.perf_counter()
+        sims = hrr.batch_similarity(phasors, key)
+        top = np.argsort(-sims)[:k]
+        exact_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        candidates = index.candidates(key)
+        if len(candidates):
+            cand_sims = hrr.batch_similarity(phasors[candidates], key)
+            ann_top = set(candidates[np.argsort(-cand_sims)[:k]].tolist())
+        else:
+            ann_top = set()
+        ann_ms.append((time.perf_counter() - started) * 1000)
+
+        relevant = {int(i) for i in top if sims[i] >= min_similarity}
+        if relevant:
+            recalls.append(len(relevant & ann_top) / len(relevant))
+        fractions.append(len(candidates) / n)
+
+    return {
+        "facts": n,
+        "dim": dim,
+        "queries": len(keys),
+        "index": index.config,
+        "build_s": round(build_s, 3),
+        f"recall_at_{k}": round(float(np.mean(recalls)), 4) if recalls else None,
+        "candidate_fraction": round(float(np.mean(fractions)), 4),
+        "exact_ms_p50": round(float(np.median(exact_ms)), 3),
+        "ann_ms_p50": round(float(np.median(ann_ms)), 3),
+    }
+
+
+def _bench_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="ann.py bench")
+    parser.add_argument("db_path", nargs="?", help="memory.db to benchmark (default: synthetic)")
+    parser.add_argument("--facts", type=int, default=20000, help="synthetic fact count")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--dim", type=int, default=1024)
+    args = parser.parse_args(argv)
+
+    np = hrr.np
+    role_entity = hrr.encode_atom("__hrr_role_entity__", args.dim)
+    if args.db_path:
+        try:
+            from .store import MemoryStore
+        except ImportError:
+            from store import MemoryStore  # type: ignore[no-redef]
+        store = MemoryStore(Path(args.db_path), hrr_dim=args.dim)
+        vectors = store.fact_vectors()
+        if vectors is None:
+            print(json.dumps({"error": "no fact vectors"}))
+            return 1
+        phasors = vectors.phasors
+        names = [row["name"] for row in store._conn.execute(
+            "SELECT name FROM entities ORDER BY entity_id DESC LIMIT ?", (args.queries,)
+        )]
+        store.close()
+    else:
+        phasors, names = _synthetic_phasors(args.facts, args.dim)
+        names = names[:args.queries]
+
+    keys = np.stack([hrr.bind(hrr.encode_atom(name.lower(), args.dim), role_entity) for name in names])
+    print(json.dumps(benchmark(phasors, keys), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "bench":
+        raise SystemExit(_bench_main(sys.argv[2:]))
+    print(__doc__)
+    raise SystemExit(1)
@@ -0,0 +1,14 @@
+"""Retrieval / store benchmarks over reproducible synthetic corpora.
+
+    python3 lib/holographic/bench --facts 5000 --out before.json
+    python3 lib/holographic/bench --facts 5000 --baseline before.json
+
+Times add_fact, batched adds, search, search_facts, probe, related, reason,
+session_search, contradict and rebuild_banks; reports p50/p95/p99 (ms), load
+time and DB size as JSON. Fully offline — arbitration is never invoked.
+"""
+
+from .corpus import Corpus, generate_corpus
+from .runner import compare, run_benchmark, summarize
+
+__all__ = ["Corpus", "compare", "generate_corpus", "run_benchmark", "summarize"]
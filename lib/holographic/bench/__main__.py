@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""CLI: python3 lib/holographic/bench [options] — see bench/__init__.py."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+if __package__ in (None, ""):
+    # Run as a directory/script: make store.py & co. and this package importable.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from bench.runner import compare, run_benchmark
+else:
+    from .runner import compare, run_benchmark
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="bench", description=__doc__)
+    parser.add_argument("--facts", type=int, default=5000, help="corpus size (1k-100k)")
+    parser.add_argument("--queries", type=int, default=200, help="calls per read operation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--entity-density", type=float, default=0.5,
+                        help="share of facts naming an entity (0-1)")
+    parser.add_argument("--cjk-ratio", type=float, default=0.3, help="share of Chinese facts (0-1)")
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--single-adds", type=int, default=500,
+                        help="facts added one commit each before batching")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--db", help="keep the benchmark database at this (new) path")
+    parser.add_argument("--out", help="write the JSON report here as well as stdout")
+    parser.add_argument("--baseline", help="earlier report to compare against (adds 'vs_baseline')")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        n_facts=args.facts,
+        n_queries=args.queries,
+        seed=args.seed,
+        entity_density=args.entity_density,
+        cjk_ratio=args.cjk_ratio,
+        dim=args.dim,
+        single_adds=args.single_adds,
+        batch_size=args.batch_size,
+        db_path=args.db,
+    )
+    if args.baseline:
+        report["vs_baseline"] = compare(json.loads(Path(args.baseline).read_text()), report)
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        Path(args.out).write_text(text + "\n")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+"""Reproducible synthetic fact corpora (English + CJK) for the benchmarks.
+
+Facts follow the shapes extract.py produces: short preference / decision /
+event statements, session-tagged "userId,threadTs", mixed source kinds.
+Entities are written the way MemoryStore._extract_entities() finds them —
+capitalized two-word names in English, double-quoted names in CJK — so
+probe/related/reason/contradict have real entity structure to work on.
+
+Same (n_facts, seed, entity_density, cjk_ratio) → byte-identical corpus.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+_FIRST = ["Alice", "Bob", "Carol", "David", "Erin", "Frank", "Grace", "Henry",
+          "Irene", "Jack", "Kevin", "Laura", "Mason", "Nina", "Oscar", "Paula"]
+_LAST = ["Chen", "Smith", "Tanaka", "Garcia", "Kim", "Muller", "Rossi", "Singh",
+         "Novak", "Silva", "Ito", "Brown"]
+_CJK_NAMES = ["王磊", "李娜", "张伟", "刘洋", "陈静", "杨帆", "赵敏", "黄强",
+              "周婷", "吴昊", "徐丽", "孙浩"]
+
+_TOOLS = ["python", "rust", "postgres", "redis", "kafka", "docker", "terraform", "vim", "pytest", "grafana"]
+_TOPICS = ["billing", "search", "onboarding", "analytics", "deploy", "caching", "auth", "reporting"]
+_REGIONS = ["tokyo", "osaka", "frankfurt", "oregon", "singapore", "dublin"]
+_DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday"]
+_CJK_TOOLS = ["飞书", "钉钉", "表格", "看板", "脚本", "数据库"]
+_CJK_TOPICS = ["账单", "搜索", "报表", "权限", "部署", "缓存", "监控"]
+_CJK_CITIES = ["北京", "上海", "深圳", "杭州", "成都"]
+_CJK_DAYS = ["周一", "周二", "周三", "周四", "周五"]
+
+_CATEGORIES = ["preference", "decision", "entity", "event", "knowledge", "instruction", "session_context"]
+_SOURCE_KINDS = ["extracted"] * 6 + ["inferred"] * 3 + ["ambiguous"]
+
+_EN_TEMPLATES = [
+    "{e} prefers {tool} for {topic} work",
+    "{e} deployed the {topic} service to {region} on {day}",
+    "the {topic} cache in {region} is backed by {tool}",
+    "{e} and {e2} reviewed the {topic} design on {day}",
+    "meeting with {e} about {topic} moved to {day}",
+    "{e} does not want {tool} in the {topic} pipeline",
+    "always run {tool} before merging {topic} changes",
+    "{topic} alerts for {region} go to {e}",
+]
+_CJK_TEMPLATES = [
+    "{e}喜欢用{tool}处理{topic}",
+    "{e}在{city}部署了{topic}服务",
+    "{topic}的数据放在{city}机房，由{e}负责",
+    "{day}和{e}、{e2}开会讨论{topic}",
+    "{e}不想在{topic}流程里用{tool}",
+    "以后{topic}相关的{tool}都发给{e}",
+]
+
+
+@dataclass
+class Corpus:
+    """Generated facts plus the query material the benchmarks draw from."""
+
+    facts: list[dict]                       # add_fact kwargs, in insertion order
+    entities: list[str]                     # every entity name used
+    queries: list[str]                      # free-text search queries
+    sessions: list[tuple[str, str]] = field(default_factory=list)  # (user_id, thread_ts)
+    config: dict = field(default_factory=dict)
+
+
+def _entity_pool(rng: random.Random, n: int, cjk_ratio: float) -> tuple[list[str], list[str]]:
+    english = [f"{first} {last}" for first in _FIRST for last in _LAST]
+    rng.shuffle(english)
+    n_cjk = min(len(_CJK_NAMES), round(n * cjk_ratio))
+    return english[:max(n - n_cjk, 1)], _CJK_NAMES[:n_cjk]
+
+
+def generate_corpus(
+    n_facts: int,
+    seed: int = 0,
+    entity_density: float = 0.5,
+    cjk_ratio: float = 0.3,
+    n_users: int = 20,
+    n_threads: int = 200,
+    n_queries: int = 200,
+) -> Corpus:
+    """Build a corpus of `n_facts` facts.
+
+    entity_density: share of facts that name at least one entity (the rest
+        replace the name with a generic subject); each entity appears in
+        roughly n_facts * entity_density / n_entities facts.
+    cjk_ratio: share of facts written in Chinese.
+    """
+    rng = random.Random(seed)
+    n_entities = max(8, min(n_facts // 20, len(_FIRST) * len(_LAST)))
+    english, cjk = _entity_pool(rng, n_entities, cjk_ratio)
+    users = [f"U{rng.randrange(16**8):08X}" for _ in range(n_users)]
+    threads = [f"{1_700_000_000 + i * 3_517}.{rng.randrange(10**6):06d}" for i in range(n_threads)]
+
+    facts: list[dict] = []
+    sessions: set[tuple[str, str]] = set()
+    for i in range(n_facts):
+        use_cjk = bool(cjk) and rng.random() < cjk_ratio
+        named = rng.random() < entity_density
+        if use_cjk:
+            names = [f'"{name}"' for name in rng.sample(cjk, min(2, len(cjk)))]
+            generic = ["同事", "团队"]
+            template = rng.choice(_CJK_TEMPLATES)
+            text = template.format(
+                e=names[0] if named else generic[0],
+                e2=names[-1] if named else generic[1],
+                tool=rng.choice(_CJK_TOOLS), topic=rng.choice(_CJK_TOPICS),
+                city=rng.choice(_CJK_CITIES), day=rng.choice(_CJK_DAYS),
+            )
+            text += f"（{i}）"
+        else:
+            names = rng.sample(english, min(2, len(english)))
+            generic = ["the team", "the on-call engineer"]
+            template = rng.choice(_EN_TEMPLATES)
+            text = template.format(
+                e=names[0] if named else generic[0],
+                e2=names[-1] if named else generic[1],
+                tool=rng.choice(_TOOLS), topic=rng.choice(_TOPICS),
+                region=rng.choice(_REGIONS), day=rng.choice(_DAYS),
+            )
+            text += f" (#{i})"
+        user, thread = rng.choice(users), rng.choice(threads)
+        sessions.add((user, thread))
+        facts.append({
+            "content": text,
+            "category": rng.choice(_CATEGORIES),
+            "tags": f"{user},{thread}",
+            "source_kind": rng.choice(_SOURCE_KINDS),
+        })
+
+    vocabulary = _TOOLS + _TOPICS + _REGIONS + _CJK_TOOLS + _CJK_TOPICS + _CJK_CITIES
+    queries = []
+    for _ in range(n_queries):
+        kind = rng.random()
+        if kind < 0.4:
+            queries.append(" ".join(rng.sample(vocabulary, 2)))
+        elif kind < 0.7:
+            queries.append(rng.choice(english + cjk))
+        else:
+            queries.append(f"{rng.choice(_TOPICS)} {rng.choice(_REGIONS)} {rng.choice(_TOOLS)}")
+
+    return Corpus(
+        facts=facts,
+        entities=english + cjk,
+        queries=queries,
+        sessions=sorted(sessions),
+        config={
+            "facts": n_facts,
+            "seed": seed,
+            "entity_density": entity_density,
+            "cjk_ratio": cjk_ratio,
+            "entities": len(english) + len(cjk),
+            "users": n_users,
+            "threads": n_threads,
+        },
+    )
@@ -0,0 +1,211 @@
+"""Time MemoryStore / FactRetriever operations over a synthetic corpus.
+
+Every operation is timed per call with perf_counter and summarized as
+p50/p95/p99/mean in milliseconds; the report is plain JSON so two runs
+(e.g. before/after a commit) can be diffed with compare().
+
+Runs offline: MemoryStore is used directly (no bridge, no arbitration LLM
+call) and MEMORY_ARBITRATE is forced off for anything that reads it. The
+recall cache is disabled so repeated queries measure the real pipeline.
+"""
+
+from __future__ import annotations
+
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+try:
+    from .. import holographic as hrr
+    from ..retrieval import FactRetriever
+    from ..store import MemoryStore
+    from .corpus import Corpus, generate_corpus
+except ImportError:
+    import holographic as hrr  # type: ignore[no-redef]
+    from retrieval import FactRetriever  # type: ignore[no-redef]
+    from store import MemoryStore  # type: ignore[no-redef]
+    from bench.corpus import Corpus, generate_corpus  # type: ignore[no-redef]
+
+# Operations too slow to repeat per query get a fixed number of runs.
+_HEAVY_RUNS = 3
+
+
+def summarize(samples_ms: list[float]) -> dict:
+    """Nearest-rank percentiles of a list of per-call timings (ms)."""
+    if not samples_ms:
+        return {"n": 0}
+    ordered = sorted(samples_ms)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))], 3)
+
+    return {
+        "n": len(ordered),
+        "p50": pct(50),
+        "p95": pct(95),
+        "p99": pct(99),
+        "mean": round(sum(ordered) / len(ordered), 3),
+    }
+
+
+def _timed(samples: list[float], fn: Callable, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    samples.append((time.perf_counter() - started) * 1000)
+    return result
+
+
+def _db_bytes(store: MemoryStore) -> int:
+    with store._lock:
+        store._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return sum(
+        path.stat().st_size
+        for path in (store.db_path, Path(f"{store.db_path}-wal"))
+        if path.exists()
+    )
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_benchmark(
+    n_facts: int = 5000,
+    n_queries: int = 200,
+    seed: int = 0,
+    entity_density: float = 0.5,
+    cjk_ratio: float = 0.3,
+    dim: int = 1024,
+    single_adds: int = 500,
+    batch_size: int = 100,
+    db_path: str | None = None,
+) -> dict:
+    """Load a corpus into a fresh store, time every operation, return the report.
+
+    The first `single_adds` facts go through add_fact() one commit each; the
+    rest are added `batch_size` per transaction() (the bridge `batch` path).
+    `db_path` keeps the database for inspection; default is a temp dir.
+    """
+    os.environ["MEMORY_ARBITRATE"] = "false"
+    os.environ["MEMORY_RECALL_CACHE_SIZE"] = "0"
+    corpus = generate_corpus(n_facts, seed=seed, entity_density=entity_density,
+                             cjk_ratio=cjk_ratio, n_queries=n_queries)
+    with tempfile.TemporaryDirectory(prefix="holographic-bench-") as tmp:
+        path = Path(db_path) if db_path else Path(tmp) / "memory.db"
+        if path.exists():
+            raise FileExistsError(f"{path} already exists; benchmarks need a fresh store")
+        store = MemoryStore(path, hrr_dim=dim)
+        try:
+            report = _run(store, corpus, n_queries, seed, single_adds, batch_size)
+        finally:
+            store.close()
+    report["config"] = {
+        **corpus.config,
+        "queries": n_queries,
+        "dim": dim,
+        "single_adds": min(single_adds, n_facts),
+        "batch_size": batch_size,
+    }
+    report["env"] = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "numpy": hrr.np.__version__ if hrr._HAS_NUMPY else None,
+        "machine": platform.machine(),
+    }
+    return report
+
+
+def _run(
+    store: MemoryStore,
+    corpus: Corpus,
+    n_queries: int,
+    seed: int,
+    single_adds: int,
+    batch_size: int,
+) -> dict:
+    rng = random.Random(seed + 1)
+    timings: dict[str, list[float]] = {}
+
+    def samples(name: str) -> list[float]:
+        return timings.setdefault(name, [])
+
+    load_started = time.perf_counter()
+    single, rest = corpus.facts[:single_adds], corpus.facts[single_adds:]
+    for fact in single:
+        _timed(samples("add_fact"), store.add_fact, **fact)
+    for start in range(0, len(rest), batch_size):
+        chunk = rest[start:start + batch_size]
+        started = time.perf_counter()
+        with store.transaction():
+            for fact in chunk:
+                store.add_fact(**fact)
+        elapsed = (time.perf_counter() - started) * 1000
+        samples("batch_add").append(elapsed)
+        samples("batch_add_per_fact").append(elapsed / len(chunk))
+    load_s = time.perf_counter() - load_started
+
+    retriever = FactRetriever(store, temporal_decay_half_life=0, hrr_dim=store.hrr_dim)
+    # First vector query builds the phasor matrix; time it apart from steady state.
+    _timed(samples("fact_vectors_build"), store.fact_vectors)
+
+    queries = corpus.queries[:n_queries]
+    entities = [rng.choice(corpus.entities) for _ in range(n_queries)]
+    pairs = [rng.sample(corpus.entities, 2) for _ in range(n_queries)]
+    sessions = [rng.choice(corpus.sessions) for _ in range(n_queries)]
+
+    for query in queries:
+        _timed(samples("search"), retriever.search, query, min_trust=0.0, limit=10)
+        _timed(samples("search_facts"), store.search_facts, query, min_trust=0.0, limit=10)
+    for entity in entities:
+        _timed(samples("probe"), retriever.probe, entity, limit=10)
+        _timed(samples("related"), retriever.related, entity, limit=10)
+    for pair in pairs:
+        _timed(samples("reason"), retriever.reason, pair, limit=10)
+    for user_id, thread_ts in sessions:
+        _timed(samples("session_search"), retriever.session_search,
+               thread_ts=thread_ts, user_id=user_id, limit=20)
+        _timed(samples("session_search_query"), retriever.session_search,
+               query=rng.choice(queries), thread_ts=thread_ts, limit=20)
+    for _ in range(_HEAVY_RUNS):
+        _timed(samples("contradict"), retriever.contradict, threshold=0.3, limit=10)
+        _timed(samples("rebuild_banks"), store.rebuild_banks)
+
+    live = store._conn.execute("SELECT COUNT(*) FROM facts WHERE invalid_at IS NULL").fetchone()[0]
+    entity_rows = store._conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+    return {
+        "corpus": {"facts": len(corpus.facts), "live_facts": live, "entities": entity_rows},
+        "load_s": round(load_s, 3),
+        "db_bytes": _db_bytes(store),
+        "timings_ms": {name: summarize(values) for name, values in timings.items()},
+    }
+
+
+def compare(baseline: dict, current: dict, metrics: tuple[str, ...] = ("p50", "p95", "p99")) -> dict:
+    """Per-operation current/baseline ratios (>1.0 = slower) plus DB size ratio."""
+    out: dict = {}
+    for name, stats in current.get("timings_ms", {}).items():
+        base = baseline.get("timings_ms", {}).get(name)
+        if not base:
+            continue
+        out[name] = {
+            metric: round(stats[metric] / base[metric], 3)
+            for metric in metrics
+            if stats.get(metric) and base.get(metric)
+        }
+    if baseline.get("db_bytes") and current.get("db_bytes"):
+        out["db_bytes"] = round(current["db_bytes"] / baseline["db_bytes"], 3)
+    return out
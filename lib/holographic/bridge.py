@@ -4,6 +4,7 @@ CLI bridge for Node.js ↔ Holographic memory.
 
 Usage:
     python3 bridge.py <db_path> <command> [json_args]
+    python3 bridge.py serve [--socket PATH] [--workers N]
 
 Commands:
     search          {"query": "...", "category": null, "min_trust": 0.3, "limit": 5}
@@ -14,18 +15,35 @@ Commands:
     probe           {"entity": "...", "category": null, "limit": 10}
     related         {"entity": "...", "category": null, "limit": 10}
     reason          {"entities": ["a","b"], "category": null, "limit": 10}
-    contradict      {"category": null, "threshold": 0.3, "limit": 10}
+    contradict      {"category": null, "threshold": 0.3, "limit": 10,
+                     "max_pairs": 2000000}            — whole store; null = no pair cap
     feedback        {"fact_id": 1, "helpful": true}
     remove          {"fact_id": 1}                    — default = tombstone (soft)
     tombstone       {"fact_id": 1, "superseded_by": null}
     purge           {"fact_id": 1}                    — admin/migration hard-delete
     purge_transient {"categories": [...], "max_age_days": 7}
+    rebuild_banks   {"categories": null}              — repair: full bank rebuild
+    rebuild_vectors {"dim": null, "workers": null, "resume": true}
+                                                      — re-encode every fact; progress on stderr
+    compact_vectors {"vacuum": false}                 — migrate float64 blobs to uint16
+    stats           {}                                — recall + encoder cache counters
     list            {"category": null, "min_trust": 0.0, "limit": 50}
     arbitrate       {"content": "...", "neighbors": [...]}  — debug, returns decision only
-    batch           {"operations": [...]}
+    batch           {"operations": [...]}            — add/remove, one transaction
+    multi_search    {"operations": [{"command": "search", "args": {...}}, ...]}
+                                                      — search/session_search/probe/related/
+                                                        reason in one call; results in order
 
 Output: JSON to stdout. Exit 0 on success, 1 on error.
 
+Resident mode (`serve`):
+  Keeps one warm MemoryStore per db_path and answers newline-delimited JSON
+  requests over stdin/stdout (default) or a Unix socket (--socket):
+    → {"id": 7, "db_path": "...", "command": "search", "args": {...}}
+    ← {"id": 7, "result": [...]}      or  {"id": 7, "error": "..."}
+  Requests run concurrently (--workers, default MEMORY_BRIDGE_WORKERS=4);
+  responses are matched by id. A store is reopened if its db file is replaced.
+
 Arbitration (write-time LLM curation):
   On `add`, bridge searches for up to 3 FTS5 near-neighbors (trust > 0.3).
   If neighbors exist, it calls `claude -p` (Haiku, 5s timeout) to decide
@@ -40,15 +58,21 @@ Arbitration (write-time LLM curation):
 import json
 import os
 import re
+import socketserver
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 # Allow relative imports when run as script
 sys.path.insert(0, str(Path(__file__).parent))
 
+import holographic as hrr
 from store import MemoryStore
 from retrieval import FactRetriever
 
@@ -78,6 +102,17 @@ def _log_arbitrate(event: str, **fields) -> None:
     print(json.dumps(entry, ensure_ascii=False), file=sys.stderr, flush=True)
 
 
+def _log_rebuild_progress(done: int, total: int) -> None:
+    entry = {
+        "ts": _utc_ts(),
+        "component": "rebuild_vectors",
+        "event": "progress",
+        "done": done,
+        "total": total,
+    }
+    print(json.dumps(entry), file=sys.stderr, flush=True)
+
+
 def arbitrate(content: str, neighbors: list[dict]) -> dict:
     """Ask Haiku to decide ADD/UPDATE/DELETE/NONE given a new fact + neighbors.
 
@@ -228,8 +263,7 @@ def arbitrate(content: str, neighbors: list[dict]) -> dict:
 
 # ── Add path: search neighbors → arbitrate → apply ───────────────────
 
-def apply_fact_write(
-    store: MemoryStore,
+def plan_fact_write(
     retriever: FactRetriever,
     content: str,
     category: str,
@@ -240,13 +274,11 @@ def apply_fact_write(
     source_confidence: float | None,
     skip_arbitrate: bool,
 ) -> dict:
-    """One-shot fact write with arbitration.
+    """Read-only half of a fact write: normalize args and arbitrate.
 
-    Returns a rich result dict with:
-      action: ADD|UPDATE|DELETE|NONE
-      fact_id: int|None
-      tombstoned: int (present if UPDATE or DELETE)
-      reason: str
+    Runs outside any write transaction — arbitration may spend seconds in a
+    `claude -p` subprocess and must not hold the SQLite write lock meanwhile.
+    Returns {"error": ...} or a plan for commit_fact_write().
     """
     content = (content or "").strip()
     if not content:
@@ -282,6 +314,21 @@ def apply_fact_write(
         arbitrate(content, neighbors) if neighbors else
         {"action": "ADD", "target_id": None, "reason": "no-neighbors"}
     )
+    return {
+        "content": content, "category": category, "tags": tags,
+        "source": source, "confidence": confidence,
+        "source_kind": source_kind, "source_confidence": source_confidence,
+        "decision": decision,
+    }
+
+
+def commit_fact_write(store: MemoryStore, plan: dict) -> dict:
+    """Write half of a fact write: apply an arbitration plan to the store.
+
+    Callers wrap this in store.transaction() so an UPDATE's add + tombstone
+    land atomically.
+    """
+    decision = plan["decision"]
     action = decision["action"]
 
     if action == "NONE":
@@ -299,13 +346,14 @@ def apply_fact_write(
             "reason": decision.get("reason"),
         }
 
+    fact_id = store.add_fact(
+        content=plan["content"], category=plan["category"], tags=plan["tags"],
+        source=plan["source"], confidence=plan["confidence"],
+        source_kind=plan["source_kind"], confidence_score=plan["source_confidence"],
+    )
+
     if action == "UPDATE":
         target = decision["target_id"]
-        fact_id = store.add_fact(
-            content=content, category=category, tags=tags,
-            source=source, confidence=confidence,
-            source_kind=source_kind, confidence_score=source_confidence,
-        )
         store.tombstone_fact(target, superseded_by=fact_id)
         return {
             "fact_id": fact_id, "action": "UPDATE",
@@ -314,17 +362,147 @@ def apply_fact_write(
         }
 
     # ADD (default + fallback)
-    fact_id = store.add_fact(
-        content=content, category=category, tags=tags,
-        source=source, confidence=confidence,
-        source_kind=source_kind, confidence_score=source_confidence,
-    )
     return {
         "fact_id": fact_id, "action": "ADD",
         "reason": decision.get("reason", ""),
     }
 
 
+def apply_fact_write(
+    store: MemoryStore,
+    retriever: FactRetriever,
+    content: str,
+    category: str,
+    tags: str,
+    source: str,
+    confidence: str,
+    source_kind: str,
+    source_confidence: float | None,
+    skip_arbitrate: bool,
+) -> dict:
+    """One-shot fact write with arbitration.
+
+    Returns a rich result dict with:
+      action: ADD|UPDATE|DELETE|NONE
+      fact_id: int|None
+      tombstoned: int (present if UPDATE or DELETE)
+      reason: str
+    """
+    plan = plan_fact_write(
+        retriever, content, category, tags, source, confidence,
+        source_kind, source_confidence, skip_arbitrate,
+    )
+    if "error" in plan:
+        return plan
+    with store.transaction():
+        return commit_fact_write(store, plan)
+
+
+def _plan_add_op(retriever: FactRetriever, op_args: dict) -> dict:
+    return plan_fact_write(
+        retriever,
+        content=op_args["content"],
+        category=op_args.get("category", "general"),
+        tags=op_args.get("tags", ""),
+        source=op_args.get("source", "unknown"),
+        confidence=op_args.get("confidence", "default"),
+        source_kind=op_args.get("source_kind", "extracted"),
+        source_confidence=op_args.get("source_confidence"),
+        skip_arbitrate=op_args.get("skip_arbitrate", False),
+    )
+
+
+def run_batch(store: MemoryStore, retriever: FactRetriever, operations: list[dict]) -> list:
+    """Apply a list of add/remove operations as one unit of work.
+
+    All arbitration happens first (no write lock held); every write then lands
+    in a single transaction, so a batch costs one commit instead of several
+    per fact. Neighbors for arbitration are read from the store as it was
+    before the batch.
+    """
+    planned: list[tuple[str, dict]] = []
+    for op in operations:
+        cmd = op["command"]
+        op_args = op.get("args", {})
+        if cmd == "add":
+            plan = _plan_add_op(retriever, op_args)
+            planned.append(("error", plan) if "error" in plan else ("add", plan))
+        elif cmd == "remove":
+            planned.append(("remove", op_args))
+        else:
+            planned.append(("error", {"error": f"Unsupported batch command: {cmd}"}))
+
+    results = []
+    with store.transaction():
+        for kind, payload in planned:
+            if kind == "add":
+                results.append(commit_fact_write(store, payload))
+            elif kind == "remove":
+                ok = store.tombstone_fact(payload["fact_id"])
+                results.append({"tombstoned": ok})
+            else:
+                results.append(payload)
+    return results
+
+
+MULTI_SEARCH_COMMANDS = frozenset({"search", "session_search", "probe", "related", "reason"})
+
+
+def run_multi_search(store: MemoryStore, retriever: FactRetriever, operations: list[dict]) -> list:
+    """Run a list of read-only recall operations in one process, in order.
+
+    Each op is {"command": "search"|"session_search"|"probe"|"related"|"reason",
+    "args": {...}} with the same args as the standalone command. Identical ops
+    run once, and the distinct search queries are HRR-encoded in a single
+    encode_texts() pass. One failing op yields {"error": ...} in its slot
+    without affecting the others.
+    """
+    keys: list[str | None] = []
+    unique: dict[str, tuple[str, dict]] = {}
+    for op in operations:
+        cmd = op.get("command")
+        op_args = op.get("args", {})
+        if cmd not in MULTI_SEARCH_COMMANDS:
+            keys.append(None)
+            continue
+        key = json.dumps([cmd, op_args], sort_keys=True, ensure_ascii=False)
+        keys.append(key)
+        unique.setdefault(key, (cmd, op_args))
+
+    query_vectors: dict[str, object] = {}
+    if hrr._HAS_NUMPY and retriever.hrr_weight > 0:
+        queries = list(dict.fromkeys(
+            op_args.get("query", "") for cmd, op_args in unique.values() if cmd == "search"
+        ))
+        if queries:
+            query_vectors = dict(zip(queries, hrr.encode_texts(queries, retriever.hrr_dim)))
+
+    computed: dict[str, object] = {}
+    for key, (cmd, op_args) in unique.items():
+        try:
+            if cmd == "search":
+                query = op_args.get("query", "")
+                computed[key] = retriever.search(
+                    query=query,
+                    category=op_args.get("category"),
+                    min_trust=op_args.get("min_trust", 0.3),
+                    limit=op_args.get("limit", 5),
+                    query_vector=query_vectors.get(query),
+                )
+            else:
+                computed[key] = dispatch(store, retriever, cmd, op_args)
+        except Exception as exc:
+            computed[key] = {"error": str(exc)}
+
+    results = []
+    for op, key in zip(operations, keys):
+        if key is None:
+            results.append({"error": f"Unsupported multi_search command: {op.get('command')}"})
+        else:
+            results.append(computed[key])
+    return results
+
+
 # ── Importable API ───────────────────────────────────────────────────
 
 def search(
@@ -353,7 +531,316 @@ def search(
 
 # ── Command dispatch ─────────────────────────────────────────────────
 
+def dispatch(store: MemoryStore, retriever: FactRetriever, command: str, args: dict):
+    """Run one bridge command against an open store and return its result.
+
+    Shared by the one-shot CLI and the resident `serve` mode so both speak
+    exactly the same command set.
+    """
+    if command == "search":
+        return retriever.search(
+            query=args.get("query", ""),
+            category=args.get("category"),
+            min_trust=args.get("min_trust", 0.3),
+            limit=args.get("limit", 5),
+        )
+    if command == "add":
+        return apply_fact_write(
+            store, retriever,
+            content=args["content"],
+            category=args.get("category", "general"),
+            tags=args.get("tags", ""),
+            source=args.get("source", "unknown"),
+            confidence=args.get("confidence", "default"),
+            source_kind=args.get("source_kind", "extracted"),
+            source_confidence=args.get("source_confidence"),
+            skip_arbitrate=args.get("skip_arbitrate", False),
+        )
+    if command == "session_search":
+        return retriever.session_search(
+            query=args.get("query", ""),
+            thread_ts=args.get("thread_ts"),
+            user_id=args.get("user_id"),
+            min_trust=args.get("min_trust", 0.0),
+            limit=args.get("limit", 20),
+        )
+    if command == "probe":
+        return retriever.probe(
+            entity=args["entity"],
+            category=args.get("category"),
+            limit=args.get("limit", 10),
+        )
+    if command == "related":
+        return retriever.related(
+            entity=args["entity"],
+            category=args.get("category"),
+            limit=args.get("limit", 10),
+        )
+    if command == "reason":
+        return retriever.reason(
+            entities=args["entities"],
+            category=args.get("category"),
+            limit=args.get("limit", 10),
+        )
+    if command == "contradict":
+        return retriever.contradict(
+            category=args.get("category"),
+            threshold=args.get("threshold", 0.3),
+            limit=args.get("limit", 10),
+            max_pairs=args.get("max_pairs", 2_000_000),
+        )
+    if command == "feedback":
+        return store.record_feedback(
+            fact_id=args["fact_id"],
+            helpful=args["helpful"],
+        )
+    if command == "remove":
+        # Default soft-delete — backwards-compat name, now tombstones.
+        ok = store.tombstone_fact(args["fact_id"])
+        return {"tombstoned": ok}
+    if command == "tombstone":
+        ok = store.tombstone_fact(
+            args["fact_id"],
+            superseded_by=args.get("superseded_by"),
+        )
+        return {"tombstoned": ok}
+    if command == "purge":
+        ok = store.purge_fact(args["fact_id"])
+        return {"purged": ok}
+    if command == "purge_transient":
+        n = store.purge_transient(
+            categories=tuple(args.get("categories", ["transient_state", "session_context"])),
+            max_age_days=args.get("max_age_days", 7),
+        )
+        return {"purged": n}
+    if command == "rebuild_banks":
+        return store.rebuild_banks(categories=args.get("categories"))
+    if command == "rebuild_vectors":
+        dim = args.get("dim")
+        workers = args.get("workers")
+        # The resident bridge keeps this retriever warm: it must encode queries
+        # at the store's dim, including for requests served during the rebuild.
+        if dim is not None:
+            retriever.hrr_dim = int(dim)
+        try:
+            processed = store.rebuild_all_vectors(
+                dim=int(dim) if dim is not None else None,
+                workers=int(workers) if workers is not None else None,
+                resume=bool(args.get("resume", True)),
+                progress=_log_rebuild_progress,
+            )
+        finally:
+            retriever.hrr_dim = store.hrr_dim
+        return {"processed": processed, "dim": store.hrr_dim}
+    if command == "compact_vectors":
+        return store.compact_vectors(vacuum=bool(args.get("vacuum", False)))
+    if command == "stats":
+        return {"recall_cache": retriever.cache_stats(), "atom_cache": hrr.atom_cache_info()}
+    if command == "arbitrate":
+        return arbitrate(args["content"], args.get("neighbors", []))
+    if command == "batch":
+        return run_batch(store, retriever, args.get("operations", []))
+    if command == "multi_search":
+        return run_multi_search(store, retriever, args.get("operations", []))
+    if command == "list":
+        return store.list_facts(
+            category=args.get("category"),
+            min_trust=args.get("min_trust", 0.0),
+            limit=args.get("limit", 50),
+            offset=int(args.get("offset", 0)),
+        )
+    return {"error": f"Unknown command: {command}"}
+
+
+# ── Resident server mode ─────────────────────────────────────────────
+
+class _PoolEntry:
+    __slots__ = ("store", "retriever", "identity", "refs", "retired")
+
+    def __init__(self, store: MemoryStore, retriever: FactRetriever, identity: tuple | None) -> None:
+        self.store = store
+        self.retriever = retriever
+        self.identity = identity
+        self.refs = 0
+        self.retired = False
+
+
+class _StorePool:
+    """Warm MemoryStore + FactRetriever per db_path for the resident bridge.
+
+    A store is reopened when its db file is replaced (restore from backup,
+    migration that swaps the file) — detected via the (device, inode) pair.
+    Commits from other processes are already visible through WAL, so an
+    ordinary external write does not need a reopen.
+
+    Stores are reference-counted per request: a replaced store is retired
+    from the pool at once but only closed when its last in-flight request
+    releases it, so a reopen never pulls a store out from under another
+    request thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, _PoolEntry] = {}
+
+    @staticmethod
+    def _identity(path: Path) -> tuple | None:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    @staticmethod
+    def _close(entry: _PoolEntry) -> None:
+        with entry.store._lock:
+            entry.store.close()
+
+    @contextmanager
+    def acquire(self, db_path: str) -> Iterator[tuple[MemoryStore, FactRetriever]]:
+        resolved = Path(db_path).expanduser()
+        key = str(resolved)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.identity is None or self._identity(resolved) != entry.identity):
+                entry.retired = True
+                del self._entries[key]
+                if entry.refs == 0:
+                    self._close(entry)
+                entry = None
+            if entry is None:
+                store = MemoryStore(db_path=resolved)
+                # temporal_decay_half_life=0 — decay is disabled project-wide
+                retriever = FactRetriever(store, temporal_decay_half_life=0)
+                entry = _PoolEntry(store, retriever, self._identity(resolved))
+                self._entries[key] = entry
+            entry.refs += 1
+        try:
+            yield entry.store, entry.retriever
+        finally:
+            with self._lock:
+                entry.refs -= 1
+                if entry.retired and entry.refs == 0:
+                    self._close(entry)
+
+    def close_all(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                entry.retired = True
+                if entry.refs == 0:
+                    self._close(entry)
+            self._entries.clear()
+
+
+def _handle_request(pool: _StorePool, line: str) -> dict:
+    """Decode one NDJSON request line and run it. Never raises."""
+    request_id = None
+    try:
+        request = json.loads(line)
+        request_id = request.get("id")
+        command = request["command"]
+        if command == "ping":
+            return {"id": request_id, "result": {"ok": True, "pid": os.getpid()}}
+        with pool.acquire(request["db_path"]) as (store, retriever):
+            result = dispatch(store, retriever, command, request.get("args") or {})
+        return {"id": request_id, "result": result}
+    except Exception as e:
+        return {"id": request_id, "error": str(e)}
+
+
+def _encode_response(response: dict) -> bytes:
+    return (json.dumps(response, default=str, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _serve_stream(pool: _StorePool, executor: ThreadPoolExecutor, rfile, wfile) -> None:
+    """Read NDJSON requests from rfile, answer on wfile as each one finishes.
+
+    Requests run concurrently on the executor, so responses may come back out
+    of order — callers match them by `id`.
+    """
+    write_lock = threading.Lock()
+    pending = []
+
+    def respond(line: str) -> None:
+        payload = _encode_response(_handle_request(pool, line))
+        with write_lock:
+            try:
+                wfile.write(payload)
+                wfile.flush()
+            except (BrokenPipeError, ValueError, OSError):
+                pass
+
+    for raw in rfile:
+        line = raw.decode("utf-8", errors="replace").strip() if isinstance(raw, bytes) else raw.strip()
+        if not line:
+            continue
+        pending.append(executor.submit(respond, line))
+        pending = [f for f in pending if not f.done()]
+
+    for future in pending:
+        future.result()
+
+
+def serve(socket_path: str | None = None, workers: int = 4) -> int:
+    """Resident bridge: one warm store per db_path, NDJSON requests.
+
+    Request:  {"id": 1, "db_path": "...", "command": "search", "args": {...}}
+    Response: {"id": 1, "result": ...}  or  {"id": 1, "error": "..."}
+
+    Without socket_path the protocol runs over stdin/stdout and the server
+    exits at stdin EOF (i.e. when the parent process goes away).
+    """
+    pool = _StorePool()
+    executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="bridge")
+    try:
+        if socket_path is None:
+            _serve_stream(pool, executor, sys.stdin.buffer, sys.stdout.buffer)
+            return 0
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                _serve_stream(pool, executor, self.rfile, self.wfile)
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        with socketserver.ThreadingUnixStreamServer(socket_path, _Handler) as server:
+            server.daemon_threads = True
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                try:
+                    os.unlink(socket_path)
+                except OSError:
+                    pass
+        return 0
+    finally:
+        executor.shutdown(wait=True)
+        pool.close_all()
+
+
+def _parse_serve_args(argv: list[str]) -> tuple[str | None, int]:
+    socket_path = None
+    workers = int(os.environ.get("MEMORY_BRIDGE_WORKERS", "4"))
+    i = 0
+    while i < len(argv):
+        if argv[i] == "--socket" and i + 1 < len(argv):
+            socket_path = argv[i + 1]
+            i += 2
+        elif argv[i] == "--workers" and i + 1 < len(argv):
+            workers = int(argv[i + 1])
+            i += 2
+        else:
+            i += 1
+    return socket_path, workers
+
+
 def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "serve":
+        socket_path, workers = _parse_serve_args(sys.argv[2:])
+        sys.exit(serve(socket_path=socket_path, workers=workers))
+
     if len(sys.argv) < 3:
         print(json.dumps({"error": "Usage: bridge.py <db_path> <command> [json_args]"}))
         sys.exit(1)
@@ -366,117 +853,7 @@ def main():
         store = MemoryStore(db_path=db_path)
         # temporal_decay_half_life=0 — decay is disabled project-wide
         retriever = FactRetriever(store, temporal_decay_half_life=0)
-
-        if command == "search":
-            result = retriever.search(
-                query=args.get("query", ""),
-                category=args.get("category"),
-                min_trust=args.get("min_trust", 0.3),
-                limit=args.get("limit", 5),
-            )
-        elif command == "add":
-            result = apply_fact_write(
-                store, retriever,
-                content=args["content"],
-                category=args.get("category", "general"),
-                tags=args.get("tags", ""),
-                source=args.get("source", "unknown"),
-                confidence=args.get("confidence", "default"),
-                source_kind=args.get("source_kind", "extracted"),
-                source_confidence=args.get("source_confidence"),
-                skip_arbitrate=args.get("skip_arbitrate", False),
-            )
-        elif command == "session_search":
-            result = retriever.session_search(
-                query=args.get("query", ""),
-                thread_ts=args.get("thread_ts"),
-                user_id=args.get("user_id"),
-                min_trust=args.get("min_trust", 0.0),
-                limit=args.get("limit", 20),
-            )
-        elif command == "probe":
-            result = retriever.probe(
-                entity=args["entity"],
-                category=args.get("category"),
-                limit=args.get("limit", 10),
-            )
-        elif command == "related":
-            result = retriever.related(
-                entity=args["entity"],
-                category=args.get("category"),
-                limit=args.get("limit", 10),
-            )
-        elif command == "reason":
-            result = retriever.reason(
-                entities=args["entities"],
-                category=args.get("category"),
-                limit=args.get("limit", 10),
-            )
-        elif command == "contradict":
-            result = retriever.contradict(
-                category=args.get("category"),
-                threshold=args.get("threshold", 0.3),
-                limit=args.get("limit", 10),
-            )
-        elif command == "feedback":
-            result = store.record_feedback(
-                fact_id=args["fact_id"],
-                helpful=args["helpful"],
-            )
-        elif command == "remove":
-            # Default soft-delete — backwards-compat name, now tombstones.
-            ok = store.tombstone_fact(args["fact_id"])
-            result = {"tombstoned": ok}
-        elif command == "tombstone":
-            ok = store.tombstone_fact(
-                args["fact_id"],
-                superseded_by=args.get("superseded_by"),
-            )
-            result = {"tombstoned": ok}
-        elif command == "purge":
-            ok = store.purge_fact(args["fact_id"])
-            result = {"purged": ok}
-        elif command == "purge_transient":
-            n = store.purge_transient(
-                categories=tuple(args.get("categories", ["transient_state", "session_context"])),
-                max_age_days=args.get("max_age_days", 7),
-            )
-            result = {"purged": n}
-        elif command == "arbitrate":
-            result = arbitrate(args["content"], args.get("neighbors", []))
-        elif command == "batch":
-            results = []
-            for op in args.get("operations", []):
-                cmd = op["command"]
-                op_args = op.get("args", {})
-                if cmd == "add":
-                    results.append(apply_fact_write(
-                        store, retriever,
-                        content=op_args["content"],
-                        category=op_args.get("category", "general"),
-                        tags=op_args.get("tags", ""),
-                        source=op_args.get("source", "unknown"),
-                        confidence=op_args.get("confidence", "default"),
-                        source_kind=op_args.get("source_kind", "extracted"),
-                        source_confidence=op_args.get("source_confidence"),
-                        skip_arbitrate=op_args.get("skip_arbitrate", False),
-                    ))
-                elif cmd == "remove":
-                    ok = store.tombstone_fact(op_args["fact_id"])
-                    results.append({"tombstoned": ok})
-                else:
-                    results.append({"error": f"Unsupported batch command: {cmd}"})
-            result = results
-        elif command == "list":
-            result = store.list_facts(
-                category=args.get("category"),
-                min_trust=args.get("min_trust", 0.0),
-                limit=args.get("limit", 50),
-                offset=int(args.get("offset", 0)),
-            )
-        else:
-            result = {"error": f"Unknown command: {command}"}
-
+        result = dispatch(store, retriever, command, args)
         store.close()
         print(json.dumps(result, default=str, ensure_ascii=False))
 
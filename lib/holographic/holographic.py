@@ -12,14 +12,17 @@ Phase encoding is numerically stable, avoids the magnitude collapse of
 traditional complex-number HRRs, and maps cleanly to cosine similarity.
 
 Atoms are generated deterministically from SHA-256 so representations are
-identical across processes, machines, and language versions.
+identical across processes, machines, and language versions. They are
+memoized in-process (HOLOGRAPHIC_ATOM_CACHE_SIZE entries, default 4096).
 
 References:
   Plate (1995) — Holographic Reduced Representations
   Gayler (2004) — Vector Symbolic Architectures answer Jackendoff's challenges
 """
 
+import functools
 import hashlib
+import itertools
 import logging
 import struct
 import math
@@ -38,6 +41,13 @@ logger = logging.getLogger(__name__)
 
 _TWO_PI = 2.0 * math.pi
 
+# Rows per cos/sin block when bundling an (n, dim) array.
+_BUNDLE_CHUNK = 256
+
+# Atom vectors are pure functions of (word, dim) and chat tokens repeat
+# heavily, so encode_atom() memoizes them. 0 disables the cache.
+_ATOM_CACHE_SIZE = int(os.environ.get("HOLOGRAPHIC_ATOM_CACHE_SIZE", "4096"))
+
 
 def _require_numpy() -> None:
     if not _HAS_NUMPY:
@@ -45,6 +55,16 @@ def _require_numpy() -> None:
 
 
 def encode_atom(word: str, dim: int = 1024) -> "np.ndarray":
+    """Deterministic phase vector for `word`, memoized by (word, dim).
+
+    The returned array is shared and read-only; copy it before mutating.
+    See _hash_atom() for the encoding.
+    """
+    _require_numpy()
+    return _cached_atom(word, dim)
+
+
+def _hash_atom(word: str, dim: int) -> "np.ndarray":
     """Deterministic phase vector via SHA-256 counter blocks.
 
     Uses hashlib (not numpy RNG) for cross-platform reproducibility.
@@ -54,10 +74,8 @@ def encode_atom(word: str, dim: int = 1024) -> "np.ndarray":
     - Concatenate digests, interpret as uint16 values via struct.unpack
     - Scale to [0, 2π): phases = values * (2π / 65536)
     - Truncate to dim elements
-    - Returns np.float64 array of shape (dim,)
+    - Returns read-only np.float64 array of shape (dim,)
     """
-    _require_numpy()
-
     # Each SHA-256 digest is 32 bytes = 16 uint16 values.
     values_per_block = 16
     blocks_needed = math.ceil(dim / values_per_block)
@@ -68,9 +86,46 @@ def encode_atom(word: str, dim: int = 1024) -> "np.ndarray":
         uint16_values.extend(struct.unpack("<16H", digest))
 
     phases = np.array(uint16_values[:dim], dtype=np.float64) * (_TWO_PI / 65536.0)
+    phases.flags.writeable = False
     return phases
 
 
+_cached_atom = functools.lru_cache(maxsize=max(_ATOM_CACHE_SIZE, 0))(_hash_atom)
+
+
+def _atom_phasor(word: str, dim: int) -> "np.ndarray":
+    """exp(i·atom) for a token — what encode_text() actually sums."""
+    phasor = np.exp(1j * _cached_atom(word, dim))
+    phasor.flags.writeable = False
+    return phasor
+
+
+_cached_atom_phasor = functools.lru_cache(maxsize=max(_ATOM_CACHE_SIZE, 0))(_atom_phasor)
+
+
+def atom_cache_info() -> dict:
+    """Hit/miss counters and occupancy of the encode_atom() cache.
+
+    phasor_* counters cover the exp(i·atom) cache used by encode_text().
+    """
+    info = _cached_atom.cache_info()
+    phasor_info = _cached_atom_phasor.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "phasor_hits": phasor_info.hits,
+        "phasor_misses": phasor_info.misses,
+        "phasor_size": phasor_info.currsize,
+    }
+
+
+def clear_atom_cache() -> None:
+    _cached_atom.cache_clear()
+    _cached_atom_phasor.cache_clear()
+
+
 def bind(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
     """Circular convolution = element-wise phase addition.
 
@@ -96,9 +151,54 @@ def bundle(*vectors: "np.ndarray") -> "np.ndarray":
 
     Bundling merges multiple vectors into one that is similar to each input.
     The result can hold O(sqrt(dim)) items before similarity degrades.
+    Accepts the same inputs as bundle_sum().
     """
     _require_numpy()
-    complex_sum = np.sum([np.exp(1j * v) for v in vectors], axis=0)
+    return sum_to_phases(bundle_sum(*vectors))
+
+
+def bundle_sum(*vectors: "np.ndarray") -> "np.ndarray":
+    """Un-normalized superposition: the complex sum of unit phasors.
+
+    Unlike the phase vector returned by bundle(), this sum is additive —
+    bundle_sum(a, b) == bundle_sum(a) + bundle_sum(b) — so a stored sum can be
+    updated with deltas when items join or leave a bundle.
+
+    Takes phase vectors as separate arguments, a single (n, dim) array, or a
+    single iterable of vectors (consumed lazily). cos/sin are accumulated in
+    place in preallocated buffers, so no per-item complex temporaries.
+    """
+    _require_numpy()
+    if len(vectors) == 1 and not (isinstance(vectors[0], np.ndarray) and vectors[0].ndim == 1):
+        source = vectors[0]
+    else:
+        source = vectors
+
+    if isinstance(source, np.ndarray) and source.ndim == 2:
+        if not len(source):
+            raise ValueError("bundle_sum() of no vectors")
+        rows = (source[start:start + _BUNDLE_CHUNK] for start in range(0, len(source), _BUNDLE_CHUNK))
+    else:
+        rows = (np.asarray(v, dtype=np.float64)[np.newaxis] for v in source)
+
+    real = imag = scratch = None
+    for block in rows:
+        if real is None:
+            dim = block.shape[1]
+            real = np.zeros(dim)
+            imag = np.zeros(dim)
+        if scratch is None or scratch.shape != block.shape:
+            scratch = np.empty(block.shape)
+        real += np.cos(block, out=scratch).sum(axis=0)
+        imag += np.sin(block, out=scratch).sum(axis=0)
+    if real is None:
+        raise ValueError("bundle_sum() of no vectors")
+    return real + 1j * imag
+
+
+def sum_to_phases(complex_sum: "np.ndarray") -> "np.ndarray":
+    """Project a bundle_sum() result back onto a phase vector."""
+    _require_numpy()
     return np.angle(complex_sum) % _TWO_PI
 
 
@@ -112,6 +212,33 @@ def similarity(a: "np.ndarray", b: "np.ndarray") -> float:
     return float(np.mean(np.cos(a - b)))
 
 
+def phases_to_phasors(phases: "np.ndarray") -> "np.ndarray":
+    """Unit phasors exp(iφ) as complex64 — the embedding used for batch scoring.
+
+    Works on a single vector or an (n, dim) matrix of phase vectors.
+    """
+    _require_numpy()
+    return np.exp(1j * np.asarray(phases, dtype=np.float64)).astype(np.complex64)
+
+
+def batch_similarity(phasors: "np.ndarray", queries: "np.ndarray") -> "np.ndarray":
+    """similarity() of every row of a phasor matrix against one or more queries.
+
+    mean(cos(a - b)) == Re(mean(exp(ia) · exp(-ib))), so scoring n facts
+    against k query phase vectors is a single (n, dim) @ (dim, k) product.
+
+    phasors: (n, dim) complex matrix from phases_to_phasors().
+    queries: (dim,) or (k, dim) phase vectors.
+    Returns (n,) for a single query, (n, k) otherwise.
+    """
+    _require_numpy()
+    q = np.asarray(queries, dtype=np.float64)
+    single = q.ndim == 1
+    conj = np.exp(-1j * np.atleast_2d(q)).astype(phasors.dtype)
+    sims = (phasors @ conj.T).real / phasors.shape[1]
+    return sims[:, 0] if single else sims
+
+
 def encode_text(text: str, dim: int = 1024) -> "np.ndarray":
     """Bag-of-words: bundle of atom vectors for each token.
 
@@ -122,18 +249,39 @@ def encode_text(text: str, dim: int = 1024) -> "np.ndarray":
     If text is empty or produces no tokens, returns encode_atom("__hrr_empty__", dim).
     """
     _require_numpy()
+    return _encode_tokens(_text_tokens(text), dim, np.empty(dim, dtype=np.complex128))
+
 
+def encode_texts(texts: "list[str]", dim: int = 1024) -> "np.ndarray":
+    """Batch encode_text(): returns an (n, dim) array, row i == encode_text(texts[i]).
+
+    Reuses one accumulator across texts and the shared atom-phasor cache, so a
+    token costs one complex add instead of a hash + exp per occurrence.
+    """
+    _require_numpy()
+    out = np.empty((len(texts), dim), dtype=np.float64)
+    acc = np.empty(dim, dtype=np.complex128)
+    for i, text in enumerate(texts):
+        out[i] = _encode_tokens(_text_tokens(text), dim, acc)
+    return out
+
+
+def _text_tokens(text: str) -> list[str]:
     tokens = [
         token.strip(".,!?;:\"'()[]{}")
         for token in text.lower().split()
     ]
-    tokens = [t for t in tokens if t]
+    return [t for t in tokens if t]
 
-    if not tokens:
-        return encode_atom("__hrr_empty__", dim)
 
-    atom_vectors = [encode_atom(token, dim) for token in tokens]
-    return bundle(*atom_vectors)
+def _encode_tokens(tokens: list[str], dim: int, acc: "np.ndarray") -> "np.ndarray":
+    """Bundle token atoms by summing cached phasors into `acc` (clobbered)."""
+    if not tokens:
+        return encode_atom("__hrr_empty__", dim).copy()
+    acc.fill(0)
+    for token in tokens:
+        acc += _cached_atom_phasor(token, dim)
+    return sum_to_phases(acc)
 
 
 def encode_fact(content: str, entities: list[str], dim: int = 1024) -> "np.ndarray":
@@ -154,30 +302,156 @@ def encode_fact(content: str, entities: list[str], dim: int = 1024) -> "np.ndarr
     role_content = encode_atom("__hrr_role_content__", dim)
     role_entity = encode_atom("__hrr_role_entity__", dim)
 
-    components: list[np.ndarray] = [
-        bind(encode_text(content, dim), role_content)
+    content_component = bind(encode_text(content, dim), role_content)
+    entity_components = (bind(encode_atom(entity.lower(), dim), role_entity) for entity in entities)
+    return bundle(itertools.chain((content_component,), entity_components))
+
+
+def encode_fact_batch(
+    items: "list[tuple[int, str, list[str]]]", dim: int = 1024
+) -> "list[tuple[bytes, int]]":
+    """encode_fact() over [(fact_id, content, entities), ...] → [(blob, fact_id), ...].
+
+    Module-level and pure so it can run in a worker process; the output is
+    ready for `UPDATE facts SET hrr_vector = ? WHERE fact_id = ?` executemany.
+    """
+    _require_numpy()
+    return [
+        (phases_to_bytes(encode_fact(content, entities, dim)), fact_id)
+        for fact_id, content, entities in items
     ]
 
-    for entity in entities:
-        components.append(bind(encode_atom(entity.lower(), dim), role_entity))
 
-    return bundle(*components)
+# Vector blob format. Version 1 stores phases quantized to uint16 — the same
+# 2π/65536 resolution encode_atom() produces — behind a 4-byte header:
+#   magic b"H" | encoding (1 = uint16 phases) | dim (uint16 LE) | dim × uint16 LE
+# 2 KB + 4 at dim=1024. Headerless blobs are the legacy raw float64 format
+# (8 KB at dim=1024); readers accept both, writers emit only version 1.
+_BLOB_HEADER = struct.Struct("<cBH")
+_BLOB_MAGIC = b"H"
+_BLOB_ENCODING_U16 = 1
+_PHASE_STEP = _TWO_PI / 65536.0
+_PHASOR_LUT: "np.ndarray | None" = None
+
+
+def _blob_header(data: bytes) -> int | None:
+    """dim of a version-1 blob, or None for a legacy float64 blob."""
+    if len(data) < _BLOB_HEADER.size:
+        return None
+    magic, encoding, dim = _BLOB_HEADER.unpack_from(data)
+    if (magic == _BLOB_MAGIC and encoding == _BLOB_ENCODING_U16
+            and len(data) == _BLOB_HEADER.size + 2 * dim):
+        return dim
+    return None
+
+
+def is_compact_blob(data: bytes) -> bool:
+    return _blob_header(data) is not None
+
+
+def blob_dim(data: bytes) -> int:
+    """Vector dimension of a stored blob, in either format."""
+    dim = _blob_header(data)
+    return dim if dim is not None else len(data) // 8
 
 
 def phases_to_bytes(phases: "np.ndarray") -> bytes:
-    """Serialize phase vector to bytes. float64 tobytes — 8 KB at dim=1024."""
+    """Serialize a phase vector as a version-1 blob (uint16 quantized)."""
     _require_numpy()
-    return phases.tobytes()
+    quantized = np.rint(np.mod(phases, _TWO_PI) / _PHASE_STEP).astype(np.uint32) & 0xFFFF
+    header = _BLOB_HEADER.pack(_BLOB_MAGIC, _BLOB_ENCODING_U16, len(phases))
+    return header + quantized.astype("<u2").tobytes()
+
+
+def _blob_codes(data: bytes) -> "np.ndarray | None":
+    """Zero-copy uint16 view over a version-1 payload; None if legacy."""
+    if _blob_header(data) is None:
+        return None
+    return np.frombuffer(data, dtype="<u2", offset=_BLOB_HEADER.size)
 
 
 def bytes_to_phases(data: bytes) -> "np.ndarray":
-    """Deserialize bytes back to phase vector. Inverse of phases_to_bytes.
+    """Deserialize a blob back to a float64 phase vector. Inverse of phases_to_bytes.
 
-    The .copy() call is required because frombuffer returns a read-only view
-    backed by the bytes object; callers expect a mutable array.
+    Accepts legacy float64 blobs. Always returns a fresh, writable array —
+    frombuffer views are read-only and backed by the bytes object.
     """
     _require_numpy()
-    return np.frombuffer(data, dtype=np.float64).copy()
+    codes = _blob_codes(data)
+    if codes is None:
+        return np.frombuffer(data, dtype=np.float64).copy()
+    return codes * _PHASE_STEP
+
+
+def blobs_to_phasors(blobs: list[bytes], dim: int) -> "np.ndarray":
+    """Decode blobs straight to an (n, dim) complex64 unit-phasor matrix.
+
+    Version-1 blobs skip the float64 round trip: their uint16 codes index a
+    65536-entry exp(iφ) lookup table.
+    """
+    _require_numpy()
+    global _PHASOR_LUT
+    if _PHASOR_LUT is None:
+        _PHASOR_LUT = np.exp(1j * np.arange(65536) * _PHASE_STEP).astype(np.complex64)
+    out = np.empty((len(blobs), dim), dtype=np.complex64)
+    for i, data in enumerate(blobs):
+        codes = _blob_codes(data)
+        if codes is None:
+            out[i] = np.exp(1j * np.frombuffer(data, dtype=np.float64))
+        else:
+            out[i] = _PHASOR_LUT[codes]
+    return out
+
+
+def compact_blobs(conn: sqlite3.Connection, chunk_size: int = 500) -> dict:
+    """Rewrite legacy float64 vectors in facts and memory_banks as version-1 blobs.
+
+    Idempotent; already-compact rows are skipped. Does not commit — the
+    caller owns the transaction. Returns per-table rewrite counts.
+    """
+    _require_numpy()
+    counts = {}
+    for table, key, column in (
+        ("facts", "fact_id", "hrr_vector"),
+        ("memory_banks", "bank_id", "vector"),
+    ):
+        rewritten = 0
+        last_key = None
+        while True:
+            rows = conn.execute(
+                f"SELECT {key}, {column} FROM {table} "
+                f"WHERE {column} IS NOT NULL AND (? IS NULL OR {key} > ?) "
+                f"ORDER BY {key} LIMIT ?",
+                (last_key, last_key, chunk_size),
+            ).fetchall()
+            if not rows:
+                break
+            last_key = rows[-1][0]
+            updates = [
+                (phases_to_bytes(bytes_to_phases(blob)), row_key)
+                for row_key, blob in rows
+                if not is_compact_blob(blob)
+            ]
+            if updates:
+                conn.executemany(
+                    f"UPDATE {table} SET {column} = ? WHERE {key} = ?", updates
+                )
+                rewritten += len(updates)
+        counts[table] = rewritten
+    return counts
+
+
+def complex_to_bytes(values: "np.ndarray") -> bytes:
+    """Serialize a bundle_sum() accumulator. complex128 — kept at full precision
+    so repeated delta updates do not drift."""
+    _require_numpy()
+    return np.asarray(values, dtype=np.complex128).tobytes()
+
+
+def bytes_to_complex(data: bytes) -> "np.ndarray":
+    """Deserialize a bundle_sum() accumulator. Inverse of complex_to_bytes."""
+    _require_numpy()
+    return np.frombuffer(data, dtype=np.complex128).copy()
 
 
 def snr_estimate(dim: int, n_items: int) -> float:
@@ -225,7 +499,29 @@ def _print_info(db_path: str | None = None) -> int:
         conn.close()
 
 
+def _compact(db_path: str | None = None) -> int:
+    resolved_db = db_path or os.environ.get("HOLOGRAPHIC_DB") or str(
+        Path.home() / "Orb" / "profiles" / "karry" / "data" / "memory.db"
+    )
+    conn = sqlite3.connect(resolved_db)
+    try:
+        before = Path(resolved_db).stat().st_size
+        with conn:
+            counts = compact_blobs(conn)
+        conn.execute("VACUUM")
+        after = Path(resolved_db).stat().st_size
+        print(f"db_path: {resolved_db}")
+        print(f"rewrote {counts['facts']} fact vectors, {counts['memory_banks']} bank vectors")
+        print(f"size: {before} -> {after} bytes")
+        return 0
+    finally:
+        conn.close()
+
+
 if __name__ == "__main__":
     if len(sys.argv) >= 2 and sys.argv[1] == "info":
         db_arg = sys.argv[2] if len(sys.argv) >= 3 else None
         raise SystemExit(_print_info(db_arg))
+    if len(sys.argv) >= 2 and sys.argv[1] == "compact":
+        db_arg = sys.argv[2] if len(sys.argv) >= 3 else None
+        raise SystemExit(_compact(db_arg))
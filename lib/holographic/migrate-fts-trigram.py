@@ -51,7 +51,7 @@ def migrate(db_path):
         END
     """)
     conn.execute("""
-        CREATE TRIGGER facts_au AFTER UPDATE ON facts BEGIN
+        CREATE TRIGGER facts_au AFTER UPDATE OF content, tags ON facts BEGIN
             INSERT INTO facts_fts(facts_fts, rowid, content, tags)
                 VALUES ('delete', old.fact_id, old.content, old.tags);
             INSERT INTO facts_fts(rowid, content, tags)
@@ -6,17 +6,55 @@ Jaccard similarity reranking and trust-weighted scoring.
 
 from __future__ import annotations
 
+import heapq
+import json
+import logging
 import math
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
-    from .store import MemoryStore
+    import numpy as np
+
+    from .store import FactVectors, MemoryStore
 
 try:
     from . import holographic as hrr
+    from .store import fact_token_hashes, search_tokens, token_hashes
 except ImportError:
     import holographic as hrr  # type: ignore[no-redef]
+    from store import fact_token_hashes, search_tokens, token_hashes  # type: ignore[no-redef]
+
+logger = logging.getLogger(__name__)
+
+# Pairs compared by contradict() before it stops (None = no limit).
+_CONTRADICT_MAX_PAIRS = 2_000_000
+
+# Reciprocal-rank fusion constant (Cormack et al. 2009).
+_RRF_K = 60
+_FUSION_MODES = ("weighted", "rrf")
+
+
+def _unpack_hashes(blob: bytes) -> tuple[int, ...]:
+    return struct.unpack(f"<{len(blob) // 4}I", blob)
+
+
+def _decay_factor(epoch: int | None, now: int, half_life_days: float) -> float:
+    """0.5^(age_days / half_life_days); registered as SQL memory_decay().
+
+    Deterministic: `now` is a parameter, fixed once per query. Missing
+    timestamps and future-dated rows do not decay.
+    """
+    if epoch is None or half_life_days <= 0:
+        return 1.0
+    age_days = (now - epoch) / 86400
+    if age_days < 0:
+        return 1.0
+    return math.pow(0.5, age_days / half_life_days)
 
 
 class FactRetriever:
@@ -30,10 +68,34 @@ class FactRetriever:
         jaccard_weight: float = 0.3,
         hrr_weight: float = 0.3,
         hrr_dim: int = 1024,
+        fusion_mode: str | None = None,
+        candidate_factor: int = 2,
+        decay_floor: float = 0.0,  # with decay on, skip facts decayed below this in SQL
     ):
         self.store = store
         self.half_life = temporal_decay_half_life
+        self.decay_floor = min(max(float(decay_floor), 0.0), 1.0)
         self.hrr_dim = hrr_dim
+        # "weighted": weighted sum of normalized signals; "rrf": reciprocal-rank fusion.
+        fusion_mode = (fusion_mode or os.environ.get("MEMORY_FUSION_MODE") or "weighted").lower()
+        self.fusion_mode = fusion_mode if fusion_mode in _FUSION_MODES else "weighted"
+        self.candidate_factor = max(1, int(candidate_factor))
+
+        # Recall cache: (normalized query, category, min_trust, limit) ->
+        # (store generation, results). Any write bumps the generation, so a
+        # stale entry is simply a miss. Useful in the resident bridge, where
+        # one retriever serves consecutive turns of the same thread.
+        self._recall_cache: OrderedDict = OrderedDict()
+        self._recall_cache_size = max(0, int(os.environ.get("MEMORY_RECALL_CACHE_SIZE", "256")))
+        self._recall_cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_stale = 0
+        # trust_score × source-kind weight per row of store.fact_vectors(),
+        # as (generation, weights); recomputed when the generation moves.
+        self._rank_weights: "tuple[int, np.ndarray] | None" = None
+
+        self._register_sql_functions()
 
         # Auto-redistribute weights if numpy unavailable
         if hrr_weight > 0 and not hrr._HAS_NUMPY:
@@ -51,66 +113,215 @@ class FactRetriever:
         category: str | None = None,
         min_trust: float = 0.3,
         limit: int = 10,
+        *,
+        query_vector: "np.ndarray | None" = None,
     ) -> list[dict]:
-        """Hybrid search: FTS5 candidates → Jaccard rerank → trust weighting.
+        """Hybrid search: FTS5 candidates → fused rerank → trust weighting.
 
         Pipeline:
-        1. FTS5 search: Get limit*3 candidates from SQLite full-text search
-        2. Jaccard boost: Token overlap between query and fact content
-        3. Trust weighting: final_score = relevance * trust_score
-        4. Temporal decay (optional): decay = 0.5^(age_days / half_life)
-
-        Returns list of dicts with fact data + 'score' field, sorted by score desc.
+        1. FTS5 search: Get limit*candidate_factor candidates from SQLite full-text search
+        2. Signals: FTS5 rank, Jaccard token overlap (precomputed token hashes)
+           and HRR similarity to the query bound to the content role
+        3. Fusion: weighted sum or reciprocal-rank fusion (fusion_mode) → relevance
+        4. Trust weighting: final_score = relevance * trust_score * source_kind weight
+        5. Temporal decay (optional): decay = 0.5^(age_days / half_life)
+        Steps 4-5 are computed in the candidate query (rank_weight) from the
+        integer epoch columns; decay_floor prunes stale facts there too.
+
+        Returns list of dicts with fact data + 'relevance' and 'score' fields,
+        sorted by score desc. Results are served from the recall cache while
+        the store generation is unchanged (not with temporal decay, whose
+        scores drift with wall-clock time).
+
+        query_vector: precomputed hrr.encode_text(query), e.g. from a batched
+        hrr.encode_texts() over several queries; encoded here when omitted.
+
+        Every call, cached or not, counts one retrieval of each returned fact
+        (store.record_retrievals); retrieval_count shows the count before it.
         """
+        if self._recall_cache_size <= 0 or self.half_life > 0:
+            return self._record_retrievals(self._search(query, category, min_trust, limit, query_vector))
+
+        key = (" ".join(query.split()).casefold(), category, float(min_trust), int(limit))
+        generation = self.store.generation
+        cached = None
+        with self._recall_cache_lock:
+            entry = self._recall_cache.get(key)
+            if entry is not None and entry[0] == generation:
+                self._cache_hits += 1
+                self._recall_cache.move_to_end(key)
+                cached = [dict(fact) for fact in entry[1]]
+            else:
+                if entry is not None:
+                    self._cache_stale += 1
+                self._cache_misses += 1
+        if cached is not None:
+            return self._record_retrievals(cached)
+
+        results = self._search(query, category, min_trust, limit, query_vector)
+        with self._recall_cache_lock:
+            self._recall_cache[key] = (generation, [dict(fact) for fact in results])
+            self._recall_cache.move_to_end(key)
+            while len(self._recall_cache) > self._recall_cache_size:
+                self._recall_cache.popitem(last=False)
+        return self._record_retrievals(results)
+
+    def _record_retrievals(self, results: list[dict]) -> list[dict]:
+        """Refresh retrieval_count on `results` (cached rows go stale as it
+        is not part of the generation), then count this retrieval."""
+        fact_ids = [fact["fact_id"] for fact in results]
+        counts = self.store.retrieval_counts(fact_ids)
+        for fact in results:
+            fact["retrieval_count"] = counts.get(fact["fact_id"], fact.get("retrieval_count"))
+        self.store.record_retrievals(fact_ids)
+        return results
+
+    def cache_stats(self) -> dict:
+        """Recall cache counters; `stale` counts misses caused by a newer generation."""
+        with self._recall_cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "stale": self._cache_stale,
+                "hit_rate": round(self._cache_hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._recall_cache),
+                "maxsize": self._recall_cache_size,
+                "generation": self.store.generation,
+            }
+
+    def _search(
+        self,
+        query: str,
+        category: str | None,
+        min_trust: float,
+        limit: int,
+        query_vector: "np.ndarray | None" = None,
+    ) -> list[dict]:
+        """Uncached search pipeline (see search())."""
         # Stage 1: Get FTS5 candidates (more than limit for reranking headroom)
-        candidates = self._fts_candidates(query, category, min_trust, limit * 3)
+        candidates = self._fts_candidates(query, category, min_trust, limit * self.candidate_factor)
 
         if not candidates:
             return []
 
-        # Stage 2: Rerank with Jaccard + trust + optional decay
-        query_tokens = self._tokenize(query)
-        scored = []
-
-        for fact in candidates:
-            content_tokens = self._tokenize(fact["content"])
-            tag_tokens = self._tokenize(fact.get("tags", ""))
-            all_tokens = content_tokens | tag_tokens
-
-            jaccard = self._jaccard_similarity(query_tokens, all_tokens)
-            fts_score = fact.get("fts_rank", 0.0)
+        # Stage 2: per-signal scores for all candidates in one pass
+        fts_scores = [fact.get("fts_rank", 0.0) for fact in candidates]
+        jaccard_scores = self._jaccard_scores(query, candidates)
+        hrr_scores = self._hrr_scores(query, candidates, query_vector)
 
-            # HRR similarity
-            if self.hrr_weight > 0 and fact.get("hrr_vector"):
-                fact_vec = hrr.bytes_to_phases(fact["hrr_vector"])
-                query_vec = hrr.encode_text(query, self.hrr_dim)
-                hrr_sim = (hrr.similarity(query_vec, fact_vec) + 1.0) / 2.0  # shift to [0,1]
-            else:
-                hrr_sim = 0.5  # neutral
-
-            # Combine FTS5 + Jaccard + HRR
-            relevance = (self.fts_weight * fts_score
-                        + self.jaccard_weight * jaccard
-                        + self.hrr_weight * hrr_sim)
-
-            # Trust weighting
-            score = fact["trust_score"] * self._source_kind_weight(fact.get("source_kind"))
-
-            # Optional temporal decay
-            if self.half_life > 0:
-                score *= self._temporal_decay(fact.get("updated_at") or fact.get("created_at"))
+        # Stage 3: fuse, then weight by trust + optional decay
+        relevance = self._fuse(fts_scores, jaccard_scores, hrr_scores)
+        scored = []
+        for fact, fact_relevance in zip(candidates, relevance):
+            # trust × source-kind weight × optional decay, from the candidate query
+            score = fact_relevance * fact.pop("rank_weight")
 
+            fact["relevance"] = round(fact_relevance, 4)
             fact["score"] = score
             scored.append(fact)
 
         # Sort by score descending, return top limit
         scored.sort(key=lambda x: x["score"], reverse=True)
         results = scored[:limit]
-        # Strip raw HRR bytes — callers expect JSON-serializable dicts
+        # Strip raw blobs — callers expect JSON-serializable dicts
         for fact in results:
             fact.pop("hrr_vector", None)
+            fact.pop("token_hashes", None)
         return results
 
+    def _jaccard_scores(self, query: str, candidates: list[dict]) -> list[float]:
+        """Jaccard overlap of query tokens vs each candidate's content+tags tokens.
+
+        Uses the token_hashes stored at write time; with numpy every candidate
+        is scored in one isin/bincount pass over the concatenated hashes.
+        """
+        query_hashes = _unpack_hashes(token_hashes(self._tokenize(query)))
+        blobs = [
+            fact.get("token_hashes") or fact_token_hashes(fact["content"], fact.get("tags"))
+            for fact in candidates
+        ]
+        if not query_hashes:
+            return [0.0] * len(candidates)
+
+        if not hrr._HAS_NUMPY:
+            query_set = set(query_hashes)
+            scores = []
+            for blob in blobs:
+                fact_set = set(_unpack_hashes(blob))
+                scores.append(self._jaccard_similarity(query_set, fact_set))
+            return scores
+
+        np = hrr.np
+        arrays = [np.frombuffer(blob, dtype="<u4") for blob in blobs]
+        lengths = np.fromiter((len(a) for a in arrays), dtype=np.int64, count=len(arrays))
+        if not lengths.sum():
+            return [0.0] * len(candidates)
+        hits = np.isin(np.concatenate(arrays), np.asarray(query_hashes, dtype=np.uint32),
+                       assume_unique=True)
+        segments = np.repeat(np.arange(len(arrays)), lengths)
+        intersection = np.bincount(segments, weights=hits, minlength=len(arrays))
+        union = len(query_hashes) + lengths - intersection
+        scores = np.where(lengths > 0, intersection / np.maximum(union, 1), 0.0)
+        return scores.tolist()
+
+    def _hrr_scores(
+        self,
+        query: str,
+        candidates: list[dict],
+        query_vector: "np.ndarray | None" = None,
+    ) -> list[float]:
+        """HRR similarity of each candidate to the query, shifted to [0, 1].
+
+        Fact vectors bundle content⊛role_content, so the query is bound to the
+        content role before comparing. Candidates are looked up in the store's
+        cached phasor matrix; anything without a vector scores neutral 0.5.
+        """
+        neutral = [0.5] * len(candidates)
+        if self.hrr_weight <= 0 or not hrr._HAS_NUMPY:
+            return neutral
+        vectors = self.store.fact_vectors()
+        if vectors is None:
+            return neutral
+
+        rows = [vectors.index.get(fact["fact_id"], -1) for fact in candidates]
+        present = [i for i, row in enumerate(rows) if row >= 0]
+        if not present:
+            return neutral
+
+        role_content = hrr.encode_atom("__hrr_role_content__", self.hrr_dim)
+        if query_vector is None:
+            query_vector = hrr.encode_text(query, self.hrr_dim)
+        probe = hrr.bind(query_vector, role_content)
+        sims = hrr.batch_similarity(vectors.phasors[[rows[i] for i in present]], probe)
+        scores = neutral
+        for i, sim in zip(present, sims.tolist()):
+            scores[i] = (sim + 1.0) / 2.0  # shift to [0,1]
+        return scores
+
+    def _fuse(self, *signals: list[float]) -> list[float]:
+        """Combine (fts, jaccard, hrr) signal lists into one relevance in [0, 1]."""
+        weights = (self.fts_weight, self.jaccard_weight, self.hrr_weight)
+        total_weight = sum(weights) or 1.0
+        n = len(signals[0])
+
+        if self.fusion_mode == "rrf":
+            # Σ w / (k + rank), normalized so rank 1 on every signal scores 1.0.
+            fused = [0.0] * n
+            for weight, values in zip(weights, signals):
+                if weight <= 0:
+                    continue
+                order = sorted(range(n), key=lambda i: values[i], reverse=True)
+                for rank, i in enumerate(order, start=1):
+                    fused[i] += weight / (_RRF_K + rank)
+            best = total_weight / (_RRF_K + 1)
+            return [value / best for value in fused]
+
+        return [
+            sum(weight * values[i] for weight, values in zip(weights, signals)) / total_weight
+            for i in range(n)
+        ]
+
     def session_search(
         self,
         query: str = "",
@@ -122,51 +333,52 @@ class FactRetriever:
         """Search conversation history by session tags and/or query.
 
         Facts are tagged with 'userId,threadTs'. This method filters by
-        tags (exact substring match on the tags field) and optionally
-        applies FTS5 search within those results.
+        exact tag via the fact_tags index and optionally applies FTS5 search
+        within those results. With a tag filter the scan walks
+        idx_fact_tags_recent (tag, created_at DESC), so a thread recall reads
+        only that thread's rows instead of the whole facts table.
 
         Returns facts sorted by created_at desc (most recent first).
         """
-        conn = self.store._conn
-
-        where_clauses = ["trust_score >= ?", "invalid_at IS NULL"]
+        tags = [tag for tag in (thread_ts, user_id) if tag]
+        columns = """f.fact_id, f.content, f.category, f.tags,
+                     f.source_kind, f.confidence, f.trust_score, f.created_at, f.updated_at"""
+        where_clauses = ["f.trust_score >= ?", "f.invalid_at IS NULL"]
         params: list = [min_trust]
 
-        if thread_ts:
-            where_clauses.append("tags LIKE ?")
-            params.append(f"%{thread_ts}%")
-        if user_id:
-            where_clauses.append("tags LIKE ?")
-            params.append(f"%{user_id}%")
-
-        where_sql = " AND ".join(where_clauses)
+        if tags:
+            # Drive from the most specific tag (thread); any other must also be present.
+            source = "fact_tags t JOIN facts f ON f.fact_id = t.fact_id"
+            order = "t.created_at DESC"
+            where_clauses.insert(0, "t.tag = ?")
+            params.insert(0, tags[0])
+            for tag in tags[1:]:
+                where_clauses.append(
+                    "EXISTS (SELECT 1 FROM fact_tags o WHERE o.tag = ? AND o.fact_id = f.fact_id)"
+                )
+                params.append(tag)
+        else:
+            source = "facts f"
+            order = "f.created_at DESC"
 
         if query:
             # FTS5 search within session-filtered facts
-            sql = f"""
-                SELECT f.fact_id, f.content, f.category, f.tags,
-                       f.source_kind, f.confidence, f.trust_score, f.created_at, f.updated_at
-                FROM facts_fts
-                JOIN facts f ON f.fact_id = facts_fts.rowid
-                WHERE facts_fts MATCH ? AND {where_sql}
-                ORDER BY f.created_at DESC
-                LIMIT ?
-            """
-            params = [query] + params + [limit]
-        else:
-            # All facts for this session, newest first
-            sql = f"""
-                SELECT fact_id, content, category, tags,
-                       source_kind, confidence, trust_score, created_at, updated_at
-                FROM facts
-                WHERE {where_sql}
-                ORDER BY created_at DESC
-                LIMIT ?
-            """
-            params.append(limit)
+            source += " JOIN facts_fts ON facts_fts.rowid = f.fact_id"
+            where_clauses.insert(0, "facts_fts MATCH ?")
+            params.insert(0, query)
+
+        where_sql = " AND ".join(where_clauses)
+        sql = f"""
+            SELECT {columns}
+            FROM {source}
+            WHERE {where_sql}
+            ORDER BY {order}
+            LIMIT ?
+        """
+        params.append(limit)
 
         try:
-            rows = conn.execute(sql, params).fetchall()
+            rows = self._fetchall(sql, params)
         except Exception:
             return []
 
@@ -190,8 +402,6 @@ class FactRetriever:
             # Fallback to keyword search on entity name
             return self.search(entity, category=category, limit=limit)
 
-        conn = self.store._conn
-
         # Encode entity as role-bound vector
         role_entity = hrr.encode_atom("__hrr_role_entity__", self.hrr_dim)
         entity_vec = hrr.encode_atom(entity.lower(), self.hrr_dim)
@@ -200,10 +410,11 @@ class FactRetriever:
         # Try category-specific bank first, then all facts
         if category:
             bank_name = f"cat:{category}"
-            bank_row = conn.execute(
+            bank_rows = self._fetchall(
                 "SELECT vector FROM memory_banks WHERE bank_name = ?",
                 (bank_name,),
-            ).fetchone()
+            )
+            bank_row = bank_rows[0] if bank_rows else None
             if bank_row:
                 bank_vec = hrr.bytes_to_phases(bank_row["vector"])
                 extracted = hrr.unbind(bank_vec, probe_key)
@@ -212,43 +423,13 @@ class FactRetriever:
                     extracted, category=category, limit=limit
                 )
 
-        # Score against individual fact vectors directly
-        where = "WHERE hrr_vector IS NOT NULL AND invalid_at IS NULL"
-        params: list = []
-        if category:
-            where += " AND category = ?"
-            params.append(category)
-
-        rows = conn.execute(
-            f"""
-            SELECT fact_id, content, category, tags, source_kind, confidence, trust_score,
-                   retrieval_count, helpful_count, created_at, updated_at,
-                   hrr_vector
-            FROM facts
-            {where}
-            """,
-            params,
-        ).fetchall()
-
-        if not rows:
+        # Score every fact vector against the role-bound entity key in one pass:
+        # a fact is "about" the entity when entity⊛role_entity is bundled in.
+        scored = self._score_facts_by_vector(probe_key, category=category, limit=limit)
+        if not scored:
             # Final fallback: keyword search
             return self.search(entity, category=category, limit=limit)
-
-        scored = []
-        for row in rows:
-            fact = dict(row)
-            fact_vec = hrr.bytes_to_phases(fact.pop("hrr_vector"))
-            # Unbind probe key from fact to see if entity is structurally present
-            residual = hrr.unbind(fact_vec, probe_key)
-            # Compare residual against content signal
-            role_content = hrr.encode_atom("__hrr_role_content__", self.hrr_dim)
-            content_vec = hrr.bind(hrr.encode_text(fact["content"], self.hrr_dim), role_content)
-            sim = hrr.similarity(residual, content_vec)
-            fact["score"] = fact["trust_score"] * self._source_kind_weight(fact.get("source_kind"))
-            scored.append(fact)
-
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        return scored[:limit]
+        return scored
 
     def related(
         self,
@@ -267,56 +448,27 @@ class FactRetriever:
         if not hrr._HAS_NUMPY:
             return self.search(entity, category=category, limit=limit)
 
-        conn = self.store._conn
-
         # Encode entity as a bare atom (not role-bound — we want ANY structural match)
         entity_vec = hrr.encode_atom(entity.lower(), self.hrr_dim)
 
-        # Get all facts with vectors
-        where = "WHERE hrr_vector IS NOT NULL AND invalid_at IS NULL"
-        params: list = []
-        if category:
-            where += " AND category = ?"
-            params.append(category)
-
-        rows = conn.execute(
-            f"""
-            SELECT fact_id, content, category, tags, source_kind, confidence, trust_score,
-                   retrieval_count, helpful_count, created_at, updated_at,
-                   hrr_vector
-            FROM facts
-            {where}
-            """,
-            params,
-        ).fetchall()
+        # sim(unbind(f, entity), role) == sim(f, bind(entity, role)), so both
+        # role checks are one matrix product against two precomputed keys.
+        # This catches both role-bound entity matches AND content word matches.
+        role_entity = hrr.encode_atom("__hrr_role_entity__", self.hrr_dim)
+        role_content = hrr.encode_atom("__hrr_role_content__", self.hrr_dim)
+        keys = hrr.np.stack([
+            hrr.bind(entity_vec, role_entity),
+            hrr.bind(entity_vec, role_content),
+        ])
 
-        if not rows:
+        matrix = self._vector_matrix(category, keys)
+        if matrix is None:
             return self.search(entity, category=category, limit=limit)
 
-        # Score each fact by how much the entity's atom appears in its vector
-        # This catches both role-bound entity matches AND content word matches
-        scored = []
-        for row in rows:
-            fact = dict(row)
-            fact_vec = hrr.bytes_to_phases(fact.pop("hrr_vector"))
-
-            # Check structural similarity: unbind entity from fact
-            residual = hrr.unbind(fact_vec, entity_vec)
-            # A high-similarity residual to ANY known role vector means this entity
-            # plays a structural role in the fact
-            role_entity = hrr.encode_atom("__hrr_role_entity__", self.hrr_dim)
-            role_content = hrr.encode_atom("__hrr_role_content__", self.hrr_dim)
-
-            entity_role_sim = hrr.similarity(residual, role_entity)
-            content_role_sim = hrr.similarity(residual, role_content)
-            # Take the max — entity could appear in either role
-            best_sim = max(entity_role_sim, content_role_sim)
-
-            fact["score"] = fact["trust_score"] * self._source_kind_weight(fact.get("source_kind"))
-            scored.append(fact)
-
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        return scored[:limit]
+        fact_ids, phasors, weights = matrix
+        # Take the max — entity could appear in either role
+        sims = hrr.batch_similarity(phasors, keys).max(axis=1)
+        return self._rank_by_similarity(fact_ids, sims, weights, limit)
 
     def reason(
         self,
@@ -340,7 +492,6 @@ class FactRetriever:
             query = " ".join(entities)
             return self.search(query, category=category, limit=limit)
 
-        conn = self.store._conn
         role_entity = hrr.encode_atom("__hrr_role_entity__", self.hrr_dim)
 
         # For each entity, compute what the bank "remembers" about it
@@ -351,56 +502,28 @@ class FactRetriever:
             probe_key = hrr.bind(entity_vec, role_entity)
             entity_residuals.append(probe_key)
 
-        # Get all facts with vectors
-        where = "WHERE hrr_vector IS NOT NULL AND invalid_at IS NULL"
-        params: list = []
-        if category:
-            where += " AND category = ?"
-            params.append(category)
-
-        rows = conn.execute(
-            f"""
-            SELECT fact_id, content, category, tags, source_kind, confidence, trust_score,
-                   retrieval_count, helpful_count, created_at, updated_at,
-                   hrr_vector
-            FROM facts
-            {where}
-            """,
-            params,
-        ).fetchall()
-
-        if not rows:
-            query = " ".join(entities)
-            return self.search(query, category=category, limit=limit)
-
         # Score each fact by how much EACH entity is structurally present.
         # A fact scores high only if ALL entities have structural presence
         # (AND semantics via min, vs OR which would use mean/max).
-        role_content = hrr.encode_atom("__hrr_role_content__", self.hrr_dim)
-
-        scored = []
-        for row in rows:
-            fact = dict(row)
-            fact_vec = hrr.bytes_to_phases(fact.pop("hrr_vector"))
-
-            entity_scores = []
-            for probe_key in entity_residuals:
-                residual = hrr.unbind(fact_vec, probe_key)
-                sim = hrr.similarity(residual, role_content)
-                entity_scores.append(sim)
+        # Presence of entity⊛role_entity in the bundle is sim(f, probe_key),
+        # so all entities are scored in a single matrix product.
+        keys = hrr.np.stack(entity_residuals)
 
-            min_sim = min(entity_scores)
-            fact["score"] = fact["trust_score"] * self._source_kind_weight(fact.get("source_kind"))
-            scored.append(fact)
+        matrix = self._vector_matrix(category, keys)
+        if matrix is None:
+            query = " ".join(entities)
+            return self.search(query, category=category, limit=limit)
 
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        return scored[:limit]
+        fact_ids, phasors, weights = matrix
+        sims = hrr.batch_similarity(phasors, keys).min(axis=1)
+        return self._rank_by_similarity(fact_ids, sims, weights, limit)
 
     def contradict(
         self,
         category: str | None = None,
         threshold: float = 0.3,
         limit: int = 10,
+        max_pairs: int | None = _CONTRADICT_MAX_PAIRS,
     ) -> list[dict]:
         """Find potentially contradictory facts via entity overlap + content divergence.
 
@@ -408,100 +531,133 @@ class FactRetriever:
         low content-vector similarity (different claims). This is automated
         memory hygiene — no other memory system does this.
 
-        Returns pairs of facts with a contradiction score.
+        Covers every live fact; see iter_contradictions() for how pairs are
+        found and what `max_pairs` bounds.
+        Returns the `limit` highest-scoring pairs with a contradiction score.
         Falls back to empty list if numpy unavailable.
         """
-        if not hrr._HAS_NUMPY:
-            return []
+        found = self.iter_contradictions(category=category, threshold=threshold, max_pairs=max_pairs)
+        return heapq.nlargest(limit, found, key=lambda x: x["contradiction_score"])
 
-        conn = self.store._conn
+    def iter_contradictions(
+        self,
+        category: str | None = None,
+        threshold: float = 0.3,
+        max_pairs: int | None = _CONTRADICT_MAX_PAIRS,
+    ) -> Iterator[dict]:
+        """Stream contradiction pairs as they are found (unordered).
+
+        Facts are bucketed by entity with one grouped query over fact_entities;
+        only pairs inside a bucket can overlap, and each bucket's content
+        similarities are one matrix product. A pair sharing several entities
+        is scored once, in the bucket of its smallest shared entity. Buckets
+        are visited smallest first; `max_pairs` caps the pairs compared
+        (None = unbounded) and a warning is logged if it cuts the scan short.
+        """
+        if not hrr._HAS_NUMPY:
+            return
+        vectors = self.store.fact_vectors()
+        if vectors is None:
+            return
+        np = hrr.np
 
-        # Get all facts with vectors and their linked entities
+        # Entity sets for every live fact with a vector, in one query
         where = "WHERE f.hrr_vector IS NOT NULL AND f.invalid_at IS NULL"
         params: list = []
         if category:
             where += " AND f.category = ?"
             params.append(category)
-
-        rows = conn.execute(
+        link_rows = self._fetchall(
             f"""
-            SELECT f.fact_id, f.content, f.category, f.tags,
-                   f.source_kind, f.confidence, f.trust_score,
-                   f.created_at, f.updated_at, f.hrr_vector
-            FROM facts f
+            SELECT fe.fact_id, e.name FROM fact_entities fe
+            JOIN entities e ON e.entity_id = fe.entity_id
+            JOIN facts f ON f.fact_id = fe.fact_id
             {where}
             """,
             params,
-        ).fetchall()
-
-        if len(rows) < 2:
-            return []
-
-        # Guard against O(n²) explosion on large fact stores.
-        # At 500 facts, that's ~125K comparisons — acceptable.
-        # Above that, only check the most recently updated facts.
-        _MAX_CONTRADICT_FACTS = 500
-        if len(rows) > _MAX_CONTRADICT_FACTS:
-            rows = sorted(rows, key=lambda r: r["updated_at"] or r["created_at"], reverse=True)
-            rows = rows[:_MAX_CONTRADICT_FACTS]
-
-        # Build entity sets per fact
+        )
         fact_entities: dict[int, set[str]] = {}
-        for row in rows:
-            fid = row["fact_id"]
-            entity_rows = conn.execute(
-                """
-                SELECT e.name FROM entities e
-                JOIN fact_entities fe ON fe.entity_id = e.entity_id
-                WHERE fe.fact_id = ?
-                """,
-                (fid,),
-            ).fetchall()
-            fact_entities[fid] = {r["name"].lower() for r in entity_rows}
-
-        # Compare all pairs: high entity overlap + low content similarity = contradiction
-        facts = [dict(r) for r in rows]
-        contradictions = []
-
-        for i in range(len(facts)):
-            for j in range(i + 1, len(facts)):
-                f1, f2 = facts[i], facts[j]
-                ents1 = fact_entities.get(f1["fact_id"], set())
-                ents2 = fact_entities.get(f2["fact_id"], set())
-
-                if not ents1 or not ents2:
-                    continue
+        buckets: dict[str, list[int]] = {}
+        for row in link_rows:
+            if row["fact_id"] not in vectors.index:
+                continue
+            name = row["name"].lower()
+            if name not in fact_entities.setdefault(row["fact_id"], set()):
+                fact_entities[row["fact_id"]].add(name)
+                buckets.setdefault(name, []).append(row["fact_id"])
+
+        facts: dict[int, dict] | None = None
+        # score = overlap * (1 - (sim + 1) / 2) <= (1 - sim) / 2, so pairs with
+        # sim above this bound can never reach the threshold.
+        max_sim = 1.0 - 2.0 * threshold
+        budget = max_pairs
+        for entity, members in sorted(buckets.items(), key=lambda item: (len(item[1]), item[0])):
+            if len(members) < 2:
+                continue
+            members.sort()
+            pair_count = len(members) * (len(members) - 1) // 2
+            if budget is not None and pair_count > budget:
+                logger.warning(
+                    "contradict: max_pairs=%s reached; skipped buckets from %r (%d facts) on",
+                    max_pairs, entity, len(members),
+                )
+                return
+            if budget is not None:
+                budget -= pair_count
+
+            block = vectors.phasors[[vectors.index[fid] for fid in members]]
+            sims = (block @ block.conj().T).real / block.shape[1]
+            rows_i, cols_j = np.nonzero(np.triu(sims <= max_sim, k=1))
+            for i, j in zip(rows_i.tolist(), cols_j.tolist()):
+                id_a, id_b = members[i], members[j]
+                ents1, ents2 = fact_entities[id_a], fact_entities[id_b]
+                shared = ents1 & ents2
+                if min(shared) != entity:
+                    continue  # scored in another bucket
 
                 # Entity overlap (Jaccard)
-                entity_overlap = len(ents1 & ents2) / len(ents1 | ents2) if (ents1 | ents2) else 0.0
-
+                entity_overlap = len(shared) / len(ents1 | ents2)
                 if entity_overlap < 0.3:
                     continue  # Not enough entity overlap to be contradictory
 
-                # Content similarity via HRR vectors
-                v1 = hrr.bytes_to_phases(f1["hrr_vector"])
-                v2 = hrr.bytes_to_phases(f2["hrr_vector"])
-                content_sim = hrr.similarity(v1, v2)
-
                 # High entity overlap + low content similarity = potential contradiction
                 # contradiction_score: higher = more contradictory
+                content_sim = float(sims[i, j])
                 contradiction_score = entity_overlap * (1.0 - (content_sim + 1.0) / 2.0)
+                if contradiction_score < threshold:
+                    continue
 
-                if contradiction_score >= threshold:
-                    # Strip hrr_vector from output (not JSON serializable)
-                    f1_clean = {k: v for k, v in f1.items() if k != "hrr_vector"}
-                    f2_clean = {k: v for k, v in f2.items() if k != "hrr_vector"}
-                    contradictions.append({
-                        "fact_a": f1_clean,
-                        "fact_b": f2_clean,
-                        "entity_overlap": round(entity_overlap, 3),
-                        "content_similarity": round(content_sim, 3),
-                        "contradiction_score": round(contradiction_score, 3),
-                        "shared_entities": sorted(ents1 & ents2),
-                    })
-
-        contradictions.sort(key=lambda x: x["contradiction_score"], reverse=True)
-        return contradictions[:limit]
+                if facts is None:
+                    facts = self._contradict_facts(category)
+                if id_a not in facts or id_b not in facts:
+                    continue
+                yield {
+                    "fact_a": facts[id_a],
+                    "fact_b": facts[id_b],
+                    "entity_overlap": round(entity_overlap, 3),
+                    "content_similarity": round(content_sim, 3),
+                    "contradiction_score": round(contradiction_score, 3),
+                    "shared_entities": sorted(shared),
+                }
+
+    def _contradict_facts(self, category: str | None) -> dict[int, dict]:
+        """fact_id -> output fields for the facts contradict() may report."""
+        where = "WHERE hrr_vector IS NOT NULL AND invalid_at IS NULL"
+        params: list = []
+        if category:
+            where += " AND category = ?"
+            params.append(category)
+        rows = self._fetchall(
+            f"""
+            SELECT fact_id, content, category, tags,
+                   source_kind, confidence, trust_score,
+                   created_at, updated_at
+            FROM facts
+            {where}
+            """,
+            params,
+        )
+        return {row["fact_id"]: dict(row) for row in rows}
 
     def _score_facts_by_vector(
         self,
@@ -510,35 +666,120 @@ class FactRetriever:
         limit: int = 10,
     ) -> list[dict]:
         """Score facts by similarity to a target vector."""
-        conn = self.store._conn
+        matrix = self._vector_matrix(category, target_vec)
+        if matrix is None:
+            return []
+        fact_ids, phasors, weights = matrix
+        sims = hrr.batch_similarity(phasors, target_vec)
+        return self._rank_by_similarity(fact_ids, sims, weights, limit)
 
-        where = "WHERE hrr_vector IS NOT NULL AND invalid_at IS NULL"
-        params: list = []
-        if category:
-            where += " AND category = ?"
-            params.append(category)
+    def _vector_matrix(
+        self,
+        category: str | None,
+        keys: "np.ndarray | None" = None,
+    ) -> "tuple[np.ndarray, np.ndarray, np.ndarray] | None":
+        """(fact_ids, phasors, rank weights) of the live facts worth scoring against `keys`.
 
-        rows = conn.execute(
-            f"""
+        Rows come from the cached matrix: every fact, or above the store's ANN
+        threshold only the LSH candidates for `keys`. Rank weights are
+        trust_score × source-kind weight per row.
+        """
+        vectors = self.store.fact_vectors()
+        if vectors is None:
+            return None
+        index = self.store.ann_index() if keys is not None else None
+        if index is not None:
+            return self._ann_matrix(vectors, index.candidates(keys), category)
+
+        rows = vectors.rows(category)
+        fact_ids = vectors.fact_ids[rows]
+        if not len(fact_ids):
+            return None
+        return fact_ids, vectors.phasors[rows], self._fact_rank_weights(vectors)[rows]
+
+    def _fact_rank_weights(self, vectors: "FactVectors") -> "np.ndarray":
+        """trust_score × source-kind weight for every row of `vectors` (cached per generation)."""
+        cached = self._rank_weights
+        if cached is not None and cached[0] == vectors.generation:
+            return cached[1]
+        weights = vectors.trust_scores * hrr.np.fromiter(
+            (self._source_kind_weight(kind) for kind in vectors.source_kinds),
+            dtype=hrr.np.float64,
+            count=len(vectors.source_kinds),
+        )
+        self._rank_weights = (vectors.generation, weights)
+        return weights
+
+    def _ann_matrix(
+        self,
+        vectors: "FactVectors",
+        candidate_ids: "np.ndarray",
+        category: str | None,
+    ) -> "tuple[np.ndarray, np.ndarray, np.ndarray] | None":
+        """The LSH candidates' rows of the cached matrix — no SQL, no blob decode."""
+        np = hrr.np
+        fact_ids = vectors.fact_ids
+        if not len(candidate_ids):
+            return None
+        # fact_ids is sorted; candidates without a live vector find no match.
+        rows = np.minimum(np.searchsorted(fact_ids, candidate_ids), len(fact_ids) - 1)
+        rows = rows[fact_ids[rows] == candidate_ids]
+        if category is not None:
+            rows = rows[vectors.categories[rows] == category]
+        if not len(rows):
+            return None
+        return fact_ids[rows], vectors.phasors[rows], self._fact_rank_weights(vectors)[rows]
+
+    def _rank_by_similarity(
+        self,
+        fact_ids: "np.ndarray",
+        sims: "np.ndarray",
+        weights: "np.ndarray",
+        limit: int,
+    ) -> list[dict]:
+        """Rank facts by structural similarity weighted by trust and source kind.
+
+        score = max(sim, 0) * trust_score * source_kind_weight; the raw
+        similarity is returned alongside as 'similarity'. Scores stay in
+        arrays: the top `limit` are picked with argpartition and only those
+        rows are read back as dicts, in one IN (...) query.
+        """
+        np = hrr.np
+        scores = np.maximum(sims, 0.0) * weights
+        k = min(int(limit), len(scores))
+        if k <= 0:
+            return []
+        if k < len(scores):
+            kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+            # Everything above the cut, then the earliest rows tied at it.
+            above = np.flatnonzero(scores > kth)
+            top = np.concatenate([above, np.flatnonzero(scores == kth)[:k - len(above)]])
+        else:
+            top = np.arange(len(scores))
+        # Best first; ties keep fact order, as the stable sort this replaces did.
+        top = top[np.lexsort((top, -scores[top]))]
+
+        rows = self._fetchall(
+            """
             SELECT fact_id, content, category, tags, source_kind, confidence, trust_score,
-                   retrieval_count, helpful_count, created_at, updated_at,
-                   hrr_vector
+                   retrieval_count, helpful_count, created_at, updated_at
             FROM facts
-            {where}
+            WHERE fact_id IN (SELECT value FROM json_each(?)) AND invalid_at IS NULL
             """,
-            params,
-        ).fetchall()
+            [json.dumps(fact_ids[top].tolist())],
+        )
+        facts = {row["fact_id"]: row for row in rows}
 
-        scored = []
-        for row in rows:
+        results = []
+        for i in top.tolist():
+            row = facts.get(int(fact_ids[i]))
+            if row is None:
+                continue  # tombstoned since the vectors were loaded
             fact = dict(row)
-            fact_vec = hrr.bytes_to_phases(fact.pop("hrr_vector"))
-            sim = hrr.similarity(target_vec, fact_vec)
-            fact["score"] = fact["trust_score"] * self._source_kind_weight(fact.get("source_kind"))
-            scored.append(fact)
-
-        scored.sort(key=lambda x: x["score"], reverse=True)
-        return scored[:limit]
+            fact["similarity"] = round(float(sims[i]), 4)
+            fact["score"] = float(scores[i])
+            results.append(fact)
+        return results
 
     def _like_candidates(
         self,
@@ -548,27 +789,28 @@ class FactRetriever:
         limit: int,
     ) -> list[dict]:
         """Fallback for queries too short for trigram FTS5 (< 3 chars)."""
-        conn = self.store._conn
-        params: list = [f"%{query}%", min_trust]
-        where = "WHERE content LIKE ? AND trust_score >= ? AND invalid_at IS NULL"
+        weight_sql, weight_params, decay_where, decay_params = self._rank_weight_sql("facts")
+        params: list = weight_params + [f"%{query}%", min_trust]
+        where = f"WHERE content LIKE ? AND trust_score >= ? AND invalid_at IS NULL{decay_where}"
+        params.extend(decay_params)
         if category:
             where += " AND category = ?"
             params.append(category)
         params.append(limit)
 
         try:
-            rows = conn.execute(
+            rows = self._fetchall(
                 f"""
                 SELECT fact_id, content, category, tags, source_kind, confidence, trust_score,
                        retrieval_count, helpful_count, created_at, updated_at,
-                       hrr_vector, 1.0 as fts_rank
+                       hrr_vector, token_hashes, 1.0 as fts_rank, {weight_sql}
                 FROM facts
                 {where}
                 ORDER BY trust_score DESC
                 LIMIT ?
                 """,
                 params,
-            ).fetchall()
+            )
             return [dict(r) for r in rows]
         except Exception:
             return []
@@ -590,7 +832,6 @@ class FactRetriever:
         if len(query.strip()) < 3:
             return self._like_candidates(query, category, min_trust, limit)
 
-        conn = self.store._conn
 
         # Build query - FTS5 rank is negative (lower = better match)
         # We need to join facts_fts with facts to get all columns
@@ -606,20 +847,26 @@ class FactRetriever:
         params.append(min_trust)
         where_clauses.append("f.invalid_at IS NULL")
 
-        where_sql = " AND ".join(where_clauses)
+        weight_sql, weight_params, decay_where, decay_params = self._rank_weight_sql("f")
+        where_sql = " AND ".join(where_clauses) + decay_where
+        params.extend(decay_params)
 
         sql = f"""
-            SELECT f.*, facts_fts.rank as fts_rank_raw
+            SELECT f.fact_id, f.content, f.category, f.tags, f.source_kind, f.confidence,
+                   f.trust_score, f.retrieval_count, f.helpful_count, f.created_at, f.updated_at,
+                   f.source, f.invalid_at, f.superseded_by, f.trust_frozen,
+                   f.hrr_vector, f.token_hashes,
+                   facts_fts.rank as fts_rank_raw, {weight_sql}
             FROM facts_fts
             JOIN facts f ON f.fact_id = facts_fts.rowid
             WHERE {where_sql}
             ORDER BY facts_fts.rank
             LIMIT ?
         """
-        params.append(limit)
+        params = weight_params + params + [limit]
 
         try:
-            rows = conn.execute(sql, params).fetchall()
+            rows = self._fetchall(sql, params)
         except Exception:
             # FTS5 MATCH can fail on malformed queries — fall back to empty
             return []
@@ -642,6 +889,15 @@ class FactRetriever:
 
         return results
 
+    def _fetchall(self, sql: str, params: "list | tuple" = ()) -> list:
+        """Run a read query under the store lock.
+
+        The store connection is shared across threads in the resident bridge;
+        holding the lock keeps reads from interleaving with a write in flight.
+        """
+        with self.store._lock:
+            return self.store._conn.execute(sql, params).fetchall()
+
     @staticmethod
     def _source_kind_weight(source_kind: str | None) -> float:
         if source_kind == "inferred":
@@ -655,16 +911,9 @@ class FactRetriever:
         """Simple whitespace tokenization with lowercasing.
 
         Strips common punctuation. No stemming/lemmatization (Phase 1).
+        Same tokens as the facts.token_hashes column.
         """
-        if not text:
-            return set()
-        # Split on whitespace, lowercase, strip punctuation
-        tokens = set()
-        for word in text.lower().split():
-            cleaned = word.strip(".,;:!?\"'()[]{}#@<>")
-            if cleaned:
-                tokens.add(cleaned)
-        return tokens
+        return search_tokens(text)
 
     @staticmethod
     def _jaccard_similarity(set_a: set, set_b: set) -> float:
@@ -675,28 +924,29 @@ class FactRetriever:
         union = len(set_a | set_b)
         return intersection / union if union > 0 else 0.0
 
-    def _temporal_decay(self, timestamp_str: str | None) -> float:
-        """Exponential decay: 0.5^(age_days / half_life_days).
+    def _rank_weight_sql(self, table: str) -> tuple[str, list, str, list]:
+        """SQL for trust_score × source-kind weight × temporal decay.
 
-        Returns 1.0 if decay is disabled or timestamp is missing.
+        Returns (select expression AS rank_weight, its params, extra WHERE
+        clause, its params). With decay_floor set, facts whose decay is below
+        it are cut by an integer epoch comparison instead of being scored.
         """
-        if not self.half_life or not timestamp_str:
-            return 1.0
-
-        try:
-            if isinstance(timestamp_str, str):
-                # Parse ISO format timestamp from SQLite
-                ts = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            else:
-                ts = timestamp_str
-
-            if ts.tzinfo is None:
-                ts = ts.replace(tzinfo=timezone.utc)
-
-            age_days = (datetime.now(timezone.utc) - ts).total_seconds() / 86400
-            if age_days < 0:
-                return 1.0
-
-            return math.pow(0.5, age_days / self.half_life)
-        except (ValueError, TypeError):
-            return 1.0
+        weight = f"{table}.trust_score * source_kind_weight({table}.source_kind)"
+        if self.half_life <= 0:
+            return f"{weight} AS rank_weight", [], "", []
+        now = int(time.time())
+        epoch = f"COALESCE({table}.updated_epoch, {table}.created_epoch)"
+        select = f"{weight} * memory_decay({epoch}, ?, ?) AS rank_weight"
+        params = [now, float(self.half_life)]
+        if self.decay_floor <= 0:
+            return select, params, "", []
+        # decay >= floor  <=>  age_days <= half_life * log2(1 / floor)
+        horizon = self.half_life * 86400 * math.log2(1.0 / self.decay_floor)
+        return select, params, f" AND ({epoch} IS NULL OR {epoch} >= ?)", [now - horizon]
+
+    def _register_sql_functions(self) -> None:
+        """Expose the ranking weights to SQL on the store's connection."""
+        with self.store._lock:
+            conn = self.store._conn
+            conn.create_function("source_kind_weight", 1, self._source_kind_weight, deterministic=True)
+            conn.create_function("memory_decay", 3, _decay_factor, deterministic=True)
@@ -3,17 +3,31 @@ SQLite-backed fact store with entity resolution and trust scoring.
 Single-user Hermes memory store plugin.
 """
 
+import functools
+import json
 import logging
+import multiprocessing
+import os
 import re
 import sqlite3
+import struct
 import sys
 import threading
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Iterator
 
 try:
     from . import holographic as hrr
+    from .ann import SimHashIndex
 except ImportError:
     import holographic as hrr  # type: ignore[no-redef]
+    from ann import SimHashIndex  # type: ignore[no-redef]
 
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS facts (
@@ -62,7 +76,8 @@ CREATE TRIGGER IF NOT EXISTS facts_ad AFTER DELETE ON facts BEGIN
         VALUES ('delete', old.fact_id, old.content, old.tags);
 END;
 
-CREATE TRIGGER IF NOT EXISTS facts_au AFTER UPDATE ON facts BEGIN
+-- Only indexed columns: trust/counter/vector updates must not rewrite FTS rows.
+CREATE TRIGGER IF NOT EXISTS facts_au AFTER UPDATE OF content, tags ON facts BEGIN
     INSERT INTO facts_fts(facts_fts, rowid, content, tags)
         VALUES ('delete', old.fact_id, old.content, old.tags);
     INSERT INTO facts_fts(rowid, content, tags)
@@ -75,7 +90,40 @@ CREATE TABLE IF NOT EXISTS memory_banks (
     vector     BLOB NOT NULL,
     dim        INTEGER NOT NULL,
     fact_count INTEGER DEFAULT 0,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    sum_vector BLOB
+);
+
+CREATE TABLE IF NOT EXISTS entity_aliases (
+    alias_norm TEXT PRIMARY KEY,
+    entity_id  INTEGER NOT NULL REFERENCES entities(entity_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS fact_terms (
+    term    TEXT NOT NULL,
+    fact_id INTEGER NOT NULL REFERENCES facts(fact_id),
+    PRIMARY KEY (term, fact_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_fact_terms_fact ON fact_terms(fact_id);
+
+-- Exact comma-separated tags (session tags are "userId,threadTs"), newest first per tag.
+CREATE TABLE IF NOT EXISTS fact_tags (
+    tag        TEXT NOT NULL,
+    fact_id    INTEGER NOT NULL REFERENCES facts(fact_id),
+    created_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (tag, fact_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_fact_tags_recent ON fact_tags(tag, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_fact_tags_fact ON fact_tags(fact_id);
+
+CREATE TABLE IF NOT EXISTS fact_lsh (
+    fact_id   INTEGER PRIMARY KEY REFERENCES facts(fact_id),
+    signature BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS store_meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
 );
 """
 
@@ -119,10 +167,98 @@ _RE_AKA          = re.compile(
 )
 
 
+@dataclass(frozen=True)
+class FactVectors:
+    """In-memory matrix of every live fact vector, for vectorized scoring.
+
+    Built by MemoryStore.fact_vectors() and valid for one store generation.
+    Row i of `phasors` is exp(iφ) of fact `fact_ids[i]`.
+    """
+
+    generation: int
+    fact_ids: "np.ndarray"      # (n,) int64, ascending
+    categories: "np.ndarray"    # (n,) object
+    phasors: "np.ndarray"       # (n, dim) complex64
+    index: dict                 # fact_id -> row
+    trust_scores: "np.ndarray"  # (n,) float64
+    source_kinds: "np.ndarray"  # (n,) object
+
+    def rows(self, category: str | None = None) -> "slice | np.ndarray":
+        """Row selector for one category (boolean mask), or every row."""
+        if category is None:
+            return slice(None)
+        return self.categories == category
+
+    def select(self, category: str | None = None) -> tuple["np.ndarray", "np.ndarray"]:
+        """(fact_ids, phasors) restricted to one category, or all rows."""
+        rows = self.rows(category)
+        return self.fact_ids[rows], self.phasors[rows]
+
+
+_REBUILD_CHECKPOINT_KEY = "rebuild_vectors"
+_ANN_CONFIG_KEY = "ann"
+# Vector queries switch from an exact scan to the LSH index (ann.py) once the
+# store holds this many live fact vectors. <= 0 disables the index. Measured
+# at dim 1024: the two break even near 3k facts; the index is ~2x faster at
+# 12k and ~2.5x at 24k.
+_ANN_MIN_FACTS = int(os.environ.get("HOLOGRAPHIC_ANN_MIN_FACTS", "4000"))
+# Unix-epoch "now" as SQL, written next to every CURRENT_TIMESTAMP so ranking
+# can compare integers instead of parsing timestamp strings. Same statement,
+# same instant: SQLite evaluates 'now' once per step.
+_NOW_EPOCH_SQL = "CAST(strftime('%s', 'now') AS INTEGER)"
+
+# search_facts() retrieval_count increments: "buffered" (default) batches them
+# in memory, "exact" writes + commits on every search as before.
+_RETRIEVAL_COUNT_MODES = ("buffered", "exact")
+_RETRIEVAL_COUNT_MODE = os.environ.get("MEMORY_RETRIEVAL_COUNT_MODE", "buffered").lower()
+# Buffered increments are flushed once this many are pending or this many
+# seconds have passed since the last flush (checked on the next search), and
+# always on close().
+_RETRIEVAL_FLUSH_PENDING = 256
+_RETRIEVAL_FLUSH_SECONDS = 30.0
+
+
+def _normalize_alias(name: str) -> str:
+    """Case- and whitespace-insensitive key for entity names and aliases."""
+    return " ".join(name.split()).casefold()
+
+
+def search_tokens(text: str | None) -> set[str]:
+    """Whitespace tokens, lowercased, with surrounding punctuation stripped.
+
+    The token set behind FactRetriever's Jaccard rerank. No stemming.
+    """
+    if not text:
+        return set()
+    tokens = set()
+    for word in text.lower().split():
+        cleaned = word.strip(".,;:!?\"'()[]{}#@<>")
+        if cleaned:
+            tokens.add(cleaned)
+    return tokens
+
+
+def token_hashes(tokens: "set[str]") -> bytes:
+    """Sorted, unique CRC32s of a token set as little-endian uint32s."""
+    hashes = sorted({zlib.crc32(token.encode("utf-8")) for token in tokens})
+    return struct.pack(f"<{len(hashes)}I", *hashes)
+
+
+def fact_token_hashes(content: str, tags: str | None) -> bytes:
+    """token_hashes() of a fact's content + tags, as stored in facts.token_hashes."""
+    return token_hashes(search_tokens(content) | search_tokens(tags))
+
+
+def split_tags(tags: str | None) -> list[str]:
+    """Distinct non-empty entries of a comma-separated tags string, in order."""
+    return list(dict.fromkeys(t.strip() for t in (tags or "").split(",") if t.strip()))
+
+
 def _clamp_trust(value: float) -> float:
     return max(_TRUST_MIN, min(_TRUST_MAX, value))
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_conflict_text(text: str) -> str:
     return _COMMON_PUNCTUATION.sub(" ", text.lower()).strip()
 
@@ -139,6 +275,43 @@ def _term_overlap(left: str, right: str) -> float:
     return len(left_terms & right_terms) / max(len(left_terms), len(right_terms))
 
 
+def _index_terms(text: str) -> set[str]:
+    """Inverted-index keys for conflict candidate lookup.
+
+    ASCII words (len >= 2) plus every CJK bigram of the normalized text. Any
+    term _detect_conflict() can match on — including CJK runs split by a
+    removed polarity word — contains one of these keys, so two facts that
+    share no key can never conflict.
+    """
+    keys: set[str] = set()
+    for token in _TERM_PATTERN.findall(_normalize_conflict_text(text)):
+        if token.isascii():
+            if len(token) >= 2:
+                keys.add(token)
+        else:
+            keys.update(token[i:i + 2] for i in range(len(token) - 1))
+    return keys
+
+
+# Extra fact_terms key for facts containing any negation marker. Every conflict
+# path in _detect_conflict() needs one on at least one side, so a non-negated
+# incoming fact only has to be checked against negated candidates. Cannot
+# collide with real keys: "!" is stripped by _COMMON_PUNCTUATION.
+_NEGATION_TERM = "!negation"
+_NEGATIVE_POLARITY = tuple({negative for _, negative in _POLARITY_PAIRS})
+
+
+def _has_negation(text: str) -> bool:
+    normalized = _normalize_conflict_text(text)
+    return (_GENERIC_NEGATION.search(normalized) is not None
+            or any(negative in normalized for negative in _NEGATIVE_POLARITY))
+
+
+def _stored_terms(text: str, terms: set[str]) -> set[str]:
+    """fact_terms keys for a fact: its index terms plus the negation marker."""
+    return terms | {_NEGATION_TERM} if _has_negation(text) else terms
+
+
 def _remove_once(text: str, term: str) -> str:
     return text.replace(term, " ")
 
@@ -177,6 +350,7 @@ class MemoryStore:
         db_path: "str | Path | None" = None,
         default_trust: float = 0.5,
         hrr_dim: int = 1024,
+        retrieval_count_mode: str | None = None,
     ) -> None:
         if db_path is None:
             raise ValueError("db_path is required")
@@ -191,6 +365,26 @@ class MemoryStore:
             timeout=10.0,
         )
         self._lock = threading.RLock()
+        self._tx_depth = 0
+        # Bumped on every local commit/rollback and when another connection
+        # commits (PRAGMA data_version); caches keyed on it never go stale.
+        self._generation = 0
+        self._data_version: int | None = None
+        self._fact_vectors: FactVectors | None = None
+        # alias_norm -> entity_id. Entities are never deleted, so entries only
+        # go stale when the transaction that created them rolls back.
+        self._entity_cache: dict[str, int] = {}
+        # LSH signatures are written for every vector; the in-memory buckets
+        # are loaded on first use above _ANN_MIN_FACTS and then kept in step
+        # with local writes (dropped on rollback / foreign commits).
+        self.ann_min_facts = _ANN_MIN_FACTS
+        self._ann_hasher: SimHashIndex | None = None
+        self._ann: SimHashIndex | None = None
+        # fact_id -> pending retrieval_count increment (buffered mode).
+        mode = (retrieval_count_mode or _RETRIEVAL_COUNT_MODE).lower()
+        self.retrieval_count_mode = mode if mode in _RETRIEVAL_COUNT_MODES else "buffered"
+        self._retrieval_pending: Counter = Counter()
+        self._retrieval_flushed_at = time.monotonic()
         self._conn.row_factory = sqlite3.Row
         self._init_db()
 
@@ -201,7 +395,17 @@ class MemoryStore:
     def _init_db(self) -> None:
         """Create tables, indexes, and triggers if they do not exist. Enable WAL mode."""
         self._conn.execute("PRAGMA journal_mode=WAL")
+        existing_tables = {
+            row[0] for row in self._conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
         self._conn.executescript(_SCHEMA)
+        if "entity_aliases" not in existing_tables:
+            self._backfill_entity_aliases()
+        if "fact_terms" not in existing_tables:
+            self._backfill_fact_terms()
+        if "fact_tags" not in existing_tables:
+            self._backfill_fact_tags()
+        self._migrate_fts_update_trigger()
         self._migrate_v2()
         # Migrate: add columns if missing (safe for existing databases)
         columns = {row[1] for row in self._conn.execute("PRAGMA table_info(facts)").fetchall()}
@@ -218,12 +422,102 @@ class MemoryStore:
             )
         if "trust_frozen" not in columns:
             self._conn.execute("ALTER TABLE facts ADD COLUMN trust_frozen INTEGER DEFAULT 0")
+        # Search tokens of content+tags, hashed at write time for the rerank.
+        if "token_hashes" not in columns:
+            self._conn.execute("ALTER TABLE facts ADD COLUMN token_hashes BLOB")
+            self._backfill_token_hashes()
+        # Integer twins of created_at / updated_at for decay ranking in SQL.
+        if "created_epoch" not in columns:
+            self._conn.execute("ALTER TABLE facts ADD COLUMN created_epoch INTEGER")
+            self._conn.execute("ALTER TABLE facts ADD COLUMN updated_epoch INTEGER")
+            self._conn.execute(
+                """
+                UPDATE facts
+                SET created_epoch = CAST(strftime('%s', created_at) AS INTEGER),
+                    updated_epoch = CAST(strftime('%s', COALESCE(updated_at, created_at)) AS INTEGER)
+                """
+            )
+        # Incremental bank maintenance: un-normalized phasor sum next to the phase vector.
+        bank_columns = {row[1] for row in self._conn.execute("PRAGMA table_info(memory_banks)").fetchall()}
+        if "sum_vector" not in bank_columns:
+            self._conn.execute("ALTER TABLE memory_banks ADD COLUMN sum_vector BLOB")
         # Partial index: only live (non-tombstoned) facts, speeds up the default query path.
         self._conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_facts_valid ON facts(invalid_at) WHERE invalid_at IS NULL"
         )
         self._conn.commit()
 
+    def _migrate_fts_update_trigger(self) -> None:
+        """Narrow a pre-existing facts_au trigger to UPDATE OF content, tags."""
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'facts_au'"
+        ).fetchone()
+        if row is None or "UPDATE OF" in row["sql"].upper():
+            return
+        self._conn.execute("DROP TRIGGER facts_au")
+        self._conn.execute(
+            """
+            CREATE TRIGGER facts_au AFTER UPDATE OF content, tags ON facts BEGIN
+                INSERT INTO facts_fts(facts_fts, rowid, content, tags)
+                    VALUES ('delete', old.fact_id, old.content, old.tags);
+                INSERT INTO facts_fts(rowid, content, tags)
+                    VALUES (new.fact_id, new.content, new.tags);
+            END
+            """
+        )
+
+    def _backfill_entity_aliases(self) -> None:
+        """Populate entity_aliases from entities.name and the legacy aliases CSV.
+
+        Names are inserted before aliases and lower entity_ids first, so the
+        lookup keeps the precedence of the old name-then-alias LIKE scan.
+        """
+        rows = self._conn.execute(
+            "SELECT entity_id, name, aliases FROM entities ORDER BY entity_id"
+        ).fetchall()
+        names = [(_normalize_alias(row["name"]), row["entity_id"]) for row in rows]
+        aliases = [
+            (_normalize_alias(alias), row["entity_id"])
+            for row in rows
+            for alias in (row["aliases"] or "").split(",")
+        ]
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO entity_aliases (alias_norm, entity_id) VALUES (?, ?)",
+            [pair for pair in names + aliases if pair[0]],
+        )
+
+    def _backfill_token_hashes(self) -> None:
+        """Fill facts.token_hashes for rows written before the column existed."""
+        rows = self._conn.execute("SELECT fact_id, content, tags FROM facts").fetchall()
+        self._conn.executemany(
+            "UPDATE facts SET token_hashes = ? WHERE fact_id = ?",
+            [(fact_token_hashes(row["content"], row["tags"]), row["fact_id"]) for row in rows],
+        )
+
+    def _backfill_fact_terms(self) -> None:
+        """Index every existing fact's conflict terms (one-off migration)."""
+        rows = self._conn.execute("SELECT fact_id, content FROM facts").fetchall()
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO fact_terms (term, fact_id) VALUES (?, ?)",
+            [
+                (term, row["fact_id"])
+                for row in rows
+                for term in _stored_terms(row["content"], _index_terms(row["content"]))
+            ],
+        )
+
+    def _backfill_fact_tags(self) -> None:
+        """Split every existing fact's tags into fact_tags (one-off migration)."""
+        rows = self._conn.execute("SELECT fact_id, tags, created_at FROM facts").fetchall()
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO fact_tags (tag, fact_id, created_at) VALUES (?, ?, ?)",
+            [
+                (tag, row["fact_id"], row["created_at"])
+                for row in rows
+                for tag in split_tags(row["tags"])
+            ],
+        )
+
     def _migrate_v2(self) -> None:
         """Add source_kind/confidence metadata columns, safely re-runnable."""
         try:
@@ -243,10 +537,199 @@ class MemoryStore:
             self._conn.rollback()
             logger.exception("holographic v2 migration failed")
 
+    # ------------------------------------------------------------------
+    # Unit of work
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def transaction(self) -> Iterator["MemoryStore"]:
+        """Group every write inside the block into one SQLite transaction.
+
+        Each public write method commits on its own; inside a transaction those
+        commits are deferred to the end of the outermost block, so one fact (or
+        a whole batch) costs a single WAL fsync. Re-entrant; an exception rolls
+        the whole unit back.
+
+            with store.transaction():
+                store.add_fact(...)
+                store.tombstone_fact(...)
+        """
+        with self._lock:
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._conn.rollback()
+                    self._generation += 1
+                    self._entity_cache.clear()
+                    self._ann = None
+                raise
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self._conn.commit()
+
+    def _commit(self) -> None:
+        """Commit now, unless a transaction() block will commit for us.
+
+        Always bumps the generation: a cache built mid-transaction has seen
+        the uncommitted write, and a rollback bumps it again.
+        """
+        self._generation += 1
+        if self._tx_depth == 0:
+            self._conn.commit()
+
+    @property
+    def generation(self) -> int:
+        """Monotonic write counter covering this and other connections."""
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                if self._data_version is not None:
+                    self._generation += 1
+                    self._ann = None  # another connection wrote; reload buckets
+                self._data_version = data_version
+            return self._generation
+
+    def fact_vectors(self) -> FactVectors | None:
+        """Cached phasor matrix of all live facts with an HRR vector.
+
+        Rebuilt lazily when the store generation changes. Returns None when
+        numpy is unavailable or no fact has a vector at the current dim.
+        """
+        with self._lock:
+            if not self._hrr_available:
+                return None
+            generation = self.generation
+            cached = self._fact_vectors
+            if cached is not None and cached.generation == generation:
+                return cached
+
+            rows = self._conn.execute(
+                """
+                SELECT fact_id, category, trust_score, source_kind, hrr_vector FROM facts
+                WHERE hrr_vector IS NOT NULL AND invalid_at IS NULL
+                ORDER BY fact_id
+                """
+            ).fetchall()
+            rows = [row for row in rows if hrr.blob_dim(row["hrr_vector"]) == self.hrr_dim]
+            if not rows:
+                self._fact_vectors = None
+                return None
+
+            np = hrr.np
+            phasors = hrr.blobs_to_phasors([row["hrr_vector"] for row in rows], self.hrr_dim)
+            fact_ids = np.fromiter((row["fact_id"] for row in rows), dtype=np.int64, count=len(rows))
+            categories = np.array([row["category"] for row in rows], dtype=object)
+            self._fact_vectors = FactVectors(
+                generation=generation,
+                fact_ids=fact_ids,
+                categories=categories,
+                phasors=phasors,
+                index={int(fid): i for i, fid in enumerate(fact_ids)},
+                trust_scores=np.fromiter(
+                    (row["trust_score"] for row in rows), dtype=np.float64, count=len(rows)
+                ),
+                source_kinds=np.array([row["source_kind"] for row in rows], dtype=object),
+            )
+            return self._fact_vectors
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def ann_index(self) -> SimHashIndex | None:
+        """LSH index over live fact vectors, or None below ann_min_facts.
+
+        First use backfills missing signatures into fact_lsh, then loads the
+        buckets; afterwards local writes update them incrementally.
+        """
+        with self._lock:
+            if not self._hrr_available or self.ann_min_facts <= 0:
+                return None
+            self.generation  # noqa: B018 — drops stale buckets on foreign commits
+            if self._ann is not None:
+                return self._ann if len(self._ann) >= self.ann_min_facts else None
+
+            live = self._conn.execute(
+                "SELECT COUNT(*) FROM facts WHERE hrr_vector IS NOT NULL AND invalid_at IS NULL"
+            ).fetchone()[0]
+            if live < self.ann_min_facts:
+                return None
+
+            hasher = self._get_ann_hasher()
+            with self.transaction():
+                while True:
+                    missing = self._conn.execute(
+                        """
+                        SELECT f.fact_id, f.hrr_vector FROM facts f
+                        LEFT JOIN fact_lsh l ON l.fact_id = f.fact_id
+                        WHERE l.fact_id IS NULL
+                          AND f.hrr_vector IS NOT NULL AND f.invalid_at IS NULL
+                        LIMIT 1000
+                        """
+                    ).fetchall()
+                    if not missing:
+                        break
+                    self._ann_upsert([(row["fact_id"], row["hrr_vector"]) for row in missing])
+
+            index = hasher
+            index.clear()
+            rows = self._conn.execute(
+                """
+                SELECT l.fact_id, l.signature FROM fact_lsh l
+                JOIN facts f ON f.fact_id = l.fact_id
+                WHERE f.hrr_vector IS NOT NULL AND f.invalid_at IS NULL
+                """
+            ).fetchall()
+            for row in rows:
+                index.add(row["fact_id"], SimHashIndex.signature_from_bytes(row["signature"]))
+            self._ann = index
+            return index if len(index) >= self.ann_min_facts else None
+
+    def _get_ann_hasher(self) -> SimHashIndex:
+        """Hyperplanes for the current dim; a config change clears fact_lsh."""
+        if self._ann_hasher is None or self._ann_hasher.dim != self.hrr_dim:
+            self._ann_hasher = SimHashIndex(self.hrr_dim)
+            self._ann = None
+            stored = self._get_meta(_ANN_CONFIG_KEY)
+            if stored != self._ann_hasher.config:
+                with self.transaction():
+                    self._conn.execute("DELETE FROM fact_lsh")
+                    self._set_meta(_ANN_CONFIG_KEY, self._ann_hasher.config)
+        return self._ann_hasher
+
+    def _ann_upsert(self, items: "list[tuple[int, bytes]]") -> None:
+        """Write LSH signatures for (fact_id, hrr blob) pairs at the current dim."""
+        if not self._hrr_available or not items:
+            return
+        items = [(fid, blob) for fid, blob in items if hrr.blob_dim(blob) == self.hrr_dim]
+        if not items:
+            return
+        hasher = self._get_ann_hasher()
+        codes = hasher.signatures(hrr.blobs_to_phasors([blob for _, blob in items], self.hrr_dim))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO fact_lsh (fact_id, signature) VALUES (?, ?)",
+            [(fid, SimHashIndex.signature_to_bytes(code)) for (fid, _), code in zip(items, codes)],
+        )
+        if self._ann is not None:
+            for (fid, _), code in zip(items, codes):
+                self._ann.add(fid, code)
+        self._commit()
+
+    def _ann_remove(self, fact_ids: list[int]) -> None:
+        """Drop LSH signatures of tombstoned or purged facts."""
+        if not fact_ids:
+            return
+        self._conn.executemany(
+            "DELETE FROM fact_lsh WHERE fact_id = ?", [(fid,) for fid in fact_ids]
+        )
+        if self._ann is not None:
+            for fid in fact_ids:
+                self._ann.remove(fid)
+        self._commit()
+
     def add_fact(
         self,
         content: str,
@@ -265,8 +748,11 @@ class MemoryStore:
 
         confidence ∈ {"confirmed", "default", "speculative"} → maps to trust_score
         (0.9 / 0.5 / 0.2) and locks trust_frozen=1 so subsequent reads won't decay.
+
+        The insert, entity links, HRR vector and bank delta are written as one
+        transaction (joining the caller's transaction() if one is open).
         """
-        with self._lock:
+        with self.transaction():
             content = content.strip()
             if not content:
                 raise ValueError("content must not be empty")
@@ -288,18 +774,28 @@ class MemoryStore:
             if duplicate is not None:
                 return int(duplicate["fact_id"])
 
+            # Only facts sharing an index term can conflict (see _index_terms),
+            # so the inverted index yields every candidate at any age.
+            terms = _index_terms(content)
+            negation_filter = "" if _has_negation(content) else (
+                "AND fact_id IN (SELECT fact_id FROM fact_terms WHERE term = ?)"
+            )
             candidates = self._conn.execute(
-                """
-                SELECT fact_id, content, trust_score
+                f"""
+                SELECT fact_id, content, trust_score, hrr_vector
                 FROM facts
-                WHERE category = ? AND invalid_at IS NULL
+                WHERE fact_id IN (
+                        SELECT fact_id FROM fact_terms
+                        WHERE term IN (SELECT value FROM json_each(?))
+                    )
+                  {negation_filter}
+                  AND category = ? AND invalid_at IS NULL
                 ORDER BY updated_at DESC
-                LIMIT 201
                 """,
-                (category,),
-            ).fetchall()
-            if len(candidates) > 200:
-                candidates = candidates[:200]
+                (json.dumps(sorted(terms), ensure_ascii=False),
+                 *((_NEGATION_TERM,) if negation_filter else ()),
+                 category),
+            ).fetchall() if terms else []
 
             losing_conflicts: list[sqlite3.Row] = []
             for candidate in candidates:
@@ -310,13 +806,18 @@ class MemoryStore:
                     return int(candidate["fact_id"])
                 losing_conflicts.append(candidate)
 
+            loser_vectors = []
+            self._ann_remove([int(loser["fact_id"]) for loser in losing_conflicts])
             for loser in losing_conflicts:
+                if loser["hrr_vector"] is not None:
+                    loser_vectors.append(loser["hrr_vector"])
                 self._conn.execute(
-                    """
+                    f"""
                     UPDATE facts
                     SET invalid_at = CURRENT_TIMESTAMP,
                         trust_score = 0.05,
-                        updated_at = CURRENT_TIMESTAMP
+                        updated_at = CURRENT_TIMESTAMP,
+                        updated_epoch = {_NOW_EPOCH_SQL}
                     WHERE fact_id = ?
                     """,
                     (loser["fact_id"],),
@@ -324,16 +825,18 @@ class MemoryStore:
 
             try:
                 cur = self._conn.execute(
-                    """
+                    f"""
                     INSERT INTO facts (
                         content, category, tags, source_kind, confidence,
-                        trust_score, source, trust_frozen
+                        trust_score, source, trust_frozen, token_hashes,
+                        created_epoch, updated_epoch
                     )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, {_NOW_EPOCH_SQL}, {_NOW_EPOCH_SQL})
                     """,
-                    (content, category, tags, source_kind, confidence_score, trust_score, source),
+                    (content, category, tags, source_kind, confidence_score, trust_score, source,
+                     fact_token_hashes(content, tags)),
                 )
-                self._conn.commit()
+                self._commit()
                 fact_id: int = cur.lastrowid  # type: ignore[assignment]
             except sqlite3.IntegrityError:
                 # Duplicate content — return existing id (live or tombstoned alike)
@@ -346,10 +849,16 @@ class MemoryStore:
             for name in self._extract_entities(content):
                 entity_id = self._resolve_entity(name)
                 self._link_fact_entity(fact_id, entity_id)
+            self._index_fact_terms(fact_id, content, terms)
+            self._index_fact_tags(fact_id, tags)
 
             # Compute HRR vector after entity linking
-            self._compute_hrr_vector(fact_id, content)
-            self._rebuild_bank(category)
+            vector_blob = self._compute_hrr_vector(fact_id, content)
+            self._update_bank(
+                category,
+                added=[vector_blob] if vector_blob is not None else [],
+                removed=loser_vectors,
+            )
 
             for loser in losing_conflicts:
                 logger.info(
@@ -374,7 +883,9 @@ class MemoryStore:
         """Full-text search over facts using FTS5.
 
         Returns a list of fact dicts ordered by FTS5 rank, then trust_score
-        descending. Also increments retrieval_count for matched facts.
+        descending. Also increments retrieval_count for matched facts —
+        buffered in memory and written in batches (flush_retrieval_counts),
+        unless retrieval_count_mode is "exact".
         Tombstoned facts (invalid_at IS NOT NULL) are excluded by default.
         """
         with self._lock:
@@ -407,17 +918,73 @@ class MemoryStore:
 
             rows = self._conn.execute(sql, params).fetchall()
             results = [self._row_to_dict(r) for r in rows]
+            self.record_retrievals([r["fact_id"] for r in results])
+            return results
+
+    def record_retrievals(self, fact_ids: list[int]) -> None:
+        """Count one retrieval of each fact.
 
-            if results:
-                ids = [r["fact_id"] for r in results]
-                placeholders = ",".join("?" * len(ids))
+        Buffered by default (see flush_retrieval_counts); retrieval_count_mode
+        "exact" writes and commits immediately. Neither bumps the generation:
+        cached results refresh their counts via retrieval_counts().
+        """
+        if not fact_ids:
+            return
+        with self._lock:
+            if self.retrieval_count_mode == "exact":
                 self._conn.execute(
-                    f"UPDATE facts SET retrieval_count = retrieval_count + 1 WHERE fact_id IN ({placeholders})",
-                    ids,
+                    "UPDATE facts SET retrieval_count = retrieval_count + 1 "
+                    "WHERE fact_id IN (SELECT value FROM json_each(?))",
+                    (json.dumps(list(fact_ids)),),
                 )
-                self._conn.commit()
+                if self._tx_depth == 0:
+                    self._conn.commit()
+            else:
+                self._retrieval_pending.update(fact_ids)
+                self._maybe_flush_retrieval_counts()
+
+    def retrieval_counts(self, fact_ids: list[int]) -> dict[int, int]:
+        """Current retrieval_count per fact, including buffered increments."""
+        if not fact_ids:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT fact_id, retrieval_count FROM facts WHERE fact_id IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(fact_ids)),),
+            ).fetchall()
+            return {
+                row["fact_id"]: (row["retrieval_count"] or 0) + self._retrieval_pending.get(row["fact_id"], 0)
+                for row in rows
+            }
 
-            return results
+    def _maybe_flush_retrieval_counts(self) -> None:
+        """Flush buffered increments once enough are pending or enough time passed."""
+        if self._tx_depth:
+            return  # never piggyback on (or get rolled back with) a caller's transaction
+        pending = sum(self._retrieval_pending.values())
+        elapsed = time.monotonic() - self._retrieval_flushed_at
+        if pending >= _RETRIEVAL_FLUSH_PENDING or elapsed >= _RETRIEVAL_FLUSH_SECONDS:
+            self.flush_retrieval_counts()
+
+    def flush_retrieval_counts(self) -> int:
+        """Write buffered retrieval_count increments in one transaction.
+
+        Returns the number of facts updated. Cached search results refresh
+        their counts on read, so this commit does not bump the generation.
+        """
+        with self._lock:
+            self._retrieval_flushed_at = time.monotonic()
+            if not self._retrieval_pending:
+                return 0
+            pending = sorted(self._retrieval_pending.items())
+            self._conn.executemany(
+                "UPDATE facts SET retrieval_count = retrieval_count + ? WHERE fact_id = ?",
+                [(count, fact_id) for fact_id, count in pending],
+            )
+            if self._tx_depth == 0:
+                self._conn.commit()
+            self._retrieval_pending.clear()
+            return len(pending)
 
     def update_fact(
         self,
@@ -431,14 +998,20 @@ class MemoryStore:
 
         Returns True if the row existed, False otherwise.
         """
-        with self._lock:
+        with self.transaction():
             row = self._conn.execute(
-                "SELECT fact_id, trust_score FROM facts WHERE fact_id = ?", (fact_id,)
+                """
+                SELECT fact_id, content, tags, trust_score, category, invalid_at, hrr_vector
+                FROM facts WHERE fact_id = ?
+                """,
+                (fact_id,),
             ).fetchone()
             if row is None:
                 return False
 
-            assignments: list[str] = ["updated_at = CURRENT_TIMESTAMP"]
+            assignments: list[str] = [
+                "updated_at = CURRENT_TIMESTAMP", f"updated_epoch = {_NOW_EPOCH_SQL}",
+            ]
             params: list = []
 
             if content is not None:
@@ -454,13 +1027,19 @@ class MemoryStore:
                 new_trust = _clamp_trust(row["trust_score"] + trust_delta)
                 assignments.append("trust_score = ?")
                 params.append(new_trust)
+            if content is not None or tags is not None:
+                assignments.append("token_hashes = ?")
+                params.append(fact_token_hashes(
+                    content.strip() if content is not None else row["content"],
+                    tags if tags is not None else row["tags"],
+                ))
 
             params.append(fact_id)
             self._conn.execute(
                 f"UPDATE facts SET {', '.join(assignments)} WHERE fact_id = ?",
                 params,
             )
-            self._conn.commit()
+            self._commit()
 
             # If content changed, re-extract entities
             if content is not None:
@@ -470,16 +1049,29 @@ class MemoryStore:
                 for name in self._extract_entities(content):
                     entity_id = self._resolve_entity(name)
                     self._link_fact_entity(fact_id, entity_id)
-                self._conn.commit()
+                self._conn.execute("DELETE FROM fact_terms WHERE fact_id = ?", (fact_id,))
+                self._index_fact_terms(fact_id, content.strip())
+                self._commit()
+            if tags is not None:
+                self._conn.execute("DELETE FROM fact_tags WHERE fact_id = ?", (fact_id,))
+                self._index_fact_tags(fact_id, tags)
 
             # Recompute HRR vector if content changed
+            new_vector = row["hrr_vector"]
             if content is not None:
-                self._compute_hrr_vector(fact_id, content)
-            # Rebuild bank for relevant category
-            cat = category or self._conn.execute(
-                "SELECT category FROM facts WHERE fact_id = ?", (fact_id,)
-            ).fetchone()["category"]
-            self._rebuild_bank(cat)
+                new_vector = self._compute_hrr_vector(fact_id, content)
+            # Move the fact's contribution between banks (delta, not rebuild).
+            # Tombstoned facts are not in any bank, so they need no adjustment.
+            new_category = category if category is not None else row["category"]
+            moved = new_category != row["category"] or content is not None
+            if row["invalid_at"] is None and moved:
+                old = [row["hrr_vector"]] if row["hrr_vector"] is not None else []
+                new = [new_vector] if new_vector is not None else []
+                if new_category == row["category"]:
+                    self._update_bank(new_category, added=new, removed=old)
+                else:
+                    self._update_bank(row["category"], removed=old)
+                    self._update_bank(new_category, added=new)
 
             return True
 
@@ -487,12 +1079,13 @@ class MemoryStore:
         """Soft-delete (tombstone): mark invalid_at, optionally link supersedor.
 
         Tombstoned facts survive in the DB (for audit / superseded_by graph traversal)
-        but are excluded from search / list by default. Rebuilds the HRR bank so the
-        fact stops contributing to category-level similarity search.
+        but are excluded from search / list by default. Subtracts the fact from its
+        HRR bank so it stops contributing to category-level similarity search.
         """
-        with self._lock:
+        with self.transaction():
             row = self._conn.execute(
-                "SELECT fact_id, category, invalid_at FROM facts WHERE fact_id = ?", (fact_id,)
+                "SELECT fact_id, category, invalid_at, hrr_vector FROM facts WHERE fact_id = ?",
+                (fact_id,),
             ).fetchone()
             if row is None:
                 return False
@@ -500,17 +1093,20 @@ class MemoryStore:
                 return True  # already tombstoned, nothing to do
 
             self._conn.execute(
-                """
+                f"""
                 UPDATE facts
                 SET invalid_at = COALESCE(invalid_at, CURRENT_TIMESTAMP),
                     superseded_by = COALESCE(?, superseded_by),
-                    updated_at = CURRENT_TIMESTAMP
+                    updated_at = CURRENT_TIMESTAMP,
+                    updated_epoch = {_NOW_EPOCH_SQL}
                 WHERE fact_id = ?
                 """,
                 (superseded_by, fact_id),
             )
-            self._conn.commit()
-            self._rebuild_bank(row["category"])
+            self._commit()
+            self._ann_remove([fact_id])
+            if row["invalid_at"] is None and row["hrr_vector"] is not None:
+                self._update_bank(row["category"], removed=[row["hrr_vector"]])
             return True
 
     def purge_fact(self, fact_id: int) -> bool:
@@ -518,9 +1114,10 @@ class MemoryStore:
 
         Removes the fact + its entity links permanently. Returns True if the row existed.
         """
-        with self._lock:
+        with self.transaction():
             row = self._conn.execute(
-                "SELECT fact_id, category FROM facts WHERE fact_id = ?", (fact_id,)
+                "SELECT fact_id, category, invalid_at, hrr_vector FROM facts WHERE fact_id = ?",
+                (fact_id,),
             ).fetchone()
             if row is None:
                 return False
@@ -528,9 +1125,13 @@ class MemoryStore:
             self._conn.execute(
                 "DELETE FROM fact_entities WHERE fact_id = ?", (fact_id,)
             )
+            self._conn.execute("DELETE FROM fact_terms WHERE fact_id = ?", (fact_id,))
+            self._conn.execute("DELETE FROM fact_tags WHERE fact_id = ?", (fact_id,))
             self._conn.execute("DELETE FROM facts WHERE fact_id = ?", (fact_id,))
-            self._conn.commit()
-            self._rebuild_bank(row["category"])
+            self._commit()
+            self._ann_remove([fact_id])
+            if row["invalid_at"] is None and row["hrr_vector"] is not None:
+                self._update_bank(row["category"], removed=[row["hrr_vector"]])
             return True
 
     # Backwards-compat shim: retain old name for any callers we haven't migrated yet.
@@ -548,17 +1149,17 @@ class MemoryStore:
         are the only place where real deletion — not tombstoning — is correct.
         Returns count of rows deleted.
         """
-        with self._lock:
+        with self.transaction():
             if not categories:
                 return 0
             placeholders = ",".join("?" * len(categories))
             params: list = list(categories)
             params.append(max_age_days)
 
-            # Select first so we can rebuild affected banks after deletion.
+            # Select first so we can subtract live facts from their banks after deletion.
             affected = self._conn.execute(
                 f"""
-                SELECT fact_id, category FROM facts
+                SELECT fact_id, category, invalid_at, hrr_vector FROM facts
                 WHERE category IN ({placeholders})
                   AND (julianday('now') - julianday(created_at)) > ?
                 """,
@@ -568,17 +1169,27 @@ class MemoryStore:
                 return 0
 
             ids = [r["fact_id"] for r in affected]
-            cats = {r["category"] for r in affected}
+            removed_by_cat: dict[str, list[bytes]] = {}
+            for r in affected:
+                if r["invalid_at"] is None and r["hrr_vector"] is not None:
+                    removed_by_cat.setdefault(r["category"], []).append(r["hrr_vector"])
             id_placeholders = ",".join("?" * len(ids))
             self._conn.execute(
                 f"DELETE FROM fact_entities WHERE fact_id IN ({id_placeholders})", ids
             )
+            self._conn.execute(
+                f"DELETE FROM fact_terms WHERE fact_id IN ({id_placeholders})", ids
+            )
+            self._conn.execute(
+                f"DELETE FROM fact_tags WHERE fact_id IN ({id_placeholders})", ids
+            )
             self._conn.execute(
                 f"DELETE FROM facts WHERE fact_id IN ({id_placeholders})", ids
             )
-            self._conn.commit()
-            for c in cats:
-                self._rebuild_bank(c)
+            self._commit()
+            self._ann_remove(ids)
+            for c, removed in removed_by_cat.items():
+                self._update_bank(c, removed=removed)
             return len(ids)
 
     def list_facts(
@@ -642,16 +1253,17 @@ class MemoryStore:
 
             helpful_increment = 1 if helpful else 0
             self._conn.execute(
-                """
+                f"""
                 UPDATE facts
                 SET trust_score    = ?,
                     helpful_count  = helpful_count + ?,
-                    updated_at     = CURRENT_TIMESTAMP
+                    updated_at     = CURRENT_TIMESTAMP,
+                    updated_epoch  = {_NOW_EPOCH_SQL}
                 WHERE fact_id = ?
                 """,
                 (new_trust, helpful_increment, fact_id),
             )
-            self._conn.commit()
+            self._commit()
 
             return {
                 "fact_id":      fact_id,
@@ -704,30 +1316,56 @@ class MemoryStore:
 
         Returns the entity_id.
         """
-        # Exact name match
+        alias_norm = _normalize_alias(name)
+        entity_id = self._entity_cache.get(alias_norm)
+        if entity_id is not None:
+            return entity_id
+
+        # Names and aliases share one normalized, primary-keyed lookup table.
         row = self._conn.execute(
-            "SELECT entity_id FROM entities WHERE name LIKE ?", (name,)
+            "SELECT entity_id FROM entity_aliases WHERE alias_norm = ?", (alias_norm,)
         ).fetchone()
         if row is not None:
-            return int(row["entity_id"])
-
-        # Search aliases — aliases stored as comma-separated; use LIKE with % boundaries
-        alias_row = self._conn.execute(
-            """
-            SELECT entity_id FROM entities
-            WHERE ',' || aliases || ',' LIKE '%,' || ? || ',%'
-            """,
-            (name,),
-        ).fetchone()
-        if alias_row is not None:
-            return int(alias_row["entity_id"])
-
-        # Create new entity
-        cur = self._conn.execute(
-            "INSERT INTO entities (name) VALUES (?)", (name,)
+            entity_id = int(row["entity_id"])
+        else:
+            # Create new entity
+            cur = self._conn.execute(
+                "INSERT INTO entities (name) VALUES (?)", (name,)
+            )
+            entity_id = int(cur.lastrowid)  # type: ignore[arg-type]
+            self._conn.execute(
+                "INSERT OR IGNORE INTO entity_aliases (alias_norm, entity_id) VALUES (?, ?)",
+                (alias_norm, entity_id),
+            )
+            self._commit()
+
+        self._entity_cache[alias_norm] = entity_id
+        return entity_id
+
+    def _index_fact_terms(self, fact_id: int, content: str, terms: "set[str] | None" = None) -> None:
+        """Record a fact's conflict index terms in fact_terms."""
+        if terms is None:
+            terms = _index_terms(content)
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO fact_terms (term, fact_id) VALUES (?, ?)",
+            [(term, fact_id) for term in _stored_terms(content, terms)],
         )
-        self._conn.commit()
-        return int(cur.lastrowid)  # type: ignore[return-value]
+        self._commit()
+
+    def _index_fact_tags(self, fact_id: int, tags: str | None) -> None:
+        """Record a fact's tags in fact_tags, stamped with the fact's created_at."""
+        tag_list = split_tags(tags)
+        if tag_list:
+            self._conn.execute(
+                """
+                INSERT OR IGNORE INTO fact_tags (tag, fact_id, created_at)
+                SELECT j.value, f.fact_id, f.created_at
+                FROM facts f, json_each(?) j
+                WHERE f.fact_id = ?
+                """,
+                (json.dumps(tag_list), fact_id),
+            )
+        self._commit()
 
     def _link_fact_entity(self, fact_id: int, entity_id: int) -> None:
         """Insert into fact_entities, silently ignore if the link already exists."""
@@ -738,13 +1376,16 @@ class MemoryStore:
             """,
             (fact_id, entity_id),
         )
-        self._conn.commit()
+        self._commit()
 
-    def _compute_hrr_vector(self, fact_id: int, content: str) -> None:
-        """Compute and store HRR vector for a fact. No-op if numpy unavailable."""
+    def _compute_hrr_vector(self, fact_id: int, content: str) -> bytes | None:
+        """Compute and store HRR vector for a fact; returns the stored blob.
+
+        No-op (returns None) if numpy unavailable.
+        """
         with self._lock:
             if not self._hrr_available:
-                return
+                return None
 
             # Get entities linked to this fact
             rows = self._conn.execute(
@@ -758,78 +1399,300 @@ class MemoryStore:
             entities = [row["name"] for row in rows]
 
             vector = hrr.encode_fact(content, entities, self.hrr_dim)
+            blob = hrr.phases_to_bytes(vector)
             self._conn.execute(
                 "UPDATE facts SET hrr_vector = ? WHERE fact_id = ?",
-                (hrr.phases_to_bytes(vector), fact_id),
+                (blob, fact_id),
             )
-            self._conn.commit()
+            self._commit()
+            # Tombstoned facts keep their vector but stay out of the LSH index.
+            live = self._conn.execute(
+                "SELECT 1 FROM facts WHERE fact_id = ? AND invalid_at IS NULL", (fact_id,)
+            ).fetchone()
+            if live:
+                self._ann_upsert([(fact_id, blob)])
+            return blob
+
+    def _update_bank(
+        self,
+        category: str,
+        added: "list[bytes] | tuple[bytes, ...]" = (),
+        removed: "list[bytes] | tuple[bytes, ...]" = (),
+    ) -> None:
+        """Apply a delta to a category bank: O(changed facts · dim), not O(n · dim).
+
+        The bank keeps the un-normalized phasor sum of its facts in sum_vector;
+        adding or removing a fact adds or subtracts its unit phasor and the
+        phase vector is re-derived from the sum. Banks written before
+        sum_vector existed (or at another dim) fall back to one full rebuild.
+        """
+        with self._lock:
+            if not self._hrr_available or (not added and not removed):
+                return
+
+            bank_name = f"cat:{category}"
+            bank = self._conn.execute(
+                "SELECT sum_vector, dim, fact_count FROM memory_banks WHERE bank_name = ?",
+                (bank_name,),
+            ).fetchone()
+            if bank is None and removed:
+                # Nothing to subtract from — the bank is out of sync; repair it.
+                self._rebuild_bank(category)
+                return
+            if bank is not None and (bank["sum_vector"] is None or bank["dim"] != self.hrr_dim):
+                self._rebuild_bank(category)
+                return
+
+            if bank is None:
+                complex_sum = hrr.bundle_sum(hrr.bytes_to_phases(b) for b in added)
+                fact_count = len(added)
+            else:
+                complex_sum = hrr.bytes_to_complex(bank["sum_vector"])
+                if added:
+                    complex_sum += hrr.bundle_sum(hrr.bytes_to_phases(b) for b in added)
+                if removed:
+                    complex_sum -= hrr.bundle_sum(hrr.bytes_to_phases(b) for b in removed)
+                fact_count = int(bank["fact_count"] or 0) + len(added) - len(removed)
+
+            if fact_count <= 0:
+                self._conn.execute("DELETE FROM memory_banks WHERE bank_name = ?", (bank_name,))
+                self._commit()
+                return
+
+            hrr.snr_estimate(self.hrr_dim, fact_count)
+            self._write_bank(bank_name, complex_sum, fact_count)
+
+    def _write_bank(self, bank_name: str, complex_sum: "np.ndarray", fact_count: int) -> None:
+        self._conn.execute(
+            """
+            INSERT INTO memory_banks (bank_name, vector, dim, fact_count, updated_at, sum_vector)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+            ON CONFLICT(bank_name) DO UPDATE SET
+                vector = excluded.vector,
+                dim = excluded.dim,
+                fact_count = excluded.fact_count,
+                updated_at = excluded.updated_at,
+                sum_vector = excluded.sum_vector
+            """,
+            (
+                bank_name,
+                hrr.phases_to_bytes(hrr.sum_to_phases(complex_sum)),
+                self.hrr_dim,
+                fact_count,
+                hrr.complex_to_bytes(complex_sum),
+            ),
+        )
+        self._commit()
 
     def _rebuild_bank(self, category: str) -> None:
-        """Full rebuild of a category's memory bank from all its fact vectors."""
+        """Full rebuild of a category's memory bank from all its fact vectors.
+
+        Repair path only — regular writes go through _update_bank deltas.
+        """
         with self._lock:
             if not self._hrr_available:
                 return
 
             bank_name = f"cat:{category}"
-            rows = self._conn.execute(
-                """
-                SELECT hrr_vector FROM facts
-                WHERE category = ? AND hrr_vector IS NOT NULL AND invalid_at IS NULL
-                """,
-                (category,),
-            ).fetchall()
+            where = "WHERE category = ? AND hrr_vector IS NOT NULL AND invalid_at IS NULL"
+            fact_count = self._conn.execute(
+                f"SELECT COUNT(*) FROM facts {where}", (category,)
+            ).fetchone()[0]
 
-            if not rows:
+            if not fact_count:
                 self._conn.execute("DELETE FROM memory_banks WHERE bank_name = ?", (bank_name,))
-                self._conn.commit()
+                self._commit()
                 return
 
-            vectors = [hrr.bytes_to_phases(row["hrr_vector"]) for row in rows]
-            bank_vector = hrr.bundle(*vectors)
-            fact_count = len(vectors)
+            # Stream rows into the accumulator rather than materializing them.
+            cursor = self._conn.execute(f"SELECT hrr_vector FROM facts {where}", (category,))
+            complex_sum = hrr.bundle_sum(hrr.bytes_to_phases(row["hrr_vector"]) for row in cursor)
 
             # Check SNR
             hrr.snr_estimate(self.hrr_dim, fact_count)
 
-            self._conn.execute(
-                """
-                INSERT INTO memory_banks (bank_name, vector, dim, fact_count, updated_at)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(bank_name) DO UPDATE SET
-                    vector = excluded.vector,
-                    dim = excluded.dim,
-                    fact_count = excluded.fact_count,
-                    updated_at = excluded.updated_at
-                """,
-                (bank_name, hrr.phases_to_bytes(bank_vector), self.hrr_dim, fact_count),
-            )
-            self._conn.commit()
+            self._write_bank(bank_name, complex_sum, fact_count)
 
-    def rebuild_all_vectors(self, dim: int | None = None) -> int:
-        """Recompute all HRR vectors + banks from text. For recovery/migration.
+    def rebuild_banks(self, categories: "list[str] | None" = None) -> dict:
+        """Explicit repair: rebuild category banks from scratch.
 
-        Returns the number of facts processed.
+        Rebuilds the given categories, or every category that has facts or a
+        bank row. Returns {"banks": <count rebuilt>}.
         """
         with self._lock:
             if not self._hrr_available:
-                return 0
+                return {"banks": 0}
+            if categories is None:
+                rows = self._conn.execute(
+                    """
+                    SELECT DISTINCT category FROM facts
+                    UNION
+                    SELECT substr(bank_name, 5) FROM memory_banks WHERE bank_name LIKE 'cat:%'
+                    """
+                ).fetchall()
+                categories = [row[0] for row in rows if row[0] is not None]
+            for category in categories:
+                self._rebuild_bank(category)
+            return {"banks": len(categories)}
+
+    def rebuild_all_vectors(
+        self,
+        dim: int | None = None,
+        workers: int | None = None,
+        chunk_size: int = 500,
+        resume: bool = True,
+        progress: "Callable[[int, int], None] | None" = None,
+    ) -> int:
+        """Recompute all HRR vectors + banks from text. For recovery/migration.
 
-            if dim is not None:
-                self.hrr_dim = dim
+        Facts are streamed in fact_id order, `chunk_size` at a time, with one
+        grouped entity query per chunk. Encoding is pure, so chunks are farmed
+        out to a process pool (`workers`, default min(4, cpu_count); 1 = in
+        process). Each chunk is written with executemany in its own
+        transaction together with a checkpoint in store_meta, so an
+        interrupted rebuild resumes after the last written chunk when called
+        again with the same dim. `progress(done, total)` is called after each
+        chunk.
 
-            rows = self._conn.execute(
-                "SELECT fact_id, content, category FROM facts"
-            ).fetchall()
+        Returns the number of facts processed by this call.
+        """
+        if not self._hrr_available:
+            return 0
+        if dim is not None:
+            self.hrr_dim = dim
 
-            categories: set[str] = set()
-            for row in rows:
-                self._compute_hrr_vector(row["fact_id"], row["content"])
-                categories.add(row["category"])
+        with self._lock:
+            checkpoint = self._get_meta(_REBUILD_CHECKPOINT_KEY)
+            start_after = 0
+            if resume and checkpoint and checkpoint.get("dim") == self.hrr_dim:
+                start_after = int(checkpoint.get("last_fact_id") or 0)
+            total = self._conn.execute(
+                "SELECT COUNT(*) FROM facts WHERE fact_id > ?", (start_after,)
+            ).fetchone()[0]
+            with self.transaction():
+                self._set_meta(
+                    _REBUILD_CHECKPOINT_KEY,
+                    {"dim": self.hrr_dim, "last_fact_id": start_after},
+                )
 
-            for category in categories:
-                self._rebuild_bank(category)
+        if workers is None:
+            workers = min(4, os.cpu_count() or 1)
+        use_pool = workers > 1 and total > chunk_size
+
+        done = 0
+        chunks = self._rebuild_chunks(start_after, chunk_size)
+        if not use_pool:
+            for batch in chunks:
+                done += self._write_rebuilt_chunk(hrr.encode_fact_batch(batch, self.hrr_dim))
+                if progress:
+                    progress(done, total)
+        else:
+            # Bounded in-flight window keeps memory flat; results are written
+            # in submission order so the checkpoint only ever moves forward.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                pending = []
+                for batch in chunks:
+                    pending.append(pool.submit(hrr.encode_fact_batch, batch, self.hrr_dim))
+                    if len(pending) >= workers * 2:
+                        done += self._write_rebuilt_chunk(pending.pop(0).result())
+                        if progress:
+                            progress(done, total)
+                for future in pending:
+                    done += self._write_rebuilt_chunk(future.result())
+                    if progress:
+                        progress(done, total)
+
+        with self._lock:
+            self.rebuild_banks()
+            with self.transaction():
+                self._conn.execute("DELETE FROM store_meta WHERE key = ?", (_REBUILD_CHECKPOINT_KEY,))
+        return done
+
+    def _rebuild_chunks(self, start_after: int, chunk_size: int) -> "Iterator[list[tuple[int, str, list[str]]]]":
+        """Yield [(fact_id, content, entity_names), ...] chunks by keyset pagination."""
+        last_id = start_after
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT fact_id, content FROM facts WHERE fact_id > ? ORDER BY fact_id LIMIT ?",
+                    (last_id, chunk_size),
+                ).fetchall()
+                if not rows:
+                    return
+                fact_ids = [row["fact_id"] for row in rows]
+                placeholders = ",".join("?" * len(fact_ids))
+                entity_rows = self._conn.execute(
+                    f"""
+                    SELECT fe.fact_id, e.name FROM fact_entities fe
+                    JOIN entities e ON e.entity_id = fe.entity_id
+                    WHERE fe.fact_id IN ({placeholders})
+                    """,
+                    fact_ids,
+                ).fetchall()
+            entities: dict[int, list[str]] = {}
+            for row in entity_rows:
+                entities.setdefault(row["fact_id"], []).append(row["name"])
+            last_id = fact_ids[-1]
+            yield [(row["fact_id"], row["content"], entities.get(row["fact_id"], [])) for row in rows]
+
+    def _write_rebuilt_chunk(self, encoded: list[tuple[bytes, int]]) -> int:
+        """Write one chunk of (blob, fact_id) pairs and advance the checkpoint."""
+        if not encoded:
+            return 0
+        with self._lock, self.transaction():
+            self._conn.executemany("UPDATE facts SET hrr_vector = ? WHERE fact_id = ?", encoded)
+            retired = {
+                row[0]
+                for row in self._conn.execute(
+                    """
+                    SELECT f.fact_id FROM facts f, json_each(?) j
+                    WHERE f.fact_id = j.value AND f.invalid_at IS NOT NULL
+                    """,
+                    (json.dumps([fact_id for _, fact_id in encoded]),),
+                )
+            }
+            # Match tombstone_fact's index upkeep: retired facts get a fresh
+            # vector but no LSH signature (and lose any stale one).
+            self._ann_upsert([(fact_id, blob) for blob, fact_id in encoded if fact_id not in retired])
+            self._ann_remove(sorted(retired))
+            self._set_meta(
+                _REBUILD_CHECKPOINT_KEY,
+                {"dim": self.hrr_dim, "last_fact_id": max(fact_id for _, fact_id in encoded)},
+            )
+        return len(encoded)
 
-            return len(rows)
+    def _get_meta(self, key: str) -> "dict | None":
+        row = self._conn.execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row["value"]) if row else None
+
+    def _set_meta(self, key: str, value: dict) -> None:
+        self._conn.execute(
+            """
+            INSERT INTO store_meta (key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """,
+            (key, json.dumps(value)),
+        )
+        self._commit()
+
+    def compact_vectors(self, vacuum: bool = False) -> dict:
+        """Rewrite legacy float64 vector blobs in the compact uint16 format.
+
+        Idempotent. With vacuum=True the freed pages are returned to the OS.
+        Returns {"facts": n, "memory_banks": n, "vacuumed": bool}.
+        """
+        with self._lock:
+            if not self._hrr_available:
+                return {"facts": 0, "memory_banks": 0, "vacuumed": False}
+            with self.transaction():
+                counts = hrr.compact_blobs(self._conn)
+                if counts["facts"] or counts["memory_banks"]:
+                    # Rewritten blobs invalidate fact_vectors() and the recall cache.
+                    self._commit()
+            if vacuum:
+                self._conn.execute("VACUUM")
+            return {**counts, "vacuumed": vacuum}
 
     # ------------------------------------------------------------------
     # Utilities
@@ -840,7 +1703,12 @@ class MemoryStore:
         return dict(row)
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Flush buffered retrieval counts and close the database connection."""
+        try:
+            self.flush_retrieval_counts()
+        except sqlite3.Error as exc:
+            logger.warning("dropping %d buffered retrieval counts: %s",
+                           len(self._retrieval_pending), exc)
         self._conn.close()
 
     def __enter__(self) -> "MemoryStore":
@@ -862,7 +1730,13 @@ def _run_conflict_smoke_tests() -> int:
     failures: list[str] = []
     for index, (existing, incoming, expected) in enumerate(cases, start=1):
         actual = _detect_conflict(existing, incoming)
-        if actual == expected:
+        reachable = (bool(_index_terms(existing) & _index_terms(incoming))
+                     and (_has_negation(existing) or _has_negation(incoming)))
+        if actual and not reachable:
+            # add_fact only checks facts sharing an index term (and, for a
+            # non-negated incoming fact, only negated candidates).
+            failures.append(f"case {index} failed: conflict not reachable via fact_terms")
+        elif actual == expected:
             passed += 1
         else:
             failures.append(
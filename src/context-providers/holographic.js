@@ -1,5 +1,10 @@
 import { join } from 'node:path';
-import { recallMemory } from '../memory.js';
+import {
+  memoryEntityOperation,
+  memorySearchOperation,
+  memoryThreadOperation,
+  recallMemoryBatch,
+} from '../memory.js';
 import { memoryManifestItem, sha16 } from './interface.js';
 
 export function memoriesToFragments(memories, retrievedAt) {
@@ -20,11 +25,84 @@ export function memoriesToFragments(memories, retrievedAt) {
   }).filter((f) => f.content);
 }
 
+const MAX_RECALL_ENTITIES = 3;
+const ENTITY_RECALL_LIMIT = 3;
+const THREAD_RECALL_LIMIT = 5;
+// Below this HRR similarity a probe hit is crosstalk, not a fact about the
+// entity (see benchmark() in lib/holographic/ann.py).
+const ENTITY_MIN_SIMILARITY = 0.2;
+
+const CAPITALIZED_RE = /\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b/g;
+const DOUBLE_QUOTE_RE = /"([^"]{1,64})"/g;
+
+// Entity candidates in the user text, by the same capitalized-phrase and
+// double-quote rules MemoryStore._extract_entities() indexes facts with.
+// Single quotes are skipped: in chat text they are mostly apostrophes. A
+// phrase opening a sentence ("Did Tokyo Office ...") is also tried without
+// its first word; probes that match nothing are filtered out later.
+export function extractRecallEntities(text) {
+  const seen = new Set();
+  const entities = [];
+  const add = (name) => {
+    const key = name.trim().toLowerCase();
+    if (!key || seen.has(key)) return;
+    seen.add(key);
+    entities.push(name.trim());
+  };
+  for (const match of (text || '').matchAll(CAPITALIZED_RE)) {
+    const words = match[1].split(/\s+/);
+    const sentenceStart = /(^|[.!?])$/.test(text.slice(0, match.index).trimEnd());
+    add(match[1]);
+    if (sentenceStart && words.length >= 3) add(words.slice(1).join(' '));
+  }
+  for (const match of (text || '').matchAll(DOUBLE_QUOTE_RE)) add(match[1]);
+  return entities.slice(0, MAX_RECALL_ENTITIES);
+}
+
+// Recall strategies for one turn: the user text, the entities it names and
+// the current thread. All of them go to the bridge as a single multi_search
+// call, so adding a strategy adds no round-trip.
+export function recallOperations(ctx) {
+  const operations = [];
+  if (ctx.userText) {
+    operations.push(memorySearchOperation(ctx.userText));
+    for (const entity of extractRecallEntities(ctx.userText)) {
+      operations.push(memoryEntityOperation(entity, ENTITY_RECALL_LIMIT));
+    }
+  }
+  if (ctx.threadTs) operations.push(memoryThreadOperation(ctx.threadTs, THREAD_RECALL_LIMIT));
+  return operations;
+}
+
+// Entity probes always return their top hits; keep only real matches.
+function relevantResults(operation, results) {
+  if (operation.command !== 'probe' || !Array.isArray(results)) return results;
+  return results.filter((m) => m.similarity === undefined || m.similarity >= ENTITY_MIN_SIMILARITY);
+}
+
+// Flatten per-operation results, keeping the first occurrence of each fact.
+export function mergeRecallResults(resultLists) {
+  const seen = new Set();
+  const merged = [];
+  for (const results of resultLists) {
+    for (const m of Array.isArray(results) ? results : []) {
+      const key = m.fact_id ?? m.content;
+      if (seen.has(key)) continue;
+      seen.add(key);
+      merged.push(m);
+    }
+  }
+  return merged;
+}
+
 export const holographicProvider = {
   name: 'holographic',
   async prefetch(ctx) {
     const dbPath = ctx.dataDir ? join(ctx.dataDir, 'memory.db') : undefined;
-    const memories = await recallMemory(ctx.userText, ctx.userId, dbPath);
+    const operations = recallOperations(ctx);
+    if (operations.length === 0) return [];
+    const results = await recallMemoryBatch(operations, dbPath);
+    const memories = mergeRecallResults(results.map((list, i) => relevantResults(operations[i], list)));
     return memoriesToFragments(memories, ctx.retrievedAt || new Date().toISOString());
   },
 };
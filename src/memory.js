@@ -4,13 +4,15 @@
  * Called via Python subprocess bridge.
  */
 
-import { execFile } from 'node:child_process';
+import { execFile, spawn } from 'node:child_process';
 import { join, dirname, basename } from 'node:path';
 import { fileURLToPath } from 'node:url';
 import { info, warn } from './log.js';
 import {
   ORB_MEMORY_MIN_TRUST,
   ORB_MEMORY_RECALL_LIMIT,
+  ORB_MEMORY_RESIDENT_BRIDGE,
+  MEMORY_ARBITRATE_TIMEOUT_SEC,
   MEMORY_ENABLED,
   PYTHON_PATH,
 } from './runtime-env.js';
@@ -81,14 +83,139 @@ function createBridgeError(prefix, err, stderr = '') {
   return wrapped;
 }
 
-// ── Holographic bridge (JSON args) ──
+// ── Resident holographic bridge (bridge.py serve) ──
+//
+// One long-lived Python process per Node process keeps a warm MemoryStore per
+// db_path, so recall does not pay interpreter + numpy + schema setup per call.
+// Requests are NDJSON with ids; responses may arrive out of order.
+//
+// A timeout fails only its own request — Python may still be finishing it
+// (a slow arbitration, a large rebuild) and other requests are unaffected. The
+// process is restarted only when it is wedged: it does not answer a ping
+// within RESIDENT_PING_TIMEOUT_MS after a timeout.
 
-function holographicBridge(dbPath, command, args = {}) {
+const RESIDENT_PING_TIMEOUT_MS = 10_000;
+
+let resident = null;
+
+function stopResidentBridge(reason) {
+  const current = resident;
+  if (!current) return;
+  resident = null;
+  for (const { reject, timer } of current.pending.values()) {
+    clearTimeout(timer);
+    reject(reason);
+  }
+  current.pending.clear();
+  try { current.child.kill(); } catch {}
+}
+
+function startResidentBridge() {
+  const child = spawn(PYTHON, [HOLOGRAPHIC_BRIDGE, 'serve'], { stdio: ['pipe', 'pipe', 'pipe'] });
+  const state = { child, pending: new Map(), nextId: 1, stdoutBuffer: '', stderrBuffer: '', checking: false };
+
+  child.stdout.setEncoding('utf8');
+  child.stdout.on('data', (chunk) => {
+    state.stdoutBuffer += chunk;
+    let newline;
+    while ((newline = state.stdoutBuffer.indexOf('\n')) >= 0) {
+      const line = state.stdoutBuffer.slice(0, newline).trim();
+      state.stdoutBuffer = state.stdoutBuffer.slice(newline + 1);
+      if (!line) continue;
+      let response;
+      try { response = JSON.parse(line); } catch { continue; }
+      const entry = state.pending.get(response.id);
+      if (!entry) continue;
+      state.pending.delete(response.id);
+      clearTimeout(entry.timer);
+      if (response.error !== undefined) {
+        entry.reject(new Error(`holographic ${entry.command} failed: ${response.error}`));
+      } else {
+        entry.resolve(response.result);
+      }
+    }
+  });
+  child.stderr.setEncoding('utf8');
+  child.stderr.on('data', (chunk) => {
+    state.stderrBuffer += chunk;
+    const lastNewline = state.stderrBuffer.lastIndexOf('\n');
+    if (lastNewline < 0) return;
+    const complete = state.stderrBuffer.slice(0, lastNewline);
+    state.stderrBuffer = state.stderrBuffer.slice(lastNewline + 1);
+    const passthrough = forwardArbitrateStderr(complete);
+    if (passthrough) warn(TAG, `resident bridge stderr: ${passthrough}`);
+  });
+  child.stdin.on('error', () => {});
+  child.on('error', (err) => {
+    // Only a failed spawn proves no request ever reached Python.
+    if (String(err.syscall || '').startsWith('spawn')) err.kind = 'spawn';
+    if (resident === state) stopResidentBridge(err);
+  });
+  child.on('exit', (code, signal) => {
+    if (resident === state) {
+      stopResidentBridge(new Error(`resident bridge exited (code=${code} signal=${signal})`));
+    }
+  });
+
+  // Idle bridge must not keep a worker process alive; pending request timers do.
+  child.unref();
+  child.stdin.unref?.();
+  child.stdout.unref?.();
+  child.stderr.unref?.();
+  return state;
+}
+
+function checkResidentBridge(state) {
+  if (state.checking || resident !== state) return;
+  state.checking = true;
+  sendResidentRequest(state, null, 'ping', {}, RESIDENT_PING_TIMEOUT_MS).then(
+    () => { state.checking = false; },
+    (err) => {
+      state.checking = false;
+      if (err.kind === 'timeout' && resident === state) {
+        warn(TAG, `resident bridge wedged (no ping answer in ${RESIDENT_PING_TIMEOUT_MS}ms); restarting`);
+        stopResidentBridge(new Error('resident bridge restarted: unresponsive after a timeout'));
+      }
+    },
+  );
+}
+
+function residentBridge(dbPath, command, args, timeoutMs) {
+  if (!resident) resident = startResidentBridge();
+  return sendResidentRequest(resident, dbPath, command, args, timeoutMs);
+}
+
+function sendResidentRequest(state, dbPath, command, args, timeoutMs) {
+  return new Promise((resolve, reject) => {
+    const id = state.nextId++;
+    const timer = setTimeout(() => {
+      if (!state.pending.has(id)) return;
+      // A late response for this id is dropped by the stdout handler.
+      state.pending.delete(id);
+      const err = new Error(`holographic ${command} timed out after ${timeoutMs}ms`);
+      err.kind = 'timeout';
+      reject(err);
+      if (command !== 'ping') checkResidentBridge(state);
+    }, timeoutMs);
+    state.pending.set(id, { resolve, reject, timer, command });
+    state.child.stdin.write(`${JSON.stringify({ id, db_path: dbPath, command, args })}\n`, (err) => {
+      if (!err || !state.pending.has(id)) return;
+      state.pending.delete(id);
+      clearTimeout(timer);
+      if (state.child.pid === undefined) err.kind = 'spawn';
+      reject(err);
+    });
+  });
+}
+
+// ── One-shot holographic bridge (JSON args) ──
+
+function oneShotBridge(dbPath, command, args, timeoutMs, maxBuffer) {
   return new Promise((resolve, reject) => {
     execFile(
       PYTHON,
       [HOLOGRAPHIC_BRIDGE, dbPath, command, JSON.stringify(args)],
-      { timeout: 15_000, maxBuffer: 1024 * 1024 },
+      { timeout: timeoutMs, maxBuffer },
       (err, stdout, stderr) => {
         const bridgeStderr = forwardArbitrateStderr(stderr);
         if (err) {
@@ -105,22 +232,44 @@ function holographicBridge(dbPath, command, args = {}) {
   });
 }
 
+// Safe to replay on the one-shot bridge after the resident one died mid-request.
+const READ_ONLY_BRIDGE_COMMANDS = new Set(['search', 'multi_search', 'probe', 'related', 'reason', 'stats']);
+
+async function callBridge(dbPath, command, args, timeoutMs, maxBuffer) {
+  if (!ORB_MEMORY_RESIDENT_BRIDGE) return oneShotBridge(dbPath, command, args, timeoutMs, maxBuffer);
+  try {
+    return await residentBridge(dbPath, command, args, timeoutMs);
+  } catch (error) {
+    // Command-level errors and timeouts are real answers. A broken transport
+    // falls back to one-shot only when replaying cannot double-apply a write:
+    // the bridge never spawned, or the command is read-only. A crashed or
+    // killed bridge may already have committed an add/update/batch.
+    if (error.kind === 'timeout' || /^holographic \S+ failed: /.test(error.message || '')) throw error;
+    if (error.kind !== 'spawn' && !READ_ONLY_BRIDGE_COMMANDS.has(command)) throw error;
+    logBridgeFallback(`resident.${command}`, dbPath, error);
+    return oneShotBridge(dbPath, command, args, timeoutMs, maxBuffer);
+  }
+}
+
+// Writes may arbitrate (claude -p, up to MEMORY_ARBITRATE_TIMEOUT_SEC per add)
+// inside the request, so they get that on top of the ordinary budget.
+const BRIDGE_TIMEOUT_MS = 15_000;
+const ARBITRATE_TIMEOUT_MS = Math.ceil(MEMORY_ARBITRATE_TIMEOUT_SEC * 1000);
+
+function holographicBridge(dbPath, command, args = {}) {
+  const timeoutMs = READ_ONLY_BRIDGE_COMMANDS.has(command)
+    ? BRIDGE_TIMEOUT_MS
+    : BRIDGE_TIMEOUT_MS + ARBITRATE_TIMEOUT_MS;
+  return callBridge(dbPath, command, args, timeoutMs, 1024 * 1024);
+}
+
 // ── Holographic batch bridge ──
 
 function holographicBatchBridge(dbPath, operations) {
-  return new Promise((resolve, reject) => {
-    execFile(
-      PYTHON,
-      [HOLOGRAPHIC_BRIDGE, dbPath, 'batch', JSON.stringify({ operations })],
-      { timeout: 30_000, maxBuffer: 2 * 1024 * 1024 },
-      (err, stdout, stderr) => {
-        const bridgeStderr = forwardArbitrateStderr(stderr);
-        if (err) return reject(createBridgeError('holographic batch failed', err, bridgeStderr));
-        try { resolve(JSON.parse(stdout.trim())); }
-        catch { reject(new Error('batch: invalid JSON')); }
-      },
-    );
-  });
+  // Batch adds are arbitrated one after another before the single commit.
+  const adds = operations.filter((op) => op.command === 'add').length;
+  const timeoutMs = 2 * BRIDGE_TIMEOUT_MS + adds * ARBITRATE_TIMEOUT_MS;
+  return callBridge(dbPath, 'batch', { operations }, timeoutMs, 2 * 1024 * 1024);
 }
 
 // ── Public API ──
@@ -145,6 +294,51 @@ export async function recallMemory(query, userId, dbPath) {
   }
 }
 
+/**
+ * Recall search operation with the configured limit / trust floor,
+ * for use with recallMemoryBatch().
+ */
+export function memorySearchOperation(query) {
+  return {
+    command: 'search',
+    args: { query, limit: MEMORY_RECALL_LIMIT, min_trust: MEMORY_MIN_TRUST },
+  };
+}
+
+/**
+ * Entity recall operation: facts where `entity` plays a structural role.
+ */
+export function memoryEntityOperation(entity, limit = MEMORY_RECALL_LIMIT) {
+  return { command: 'probe', args: { entity, limit } };
+}
+
+/**
+ * Thread recall operation: the most recent facts tagged with this thread.
+ */
+export function memoryThreadOperation(threadTs, limit = MEMORY_RECALL_LIMIT) {
+  return {
+    command: 'session_search',
+    args: { thread_ts: threadTs, limit, min_trust: MEMORY_MIN_TRUST },
+  };
+}
+
+/**
+ * Run several recall operations (search, session_search, probe, related,
+ * reason) in one bridge round-trip via `multi_search`.
+ * Returns one result array per operation, in order; failures yield [].
+ */
+export async function recallMemoryBatch(operations, dbPath) {
+  const ops = Array.isArray(operations) ? operations : [];
+  if (!MEMORY_ENABLED || !dbPath || ops.length === 0) return ops.map(() => []);
+  try {
+    const results = await holographicBridge(dbPath, 'multi_search', { operations: ops });
+    return ops.map((_, i) => (Array.isArray(results?.[i]) ? results[i] : []));
+  } catch (error) {
+    logBridgeFallback('recallMemoryBatch', dbPath, error);
+    return ops.map(() => []);
+  }
+}
+
 /**
  * Extract structured facts from a conversation turn via Python script.
  */
@@ -36,10 +36,12 @@ export const ORB_LEDGER_HYDRATE = parseBoolEnv(process.env.ORB_LEDGER_HYDRATE, t
 export const ORB_STREAM_TRACE = parseBoolEnv(process.env.ORB_STREAM_TRACE, false);
 export const ORB_MEMORY_RECALL_LIMIT = parseIntEnv(process.env.ORB_MEMORY_RECALL_LIMIT, 10);
 export const ORB_MEMORY_MIN_TRUST = parseFloatEnv(process.env.ORB_MEMORY_MIN_TRUST, 0.3);
+export const ORB_MEMORY_RESIDENT_BRIDGE = parseBoolEnv(process.env.ORB_MEMORY_RESIDENT_BRIDGE, true);
 export const ORB_DOC_RECALL_LIMIT = parseIntEnv(process.env.ORB_DOC_RECALL_LIMIT, 8);
 export const ORB_MCP_PERMISSION_LOG = parseStringEnv(process.env.ORB_MCP_PERMISSION_LOG, null);
 
 export const MEMORY_ENABLED = parseBoolEnv(process.env.MEMORY_ENABLED, true);
+export const MEMORY_ARBITRATE_TIMEOUT_SEC = parseFloatEnv(process.env.MEMORY_ARBITRATE_TIMEOUT_SEC, 15);
 export const DOC_INDEX_ENABLED = parseBoolEnv(process.env.DOC_INDEX_ENABLED, true);
 export const DOC_INDEX_DB = parseStringEnv(process.env.DOC_INDEX_DB, null);
 export const DOC_REGISTRY_PATH = parseStringEnv(process.env.DOC_REGISTRY_PATH, null);
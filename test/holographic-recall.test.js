@@ -0,0 +1,43 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import {
+  extractRecallEntities,
+  mergeRecallResults,
+  recallOperations,
+} from '../src/context-providers/holographic.js';
+
+test('extracts capitalized and double-quoted entities, deduplicated', () => {
+  const text = 'We moved the "cache cluster" for Tokyo Office; tokyo office said it\'s done.';
+  assert.deepEqual(extractRecallEntities(text), ['Tokyo Office', 'cache cluster']);
+  assert.deepEqual(extractRecallEntities(''), []);
+});
+
+test('also tries a sentence-opening phrase without its first word', () => {
+  assert.deepEqual(extractRecallEntities('Did Tokyo Office move?'), ['Did Tokyo Office', 'Tokyo Office']);
+  assert.deepEqual(extractRecallEntities('Ask Mary Smith first'), ['Ask Mary Smith', 'Mary Smith']);
+  assert.deepEqual(extractRecallEntities('Where is New York City'), ['New York City']);
+});
+
+test('caps entity probes per turn', () => {
+  const text = 'Alpha One, Beta Two, Gamma Three and Delta Four';
+  assert.equal(extractRecallEntities(text).length, 3);
+});
+
+test('recall operations cover user text, entities and the thread', () => {
+  const ops = recallOperations({ userText: 'what did Tokyo Office decide?', threadTs: '1700000000.000100' });
+  assert.deepEqual(ops.map((op) => op.command), ['search', 'probe', 'session_search']);
+  assert.equal(ops[1].args.entity, 'Tokyo Office');
+  assert.equal(ops[2].args.thread_ts, '1700000000.000100');
+
+  assert.deepEqual(recallOperations({ threadTs: '1700000000.000100' }).map((op) => op.command), ['session_search']);
+  assert.deepEqual(recallOperations({}), []);
+});
+
+test('merges recall results keeping the first occurrence of each fact', () => {
+  const merged = mergeRecallResults([
+    [{ fact_id: 1, content: 'a' }, { fact_id: 2, content: 'b' }],
+    [{ fact_id: 2, content: 'b' }, { fact_id: 3, content: 'c' }],
+    null,
+  ]);
+  assert.deepEqual(merged.map((m) => m.fact_id), [1, 2, 3]);
+});
@@ -0,0 +1,68 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+BRIDGE_PATH = Path(__file__).resolve().parents[1] / "lib/holographic/bridge.py"
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "HRR vectors need numpy")
+class HolographicBridgeServeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tmp.name) / "memory.db")
+        self.bridge = subprocess.Popen(
+            [sys.executable, str(BRIDGE_PATH), "serve", "--workers", "1"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env={**os.environ, "MEMORY_ARBITRATE": "false"},
+        )
+        self.next_id = 0
+
+    def tearDown(self):
+        self.bridge.stdin.close()
+        self.bridge.wait(timeout=30)
+        self.bridge.stdout.close()
+        self.tmp.cleanup()
+
+    def call(self, command, **args):
+        self.next_id += 1
+        request = {"id": self.next_id, "db_path": self.db_path, "command": command, "args": args}
+        self.bridge.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+        self.bridge.stdin.flush()
+        response = json.loads(self.bridge.stdout.readline())
+        self.assertEqual(response["id"], self.next_id)
+        self.assertNotIn("error", response, response.get("error"))
+        return response["result"]
+
+    def test_search_after_rebuild_vectors_with_new_dim(self):
+        for content in (
+            "Tokyo Office uses a write-through cache for session data",
+            "Tokyo Office moved the cache cluster to the new rack",
+            "Berlin Office prefers Postgres over MySQL",
+        ):
+            self.call("add", content=content, skip_arbitrate=True)
+        self.assertTrue(self.call("search", query="tokyo cache", min_trust=0))
+
+        rebuilt = self.call("rebuild_vectors", dim=256, workers=1, resume=False)
+        self.assertEqual(rebuilt["dim"], 256)
+
+        # Same warm store + retriever: queries must be encoded at the new dim.
+        results = self.call("search", query="tokyo cache", min_trust=0)
+        self.assertTrue(results)
+        self.assertIn("Tokyo Office", results[0]["content"])
+        self.assertIsInstance(self.call("probe", entity="Tokyo Office"), list)
+        self.assertIsInstance(self.call("related", entity="Tokyo Office"), list)
+
+
+if __name__ == "__main__":
+    unittest.main()